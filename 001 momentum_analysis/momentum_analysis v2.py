@@ -34,7 +34,7 @@ def load_dartfish_data(first_half_path, second_half_path):
     
     return combined_data
 
-def preprocess_data(df):
+def preprocess_data(df, interval_minutes=5):
     """
     Preprocess the Dartfish data for momentum analysis.
     
@@ -42,28 +42,38 @@ def preprocess_data(df):
     -----------
     df : pd.DataFrame
         Raw Dartfish data
+    interval_minutes : int
+        Length of the analysis intervals in minutes
         
     Returns:
     --------
     pd.DataFrame
         Preprocessed dataframe
     """
-    # Convert milliseconds to seconds for easier interpretation
-    df['Position_sec'] = df['Position'] / 1000
-    df['Duration_sec'] = df['Duration'] / 1000
+    # Work on integer milliseconds in one pass instead of per-row string formatting
+    position_ms = df['Position'].to_numpy(dtype=np.int64)
+    duration_ms = df['Duration'].to_numpy(dtype=np.int64)
     
-    # Calculate end position
-    df['End_Position_sec'] = df['Position_sec'] + df['Duration_sec']
+    # Poolaeg is "1." text in some exports and 1.0 numbers in others
+    half = df['Poolaeg']
+    if not pd.api.types.is_numeric_dtype(half):
+        half = pd.to_numeric(half.astype(str).str.rstrip('.'))
+    half = half.to_numpy().astype(np.int64)
     
-    # Convert Poolaeg (half) to numeric if it contains period notation (e.g. "1.")
-    df['Half'] = df['Poolaeg'].str.replace('.', '').astype(int)
+    # Create absolute match time - adding 45 minutes (2 700 000 ms) for second half
+    match_time_ms = position_ms + np.where(half == 2, 2700000, 0)
     
-    # Create absolute match time - adding 45 minutes (2700 seconds) for second half
-    df['Match_Time_sec'] = df['Position_sec']
-    df.loc[df['Half'] == 2, 'Match_Time_sec'] += 2700  # Add 45 minutes for second half
+    # Intervals with one shared label string per interval (0-5, 5-10, etc. for 5 minutes)
+    interval = match_time_ms // (interval_minutes * 60000)
+    labels = [f"{i*interval_minutes}-{(i+1)*interval_minutes}" for i in range(int(interval.max()) + 1 if len(interval) else 0)]
     
-    # Create 5-minute interval labels (0-5, 5-10, etc.)
-    df['Interval'] = (df['Match_Time_sec'] // 300).astype(int)
-    df['Interval_Label'] = df['Interval'].apply(lambda x: f"{x*5}-{(x+1)*5}")
-    
-    return df
\ No newline at end of file
+    # Return a new frame so the caller's data can be cached and reused safely
+    return df.assign(
+        Position_sec=position_ms / 1000,
+        Duration_sec=duration_ms / 1000,
+        End_Position_sec=(position_ms + duration_ms) / 1000,
+        Half=half,
+        Match_Time_sec=match_time_ms / 1000,
+        Interval=interval,
+        Interval_Label=pd.Categorical.from_codes(interval, categories=labels, ordered=True),
+    )
\ No newline at end of file
@@ -1,3 +1,12 @@
+import os
+import sys
+
+# Core modules are imported from the sibling "Core Architecture" folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Core Architecture'))
+
+from momentum_bootstrap import resample_momentum  # noqa: E402
+
+
 def calculate_event_momentum_score(row):
     """
     Calculate momentum score for a single event based on the presented scoring system.
@@ -178,6 +187,50 @@ def calculate_event_momentum_score(row):
     
     return score
 
+# Lookup tables for the scoring system above (same points and precedence)
+SHOT_POINTS = {'SHOTGOAL': 20, 'SHOTON': 18, 'SHOTOFF': 10, 'SHOTBLOCK': 6}
+RESULT_POINTS = {'ENTRY': 17, 'WINPENALTY': 14, 'WINSTANDARD': 6}
+PRESSING_POINTS = {'HIGHPRESS': 3, 'MIDPRESS': 2, 'LOWPRESS': 1}
+
+def calculate_momentum_scores(df):
+    """
+    Calculate momentum scores for all events at once with table lookups.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Preprocessed Dartfish dataframe
+        
+    Returns:
+    --------
+    np.ndarray
+        Momentum score for each event, in row order
+    """
+    team = df['Põhimoment'].astype(object)
+    outcome = df['Outcome'].astype(object)
+    result = df['Result'].astype(object)
+    
+    # Identify Estonian team (AA/DA) vs opponent (DD/AD)
+    sign = np.where(team.isin(['AA', 'DA']), 1, -1)
+    
+    # Best shot over Result, Shot2 and Shot3, otherwise entry/penalty/set-piece points of Result
+    shot_points = np.zeros(len(df))
+    for col in [c for c in ['Result', 'Shot2', 'Shot3'] if c in df.columns]:
+        shot_points = np.maximum(shot_points, df[col].astype(object).map(SHOT_POINTS).fillna(0).to_numpy())
+    result_points = result.map(RESULT_POINTS).fillna(0).to_numpy()
+    score = sign * np.where(shot_points > 0, shot_points, result_points)
+    
+    # Pressing values based on zone: DD presses won, AA presses lost
+    pressing_points = df['Pressing'].astype(object).map(PRESSING_POINTS).fillna(0).to_numpy()
+    score += np.where((team == 'DD') & (outcome == 'POS') & result.isin(['-', 'KEEPPOS']), pressing_points, 0)
+    score -= np.where((team == 'AA') & (outcome == 'NEG') & (result == '-'), pressing_points, 0)
+    
+    # Transition possession gains/losses
+    score += ((team == 'AD') & (outcome == 'POS') & result.isin(['-', 'KEEPPOS'])).to_numpy()
+    score -= (team.isin(['AD', 'DA']) & (outcome == 'NEG') & (result == '-')).to_numpy()
+    
+    return score
+
 def calculate_momentum_by_interval(df):
     """
     Calculate aggregate momentum scores for each 5-minute interval.
@@ -193,16 +246,58 @@ def calculate_momentum_by_interval(df):
         Dataframe with momentum scores by interval
     """
     # Calculate momentum score for each event
-    df['Momentum_Score'] = df.apply(calculate_event_momentum_score, axis=1)
+    df['Momentum_Score'] = calculate_momentum_scores(df)
     
     # Group by interval and sum the momentum scores
-    momentum_by_interval = df.groupby(['Interval', 'Interval_Label'])['Momentum_Score'].sum().reset_index()
+    momentum_by_interval = df.groupby(['Interval', 'Interval_Label'], observed=True)['Momentum_Score'].sum().reset_index()
     
     # Calculate cumulative momentum
     momentum_by_interval['Cumulative_Momentum'] = momentum_by_interval['Momentum_Score'].cumsum()
     
     return momentum_by_interval
 
+def add_momentum_confidence(momentum_by_interval, df, n_resamples=2000, confidence=0.9, seed=None):
+    """
+    Add bootstrap confidence bands to interval and cumulative momentum.
+    
+    Resampling the match events with replacement is done by the core
+    momentum_bootstrap.resample_momentum for all resamples at once.
+    
+    Parameters:
+    -----------
+    momentum_by_interval : pd.DataFrame
+        Output of calculate_momentum_by_interval
+    df : pd.DataFrame
+        Preprocessed Dartfish data with Momentum_Score
+    n_resamples : int
+        Number of bootstrap resamples
+    confidence : float
+        Share of resamples inside the band (0.9 for a 90% band)
+    seed : int, optional
+        Random seed for reproducible bands
+        
+    Returns:
+    --------
+    pd.DataFrame
+        Copy of momentum_by_interval with Momentum_Lower/Upper and Cumulative_Lower/Upper
+    """
+    if n_resamples < 1:
+        raise ValueError(f"n_resamples must be at least 1, got {n_resamples}")
+    
+    # One column per row of momentum_by_interval
+    intervals = momentum_by_interval['Interval'].to_numpy()
+    columns = pd.Index(intervals).get_indexer(df['Interval'].to_numpy())
+    resampled = resample_momentum(df['Momentum_Score'].to_numpy(dtype=float), columns, len(intervals),
+                                  n_resamples, seed)
+    
+    tail = (1 - confidence) / 2
+    result = momentum_by_interval.copy()
+    result['Momentum_Lower'], result['Momentum_Upper'] = np.quantile(resampled, [tail, 1 - tail], axis=0)
+    result['Cumulative_Lower'], result['Cumulative_Upper'] = np.quantile(
+        np.cumsum(resampled, axis=1), [tail, 1 - tail], axis=0
+    )
+    return result
+
 def analyze_team_stats(df):
     """
     Calculate team-specific statistics for Estonia and opponent.
@@ -5,7 +5,7 @@ def plot_momentum_chart(momentum_df, team_stats):
     Parameters:
     -----------
     momentum_df : pd.DataFrame
-        Dataframe with momentum data by interval
+        Dataframe with momentum data by interval, optionally with confidence bands
     team_stats : dict
         Dictionary with team statistics
         
@@ -37,6 +37,28 @@ def plot_momentum_chart(momentum_df, team_stats):
         color=momentum_df['Momentum_Score'].apply(lambda x: 'green' if x > 0 else 'red')
     )
     
+    # Bootstrap confidence bands (from add_momentum_confidence) so few-event intervals are not read as certain
+    if 'Momentum_Lower' in momentum_df.columns:
+        ax1.fill_between(
+            momentum_df.index,
+            momentum_df['Cumulative_Lower'],
+            momentum_df['Cumulative_Upper'],
+            color='blue',
+            alpha=0.15
+        )
+        ax2.errorbar(
+            momentum_df.index,
+            momentum_df['Momentum_Score'],
+            yerr=[
+                (momentum_df['Momentum_Score'] - momentum_df['Momentum_Lower']).clip(lower=0),
+                (momentum_df['Momentum_Upper'] - momentum_df['Momentum_Score']).clip(lower=0)
+            ],
+            fmt='none',
+            ecolor='black',
+            capsize=3,
+            alpha=0.6
+        )
+    
     # Customize the plots
     ax1.set_title('Match Momentum Analysis: Estonia vs Georgia (U17)', fontsize=16)
     ax1.set_ylabel('Cumulative Momentum', fontsize=12)
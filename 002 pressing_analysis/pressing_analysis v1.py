@@ -23,11 +23,9 @@ def classify_pressing_zones(df):
     pd.DataFrame
         DataFrame with classified pressing zones
     """
-    # Create a copy to avoid modifying the original
-    pressing_df = df.copy()
-    
     # Extract pressing events (where Pressing column is not empty)
-    pressing_events = pressing_df[pressing_df['Pressing'].notna()].copy()
+    # Only the selected rows are copied, the preprocessed match is shared between analyses
+    pressing_events = df[df['Pressing'].notna()].copy()
     
     # Map pressing types to zones (based on your zoning system)
     zone_mapping = {
@@ -81,37 +79,40 @@ def calculate_pressing_metrics(pressing_events):
     metrics['successful_presses'] = successful_presses
     metrics['success_rate'] = round((successful_presses / total_presses) * 100, 1) if total_presses > 0 else 0
     
-    # Pressing by zone
-    zone_metrics = pressing_events.groupby('Pressing').agg(
-        total=('Pressing_Success', 'count'),
-        successful=('Pressing_Success', 'sum')
-    )
-    zone_metrics['success_rate'] = (zone_metrics['successful'] / zone_metrics['total'] * 100).round(1)
-    metrics['zone_metrics'] = zone_metrics
-    
-    # Pressing by team
-    team_metrics = pressing_events.groupby('Pressing_Team').agg(
-        total=('Pressing_Success', 'count'),
-        successful=('Pressing_Success', 'sum')
-    )
-    team_metrics['success_rate'] = (team_metrics['successful'] / team_metrics['total'] * 100).round(1)
-    metrics['team_metrics'] = team_metrics
-    
-    # Pressing by half
-    half_metrics = pressing_events.groupby('Poolaeg').agg(
-        total=('Pressing_Success', 'count'),
-        successful=('Pressing_Success', 'sum')
-    )
-    half_metrics['success_rate'] = (half_metrics['successful'] / half_metrics['total'] * 100).round(1)
-    metrics['half_metrics'] = half_metrics
-    
-    # Pressing by zone and team
-    zone_team_metrics = pressing_events.groupby(['Pressing_Team', 'Pressing']).agg(
-        total=('Pressing_Success', 'count'),
-        successful=('Pressing_Success', 'sum')
-    )
-    zone_team_metrics['success_rate'] = (zone_team_metrics['successful'] / zone_team_metrics['total'] * 100).round(1)
-    metrics['zone_team_metrics'] = zone_team_metrics
+    # Count presses and successes once per (team, zone, half) cell - every table below
+    # is a sum over axes of this small cube instead of another pass over the events
+    labels, codes = [], []
+    for col in ['Pressing_Team', 'Pressing', 'Poolaeg']:
+        col_codes, col_labels = pd.factorize(pressing_events[col], sort=True)
+        # Missing keys go to an extra slot that no table lists, as groupby drops them
+        codes.append(np.where(col_codes < 0, len(col_labels), col_codes))
+        labels.append(col_labels)
+    shape = tuple(len(col_labels) + 1 for col_labels in labels)
+    cells = np.ravel_multi_index(codes, shape) if len(pressing_events) else np.zeros(0, dtype=int)
+    success = pressing_events['Pressing_Success'].to_numpy(dtype=bool)
+    cube = np.stack([
+        np.bincount(cells, minlength=np.prod(shape)),
+        np.bincount(cells, weights=success, minlength=np.prod(shape)).astype(int)
+    ]).reshape((2,) + shape)
+    
+    def cube_table(axes):
+        """Sum the cube down to the given axes (0 team, 1 zone, 2 half) as a total/successful table."""
+        summed = cube.sum(axis=tuple(i + 1 for i in range(3) if i not in axes))
+        summed = summed[(slice(None),) + tuple(slice(0, len(labels[i])) for i in axes)]
+        names = ['Pressing_Team', 'Pressing', 'Poolaeg']
+        if len(axes) > 1:
+            index = pd.MultiIndex.from_product([labels[i] for i in axes], names=[names[i] for i in axes])
+        else:
+            index = pd.Index(labels[axes[0]], name=names[axes[0]])
+        table = pd.DataFrame({'total': summed[0].ravel(), 'successful': summed[1].ravel()}, index=index)
+        table = table[table['total'] > 0].copy()
+        table['success_rate'] = (table['successful'] / table['total'] * 100).round(1)
+        return table
+    
+    metrics['zone_metrics'] = cube_table([1])
+    metrics['team_metrics'] = cube_table([0])
+    metrics['half_metrics'] = cube_table([2])
+    metrics['zone_team_metrics'] = cube_table([0, 1])
     
     # Calculate PPDA (Passes Per Defensive Action) - if we have pass data
     if 'KEEPPOS' in pressing_events['Result'].values:
@@ -12,11 +12,9 @@ def identify_transitions(df):
     pd.DataFrame
         DataFrame with identified transition moments
     """
-    # Create a copy to avoid modifying the original
-    transition_df = df.copy()
-    
     # Identify explicit transitions (AD, DA)
-    explicit_transitions = transition_df[transition_df['Põhimoment'].isin(['AD', 'DA'])].copy()
+    # Only the selected rows are copied, the preprocessed match is shared between analyses
+    explicit_transitions = df[df['Põhimoment'].isin(['AD', 'DA'])].copy()
     
     # Mark transition types
     explicit_transitions['Transition_Type'] = explicit_transitions['Põhimoment'].map({
@@ -89,10 +87,10 @@ def calculate_transition_metrics(transitions_df):
     # Transitions by ending zone
     metrics['transitions_by_ending_zone'] = transitions_df['Transition_Ending_Zone'].value_counts().to_dict()
     
-    # Transitions by half
-    half_transitions = transitions_df.groupby('Poolaeg').size()
-    metrics['transitions_first_half'] = half_transitions.get(1, 0)
-    metrics['transitions_second_half'] = half_transitions.get(2, 0)
+    # Transitions by half - Poolaeg is 1/2 or the "1."/"2." text form, in any row order
+    halves = pd.to_numeric(transitions_df['Poolaeg'].astype(str).str.rstrip('.'), errors='coerce')
+    half_counts = np.bincount(halves.dropna().astype(int), minlength=3)
+    metrics['transitions_first_half'], metrics['transitions_second_half'] = half_counts[1:3].tolist()
     
     # Transition effectiveness by type
     effectiveness = transitions_df.groupby('Transition_Type').agg(
@@ -25,8 +25,8 @@ def identify_set_pieces(df):
     pd.DataFrame
         DataFrame with identified set pieces
     """
-    # Create a copy to avoid modifying the original
-    setpiece_df = df.copy()
+    # The preprocessed match is shared between analyses, only the selected set pieces are copied
+    setpiece_df = df
     
     # Set piece types to look for in the data
     set_piece_patterns = [
@@ -168,10 +168,10 @@ def calculate_set_piece_metrics(set_pieces):
     # Goals from set pieces
     metrics['goals_from_set_pieces'] = set_pieces[set_pieces['Outcome_Category'] == 'Goal'].shape[0]
     
-    # Set pieces by half
-    half_set_pieces = set_pieces.groupby('Half').size()
-    metrics['set_pieces_first_half'] = half_set_pieces.get(1, 0)
-    metrics['set_pieces_second_half'] = half_set_pieces.get(2, 0)
+    # Set pieces by half - Half is 1/2 or the "1."/"2." text form, in any row order
+    halves = pd.to_numeric(set_pieces['Half'].astype(str).str.rstrip('.'), errors='coerce')
+    half_counts = np.bincount(halves.dropna().astype(int), minlength=3)
+    metrics['set_pieces_first_half'], metrics['set_pieces_second_half'] = half_counts[1:3].tolist()
     
     # Set pieces by interval
     metrics['set_pieces_by_interval'] = set_pieces.groupby('Interval_Label').size().to_dict()
@@ -1,3 +1,12 @@
+import os
+import sys
+
+# Core modules are imported from the sibling "Core Architecture" folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Core Architecture'))
+
+from sequences import sequence_ids  # noqa: E402
+
+
 def analyze_progressions(df):
     """
     Analyze progressions between S1, S2, and S3 zones.
@@ -12,8 +21,8 @@ def analyze_progressions(df):
     tuple
         DataFrame with progression events, DataFrame with progression sequences
     """
-    # Create a copy to avoid modifying the original
-    progression_df = df.copy()
+    # The preprocessed match is shared between analyses, only the selected progressions are copied
+    progression_df = df
     
     # Filter rows that contain zone information (S1, S2, S3)
     zone_mask = (
@@ -85,93 +94,65 @@ def analyze_progressions(df):
     
     zone_progressions['Sequence_Type'] = zone_progressions.apply(identify_sequence_type, axis=1)
     
-    # Group progressions into sequences based on time proximity
-    # This is a simplification - in real implementation, you'd need more sophisticated sequence detection
-    sequences = []
-    current_sequence = []
-    prev_end_time = None
-    time_threshold = 10  # seconds
-    
-    for idx, row in zone_progressions.sort_values('Match_Time_sec').iterrows():
-        if prev_end_time is None or (row['Match_Time_sec'] - prev_end_time) > time_threshold:
-            # New sequence
-            if current_sequence:
-                sequences.append(current_sequence)
-            current_sequence = [idx]
-        else:
-            # Continue existing sequence
-            current_sequence.append(idx)
-        
-        prev_end_time = row['Match_Time_sec']
-    
-    # Add the last sequence
-    if current_sequence:
-        sequences.append(current_sequence)
-    
-    # Create a DataFrame for sequences
-    sequence_data = []
+    # Sequences and possessions follow the shared core definition (new team in possession,
+    # new half or more than 10 seconds without play), computed once over the whole match
+    end_time = df['Match_Time_sec'] + df['Duration'] / 1000 if 'Duration' in df.columns else None
+    halves = df['Half'] if 'Half' in df.columns else None
+    sequence_id, possession_id = sequence_ids(df['Match_Time_sec'], df['Põhimoment'], halves, end_time_sec=end_time)
+    zone_progressions['Sequence_ID'] = sequence_id[zone_mask.to_numpy()]
+    zone_progressions['Possession_ID'] = possession_id[zone_mask.to_numpy()]
+    match_time = zone_progressions['Match_Time_sec'].sort_values(kind='stable')
+    
+    # Zones involved in each event, reduced to the zones of each sequence below
+    zone_cols = ['Tsoon1', 'Tsoon2', 'Tsoon3']
+    for zone in ['S1', 'S2', 'S3']:
+        zone_progressions[f'Has_{zone}'] = zone_progressions[zone_cols].eq(zone).any(axis=1)
+    
+    # Create the sequence table with groupby reductions (events in match time order)
+    ordered = zone_progressions.loc[match_time.index]
+    ordered = ordered.assign(Is_Goal=ordered['Progression_Outcome'] == 'Goal')
+    sequences_df = ordered.groupby('Sequence_ID').agg(
+        Team=('Team', 'first'),
+        Teams=('Team', 'nunique'),
+        Start_Time_Sec=('Match_Time_sec', 'min'),
+        End_Time_Sec=('Match_Time_sec', 'max'),
+        Final_Outcome=('Progression_Outcome', 'last'),
+        Resulted_In_Shot=('Resulted_In_Shot', 'any'),
+        Resulted_In_Goal=('Is_Goal', 'any'),
+        Number_of_Events=('Match_Time_sec', 'size'),
+        Half=('Half', 'first'),
+        has_s1=('Has_S1', 'any'),
+        has_s2=('Has_S2', 'any'),
+        has_s3=('Has_S3', 'any'),
+    ).reset_index()
+    zone_progressions = zone_progressions.drop(columns=['Has_S1', 'Has_S2', 'Has_S3'])
+    
+    # Determine the team
+    sequences_df.loc[sequences_df['Teams'] > 1, 'Team'] = 'Mixed'
+    
+    # Extract the duration of the sequence
+    sequences_df['Start_Time_Min'] = (sequences_df['Start_Time_Sec'] / 60).round(1)
+    sequences_df['Duration_Sec'] = sequences_df['End_Time_Sec'] - sequences_df['Start_Time_Sec']
+    
+    # Get the zones involved, sorted
+    has_s1, has_s2, has_s3 = sequences_df['has_s1'], sequences_df['has_s2'], sequences_df['has_s3']
+    zones = pd.Series('', index=sequences_df.index)
+    for zone, has_zone in [('S1', has_s1), ('S2', has_s2), ('S3', has_s3)]:
+        zones = zones + np.where(has_zone, f'{zone} to ', '')
+    sequences_df['Zones'] = zones.str[:-len(' to ')]
+    
+    # Check sequence completeness
+    sequences_df['Sequence_Type'] = np.select(
+        [has_s1 & has_s2 & has_s3, has_s1 & has_s3, has_s1 & has_s2, has_s2 & has_s3],
+        ['Full (S1->S2->S3)', 'Skip (S1->S3)', 'Partial (S1->S2)', 'Partial (S2->S3)'],
+        default='Incomplete'
+    )
     
-    for seq_idx, seq in enumerate(sequences, 1):
-        seq_rows = zone_progressions.loc[seq]
-        
-        # Extract the start and end times of the sequence
-        start_time = seq_rows['Match_Time_sec'].min()
-        end_time = seq_rows['Match_Time_sec'].max()
-        duration = end_time - start_time
-        
-        # Determine the team
-        team = seq_rows['Team'].iloc[0] if seq_rows['Team'].nunique() == 1 else 'Mixed'
-        
-        # Get the zones involved
-        zones = []
-        for _, seq_row in seq_rows.iterrows():
-            for zone_col in ['Tsoon1', 'Tsoon2', 'Tsoon3']:
-                if pd.notna(seq_row[zone_col]) and seq_row[zone_col] in ['S1', 'S2', 'S3'] and seq_row[zone_col] not in zones:
-                    zones.append(seq_row[zone_col])
-        
-        # Sort zones
-        zones.sort(key=lambda x: int(x[1]))
-        zones_str = ' to '.join(zones)
-        
-        # Check outcomes
-        final_outcome = seq_rows.iloc[-1]['Progression_Outcome']
-        resulted_in_shot = seq_rows['Resulted_In_Shot'].any()
-        resulted_in_goal = 'Goal' in seq_rows['Progression_Outcome'].values
-        
-        # Check sequence completeness
-        has_s1 = 'S1' in ''.join(zones)
-        has_s2 = 'S2' in ''.join(zones)
-        has_s3 = 'S3' in ''.join(zones)
-        
-        if has_s1 and has_s2 and has_s3:
-            sequence_type = 'Full (S1->S2->S3)'
-        elif has_s1 and has_s3:
-            sequence_type = 'Skip (S1->S3)'
-        elif has_s1 and has_s2:
-            sequence_type = 'Partial (S1->S2)'
-        elif has_s2 and has_s3:
-            sequence_type = 'Partial (S2->S3)'
-        else:
-            sequence_type = 'Incomplete'
-        
-        # Add to sequence data
-        sequence_data.append({
-            'Sequence_ID': seq_idx,
-            'Team': team,
-            'Start_Time_Sec': start_time,
-            'Start_Time_Min': round(start_time / 60, 1),
-            'Duration_Sec': duration,
-            'Zones': zones_str,
-            'Sequence_Type': sequence_type,
-            'Final_Outcome': final_outcome,
-            'Resulted_In_Shot': resulted_in_shot,
-            'Resulted_In_Goal': resulted_in_goal,
-            'Number_of_Events': len(seq),
-            'Half': seq_rows['Half'].iloc[0]
-        })
-    
-    # Create DataFrame from sequence data
-    sequences_df = pd.DataFrame(sequence_data)
+    sequences_df = sequences_df[[
+        'Sequence_ID', 'Team', 'Start_Time_Sec', 'Start_Time_Min', 'Duration_Sec', 'Zones',
+        'Sequence_Type', 'Final_Outcome', 'Resulted_In_Shot', 'Resulted_In_Goal',
+        'Number_of_Events', 'Half'
+    ]]
     
     return zone_progressions, sequences_df
 
@@ -1,20 +1,50 @@
 # batch_processor.py
+import os
+
+from match_discovery import MatchDiscovery
+
+
 class BatchProcessor:
     """Processes multiple matches in batch."""
     
-    def process_matches(self, match_paths_list):
+    def __init__(self, pipeline, discovery=None, cube=None):
+        """Initialize with the analysis pipeline, optional match discovery and momentum cube."""
+        self.pipeline = pipeline
+        self.discovery = discovery or MatchDiscovery()
+        self.cube = cube
+        
+    def process_matches(self, match_paths_list, tournament=None):
         """Process a batch of matches with shared configuration."""
         results = {}
         for match_id, paths in match_paths_list.items():
             results[match_id] = self.pipeline.process_match(
                 paths['first_half'], 
                 paths['second_half'],
-                cache_key=f"match:{match_id}"
+                cache_key=self._cache_key(match_id)
             )
+            # Keep every processed match in the tournament momentum cube
+            if self.cube is not None and 'model_momentum' in results[match_id]:
+                self.cube.add_match(match_id, results[match_id]['model_momentum'],
+                                    self.pipeline.model_stack.names, tournament)
         return results
     
     def process_tournament(self, tournament_path):
         """Process an entire tournament folder structure."""
-        # Automatically discover match files within tournament structure
+        # Automatically discover new or changed match files within tournament structure
         match_paths = self._discover_matches(tournament_path)
-        return self.process_matches(match_paths)
\ No newline at end of file
+        results = self.process_matches(match_paths, os.path.basename(os.path.normpath(tournament_path)))
+        
+        # Only record matches that made it through the pipeline
+        self.discovery.mark_processed(tournament_path, results.keys())
+        return results
+        
+    def _discover_matches(self, tournament_path):
+        """Find matches in a tournament folder that are new or changed since the last run."""
+        return self.discovery.changed_matches(tournament_path)
+        
+    def _cache_key(self, match_id):
+        """Cache key of a match, including its content hash so changed files are never served stale."""
+        content_hash = self.discovery.content_hash(match_id)
+        if content_hash is None:
+            return f"match:{match_id}"
+        return f"match:{match_id}:{content_hash}"
\ No newline at end of file
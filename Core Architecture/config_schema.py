@@ -41,6 +41,9 @@ class TaxonomiesConfig(BaseModel):
     """Configuration for all taxonomies."""
     possession: Dict[str, TranslationEntry]
     outcomes: Dict[str, TranslationEntry]
+    results: Dict[str, TranslationEntry] = {}
+    pressing: Dict[str, TranslationEntry] = {}
+    zones: Dict[str, TranslationEntry] = {}
     # Add other taxonomies as needed
 
 class DisplayConfig(BaseModel):
@@ -1,12 +1,106 @@
 # data_loader.py
+import logging
+
+import pandas as pd
+
+from errors import DataValidationError
+from event_schema import EventSchema
+from match_data import MatchData
+from match_store import MatchStore
+from tag_index import TagIndex
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_COLUMNS = ['Name', 'Position', 'Duration', 'Poolaeg', 'Põhimoment', 'Outcome', 'Result']
+
+# Columns needed for ProgressiveProcessor's quick summary
+QUICK_SUMMARY_COLUMNS = ['Position', 'Duration', 'Poolaeg', 'Põhimoment', 'Outcome', 'Result']
+
+
 class DartfishLoader:
     """Handles loading and parsing Dartfish CSV files with proper encoding handling."""
-    
-    def load_file(self, filepath):
+
+    def __init__(self, store_settings=None, schema=None):
+        """Initialize with optional columnar match store settings and event schema."""
+        self.store = MatchStore(store_settings)
+        self.schema = schema or EventSchema()
+
+    def load_file(self, filepath, columns=None):
         """Load a single CSV file with proper BOM character handling."""
+        usecols = (lambda col: col in columns) if columns is not None else None
+        try:
+            return pd.read_csv(filepath, sep=';', encoding='utf-8-sig', usecols=usecols)
+        except FileNotFoundError as e:
+            logger.error(f"File not found: {e}")
+            raise
+        except pd.errors.ParserError as e:
+            raise DataValidationError(f"Error parsing CSV file {filepath}: {e}") from e
+
+    def load_match(self, first_half_path, second_half_path, columns=None):
+        """Load both halves of a match as one frame, optionally only the given columns."""
+        return self.load_periods([first_half_path, second_half_path], columns).events
         
-    def load_match(self, first_half_path, second_half_path):
-        """Load both halves of a match and combine them."""
+    def load_periods(self, period_paths, columns=None):
+        """Load any number of period files (halves, extra time) as a MatchData of period blocks.
+
+        Parsed files stay separate blocks; the combined frame is only built when the store
+        needs it or a caller asks for MatchData.events. The store keeps the raw parse, so the
+        event schema is applied on every load and schema changes never strand stored codes.
+        """
+        key = self.store.content_key(*period_paths) if self.store.enabled else None
+        if key and self.store.has(key):
+            # Feather column projection - unrequested columns are never read from disk
+            stored_columns = None if columns is None else self._stored_columns(key, columns)
+            return MatchData.from_events(self.validate_data(self.store.read(key, columns=stored_columns), columns))
+
+        # The store always keeps every column, so only project when it is not written
+        parse_columns = columns if not key else None
+        blocks = [self.check_columns(self.load_file(path, parse_columns), parse_columns) for path in period_paths]
+
+        if key:
+            self.store.write(key, MatchData.from_blocks(blocks).events)
+            if columns is not None:
+                blocks = [block[[col for col in block.columns if col in columns]] for block in blocks]
+        return MatchData.from_blocks([self.schema.apply(block) for block in blocks])
         
-    def validate_data(self, data):
-        """Validate loaded data structure and required columns."""	
\ No newline at end of file
+    def load_match_data(self, first_half_path, second_half_path, columns=None):
+        """Load a match as a MatchData container with per-period blocks and offsets."""
+        return self.load_periods([first_half_path, second_half_path], columns)
+
+    def load_match_quick(self, first_half_path, second_half_path):
+        """Load only the columns needed for a quick match summary."""
+        return self.load_match(first_half_path, second_half_path, columns=QUICK_SUMMARY_COLUMNS)
+
+    def load_tag_index(self, first_half_path, second_half_path, data=None):
+        """Load the Name token index of a match, building and storing it on first use."""
+        key = self.store.content_key(first_half_path, second_half_path) if self.store.enabled else None
+        arrays = self.store.read_arrays(key, 'tags') if key else None
+        if arrays is not None:
+            return TagIndex.from_arrays(arrays)
+
+        if data is None:
+            data = self.load_match(first_half_path, second_half_path)
+        tag_index = TagIndex.build(data['Name'])
+        if key:
+            self.store.write_arrays(key, 'tags', tag_index.to_arrays())
+        return tag_index
+
+    def validate_data(self, data, columns=None):
+        """Validate loaded data structure and required columns."""
+        # Taxonomy columns become fixed-code categoricals so analyzers compare small ints
+        return self.schema.apply(self.check_columns(data, columns))
+
+    def check_columns(self, data, columns=None):
+        """Check required columns and millisecond timing of raw parsed data."""
+        required = REQUIRED_COLUMNS if columns is None else [col for col in REQUIRED_COLUMNS if col in columns]
+        missing = [col for col in required if col not in data.columns]
+        if missing:
+            raise DataValidationError(f"Missing required columns: {', '.join(missing)}")
+        for col in ['Position', 'Duration']:
+            if col in data.columns and not pd.api.types.is_integer_dtype(data[col]):
+                raise DataValidationError("Position and Duration must be integer milliseconds")
+        return data
+
+    def _stored_columns(self, key, columns):
+        """Intersect requested columns with the columns present in a stored match."""
+        return [col for col in self.store.columns(key) if col in columns]
\ No newline at end of file
@@ -1,4 +1,11 @@
 # partitioner.py
+import concurrent.futures
+
+import numpy as np
+
+from time_index import TimeIndex
+
+
 class DataPartitioner:
     """Partitions data for parallel processing."""
     
@@ -7,20 +14,15 @@ class DataPartitioner:
         max_time = events_df['Position'].max() + events_df['Duration'].max()
         partition_size = max_time / num_partitions
         
-        partitions = []
-        for i in range(num_partitions):
-            start_time = i * partition_size
-            end_time = (i + 1) * partition_size
-            
-            # Get events that fall within this partition
-            mask = ((events_df['Position'] >= start_time) & 
-                   (events_df['Position'] < end_time)) | \
-                   ((events_df['Position'] < start_time) & 
-                   (events_df['Position'] + events_df['Duration'] > start_time))
-            
-            partitions.append(events_df[mask].copy())
+        # Events that start within a partition or run across its start, from one index lookup
+        index = TimeIndex.from_events(events_df)
+        partition_ids, row_ids = index.window_rows(np.arange(num_partitions + 1) * partition_size)
+        bounds = np.searchsorted(partition_ids, np.arange(num_partitions + 1))
         
-        return partitions
+        return [
+            events_df.iloc[row_ids[bounds[i]:bounds[i + 1]]].copy()
+            for i in range(num_partitions)
+        ]
         
     def process_in_parallel(self, events_df, analyzer_func, num_workers=4):
         """Process data partitions in parallel."""
@@ -0,0 +1,109 @@
+# decayed_momentum.py
+import numpy as np
+import pandas as pd
+
+from errors import AnalysisError
+from interval_rollup import team_points
+
+DECAY_TEAMS = ['Estonia', 'Opponent']
+
+# Largest decay exponent kept inside one anchored block (exp(600) is about 1e260)
+MAX_BLOCK_EXPONENT = 600.0
+
+
+class DecayedMomentum:
+    """Momentum that decays exponentially over continuous match time, updated event by event.
+
+    Each side's level follows m(t_k) = m(t_{k-1}) * exp(-rate * (t_k - t_{k-1})) + points_k,
+    so the same object serves a finished match (one update with all events) and live
+    tagging (an update per new batch) without recomputing anything already seen.
+    """
+
+    def __init__(self, factor=0.2, window_seconds=600):
+        """Initialize so that after window_seconds a contribution is scaled by factor."""
+        if not 0 < factor < 1 or window_seconds <= 0:
+            raise AnalysisError(f"Decay factor must be in (0, 1) over a positive window, got {factor} over {window_seconds}s")
+        self.factor = factor
+        self.window_seconds = window_seconds
+        self.rate = np.log(1 / factor) / window_seconds
+        self.time = None
+        self.level = np.zeros(len(DECAY_TEAMS))
+        self._times = []
+        self._levels = []
+
+    @classmethod
+    def from_settings(cls, settings, interval_minutes=5):
+        """Build from momentum settings: decay.factor and decay.window (in intervals) or default_decay."""
+        decay = settings.get('decay', {})
+        factor = decay.get('factor', settings.get('default_decay', 0.2))
+        return cls(factor, decay.get('window', 2) * interval_minutes * 60)
+
+    def update(self, times, points, teams):
+        """Add events (match seconds, points, side 0/1) not earlier than the last one seen.
+
+        Returns the levels (events x teams) right after each new event.
+        """
+        times = np.asarray(times, dtype=float)
+        points = np.asarray(points, dtype=float)
+        teams = np.asarray(teams, dtype=np.int64)
+        order = np.argsort(times, kind='stable')
+        times, points, teams = times[order], points[order], teams[order]
+        if not len(times):
+            return np.empty((0, len(DECAY_TEAMS)))
+        if self.time is not None and times[0] < self.time:
+            raise AnalysisError(f"Event at {times[0]:.1f}s is earlier than the last processed one at {self.time:.1f}s")
+
+        # Untagged sides add nothing but still advance the clock
+        impulses = np.zeros((len(times), len(DECAY_TEAMS)))
+        tagged = (teams >= 0) & (teams < len(DECAY_TEAMS))
+        impulses[np.flatnonzero(tagged), teams[tagged]] = points[tagged]
+
+        levels = np.empty_like(impulses)
+        anchor = times[0] if self.time is None else self.time
+        carry = self.level
+        start = 0
+        while start < len(times):
+            # Closed form over a block anchored at its first event:
+            # m_k = exp(-r t_k) * (m_0 + cumsum(p_j exp(r t_j))), with times relative to the anchor
+            carry = carry * np.exp(-self.rate * (times[start] - anchor))
+            anchor = times[start]
+            stop = np.searchsorted(times, anchor + MAX_BLOCK_EXPONENT / self.rate, side='right')
+            growth = np.exp(self.rate * (times[start:stop] - anchor))[:, None]
+            levels[start:stop] = (carry + np.cumsum(impulses[start:stop] * growth, axis=0)) / growth
+            anchor, carry, start = times[stop - 1], levels[stop - 1], stop
+
+        self.time, self.level = times[-1], levels[-1].copy()
+        self._times.append(times)
+        self._levels.append(levels)
+        return levels[np.argsort(order, kind='stable')]
+
+    def update_events(self, events, scoring_model=None):
+        """Add preprocessed events (Match_Time_sec, Põhimoment and Momentum_Score or Result)."""
+        points, teams = team_points(events, scoring_model)
+        if points is None:
+            raise AnalysisError("Decayed momentum needs Momentum_Score or Result")
+        return self.update(events['Match_Time_sec'].to_numpy(dtype=float), points, teams)
+
+    def value(self, t):
+        """Levels of both sides at match time t, not earlier than the last event."""
+        if self.time is None:
+            return self.level.copy()
+        return self.level * np.exp(-self.rate * max(t - self.time, 0.0))
+
+    def curve(self, step_seconds=1, end_seconds=None):
+        """Sample the decayed levels on a regular time grid, one row per step."""
+        times = np.concatenate(self._times) if self._times else np.empty(0)
+        levels = np.vstack(self._levels) if self._levels else np.empty((0, len(DECAY_TEAMS)))
+        end = end_seconds if end_seconds is not None else (times[-1] if len(times) else 0.0)
+        grid = np.arange(0.0, end + step_seconds, step_seconds)
+
+        # Level of the last event at or before each grid point, decayed to the grid point
+        last = np.searchsorted(times, grid, side='right') - 1
+        seen = last >= 0
+        sampled = np.zeros((len(grid), len(DECAY_TEAMS)))
+        sampled[seen] = levels[last[seen]] * np.exp(-self.rate * (grid[seen] - times[last[seen]]))[:, None]
+
+        curve = pd.DataFrame(sampled, columns=DECAY_TEAMS)
+        curve.insert(0, 'Time_sec', grid)
+        curve['Net'] = curve['Estonia'] - curve['Opponent']
+        return curve
\ No newline at end of file
@@ -1,15 +1,88 @@
 # event_processor.py
+import numpy as np
+import pandas as pd
+
+from match_frame import MatchFrame, derived_column
+
+# Set piece tag -> category, highest priority first
+SET_PIECE_TYPES = {
+    'STAN_CORNER': 'Corners',
+    'STAN_FKDIRECT': 'Direct free kicks on/off target',
+    'STAN_FK': 'Direct free kicks',
+    'STAN_PENALTY': 'Penalties',
+    'STAN_KICKOFF': 'Kickoffs',
+    'STAN_THROWIN': 'Direct throw-ins',
+    'FK_OPEN': 'Opening free kicks',
+    'THROWIN_OPEN': 'Throw-ins',
+    'GK_OPENSHORT': 'Goalkick (short)',
+    'GK_SHORT': 'Goalkick (short)',
+    'GK_OPENLONG': 'Goalkick (long)',
+}
+
+ZONE_TAGS = ['S1', 'S2', 'S3']
+
+# Estonia presses while defending (DD), the opponent while Estonia attacks (AA), presses in
+# other moments are transition presses
+PRESSING_TEAMS = ['Estonia', 'Opponent', 'Transition']
+PRESSING_MOMENTS = {'DD': 0, 'AA': 1}
+
+
+def classify_presses(events):
+    """Pressing team of every row (index into PRESSING_TEAMS, -1 without a press) and press success.
+
+    Outcome is tagged from Estonia's side, so an Estonia (or transition) press succeeds
+    on POS and an opponent press on NEG, when Estonia's attack breaks down against it.
+    Takes a frame or a MatchFrame.
+    """
+    if 'Pressing' not in events.columns:
+        return np.full(len(events), -1, dtype=np.int64), np.zeros(len(events), dtype=bool)
+    moment = np.asarray(events['Põhimoment'], dtype=object)
+    outcome = np.asarray(events['Outcome'], dtype=object)
+    teams = np.full(len(events), len(PRESSING_TEAMS) - 1, dtype=np.int64)
+    for code, team in PRESSING_MOMENTS.items():
+        teams[moment == code] = team
+    teams[pd.isna(np.asarray(events['Pressing'], dtype=object))] = -1
+    successful = np.where(teams == PRESSING_MOMENTS['AA'], outcome == 'NEG', outcome == 'POS') & (teams >= 0)
+    return teams, successful
+
+
 class EventClassifier:
     """Classifies raw events into tactical categories."""
     
+    def __init__(self, config=None):
+        """Initialize with optional configuration."""
+        self.config = config or {}
+        
     def classify_possession_events(self, events):
         """Classify events by possession type (AA, DD, AD, DA)."""
     
     def classify_pressing_events(self, events):
         """Identify and categorize pressing events (HIGH, MID, LOW)."""
     
-    def classify_zone_progressions(self, events):
+    def classify_zone_progressions(self, events, tag_index=None):
         """Track zone progressions (S1, S2, S3)."""
+        frame = events if isinstance(events, MatchFrame) else MatchFrame(events, tag_index)
+        return frame.select(frame.tag_index.rows_any(ZONE_TAGS))
         
-    def identify_set_pieces(self, events):
-        """Extract set piece events and their outcomes."""
\ No newline at end of file
+    def identify_set_pieces(self, events, tag_index=None):
+        """Extract set piece events and their outcomes."""
+        frame = events if isinstance(events, MatchFrame) else MatchFrame(events, tag_index)
+        rows = frame.tag_index.rows_any(SET_PIECE_TYPES)
+        return frame.select(rows, frame.columns + ['Set_Piece_Type', 'Taking_Team'])
+
+
+@derived_column('Set_Piece_Type', ['Name'])
+def _set_piece_type(frame):
+    """Set piece category of each row by tag priority ('Other' when untagged)."""
+    tag_index = frame.tag_index
+    # Assign lowest priority first so higher priority tags overwrite it
+    set_piece_types = np.full(tag_index.num_rows, 'Other', dtype=object)
+    for tag, set_piece_type in reversed(list(SET_PIECE_TYPES.items())):
+        set_piece_types[tag_index.rows(tag)] = set_piece_type
+    return set_piece_types
+
+
+@derived_column('Pressing_Success', ['Pressing', 'Põhimoment', 'Outcome'])
+def _pressing_success(frame):
+    """Whether a press succeeded for the pressing side (see classify_presses)."""
+    return classify_presses(frame)[1]
\ No newline at end of file
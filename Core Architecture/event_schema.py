@@ -0,0 +1,93 @@
+# event_schema.py
+import logging
+
+import pandas as pd
+
+from errors import DataValidationError
+
+logger = logging.getLogger(__name__)
+
+# Fixed code tables - the position of a code is its integer value, so codes
+# stay comparable across matches, stored files and compiled scoring tables.
+DEFAULT_CODE_TABLES = {
+    'possession': ['AA', 'DD', 'AD', 'DA'],
+    'outcomes': ['POS', 'NEG'],
+    'results': ['SHOTGOAL', 'SHOTON', 'SHOTOFF', 'SHOTBLOCK', 'ENTRY', 'WINPENALTY',
+                'WINSTANDARD', 'WINOPENSTAN', 'KEEPPOS', '-'],
+    'pressing': ['HIGHPRESS', 'MIDPRESS', 'LOWPRESS'],
+    'zones': ['S1', 'S2', 'S3'],
+    'openings': ['THROWIN_OPEN', 'FK_OPEN', 'GK_OPENSHORT', 'GK_OPENLONG', 'GK_SHORT'],
+    'standards': ['STAN_CORNER', 'STAN_FK', 'STAN_FKDIRECT', 'STAN_KICKOFF', 'STAN_THROWIN',
+                  'STAN_PENALTY'],
+    'field_positions': ['L1', 'L2/1', 'L2/2', 'L3', 'M1', 'M2/1', 'M2/2', 'M3',
+                        'R1', 'R2/1', 'R2/2', 'R3'],
+}
+
+# Dartfish column -> taxonomy providing its code table
+COLUMN_TAXONOMIES = {
+    'Põhimoment': 'possession',
+    'Outcome': 'outcomes',
+    'Result': 'results',
+    'Shot2': 'results',
+    'Shot3': 'results',
+    'Pressing': 'pressing',
+    'Tsoon1': 'zones',
+    'Tsoon2': 'zones',
+    'Tsoon3': 'zones',
+    'Opening': 'openings',
+    'Standard last/4': 'standards',
+    'Field Position': 'field_positions',
+}
+
+
+class EventSchema:
+    """Declared categorical schema for the Dartfish taxonomy columns."""
+
+    def __init__(self, taxonomies=None, strict=False):
+        """Initialize with taxonomies in the same format I18nManager uses.
+
+        A strict schema rejects codes outside the taxonomies instead of keeping them.
+        """
+        self.strict = strict
+        self.code_tables = {name: list(codes) for name, codes in DEFAULT_CODE_TABLES.items()}
+        for name, terms in (taxonomies or {}).items():
+            codes = [term.get('code', key) if isinstance(term, dict) else key
+                     for key, term in terms.items()]
+            # Configured codes come first, built-in ones keep their relative order after them
+            self.code_tables[name] = codes + [c for c in self.code_tables.get(name, []) if c not in codes]
+        self.dtypes = {}
+
+    def dtype(self, taxonomy):
+        """Get the categorical dtype for a taxonomy."""
+        if taxonomy not in self.dtypes:
+            self.dtypes[taxonomy] = pd.CategoricalDtype(self.code_tables[taxonomy])
+        return self.dtypes[taxonomy]
+
+    def codes(self, column, values):
+        """Look up integer codes for values of a column (-1 for unknown values)."""
+        return self.dtype(COLUMN_TAXONOMIES[column]).categories.get_indexer(values)
+
+    def apply(self, data):
+        """Get a copy of a frame with its taxonomy columns in their fixed categorical dtypes.
+
+        Code tables never change while loading, so known codes keep their integer codes.
+        Codes outside them are appended after the table with a warning, or rejected when strict.
+        """
+        converted = {}
+        for col, taxonomy in COLUMN_TAXONOMIES.items():
+            if col not in data.columns:
+                continue
+
+            values = data[col]
+            if isinstance(values.dtype, pd.CategoricalDtype) and values.dtype == self.dtype(taxonomy):
+                continue
+            values = values.astype('string').str.strip()
+            dtype = self.dtype(taxonomy)
+            unknown = sorted(set(values.dropna().unique()) - set(self.code_tables[taxonomy]))
+            if unknown:
+                if self.strict:
+                    raise DataValidationError(f"Unknown {taxonomy} codes in '{col}': {unknown}")
+                logger.warning(f"Unknown {taxonomy} codes in '{col}' kept after the known codes: {unknown}")
+                dtype = pd.CategoricalDtype(self.code_tables[taxonomy] + unknown)
+            converted[col] = values.astype(object).astype(dtype)
+        return data.assign(**converted)
\ No newline at end of file
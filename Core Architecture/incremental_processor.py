@@ -1,17 +1,36 @@
 # incremental_processor.py
+import logging
+
+from live_momentum import LiveMatchState
+
+logger = logging.getLogger(__name__)
+
+
 class IncrementalProcessor:
     """Supports incremental updates to analysis."""
     
+    def __init__(self, cache_manager, live_settings=None):
+        """Initialize with the cache holding match analyses and live state settings."""
+        self.cache_manager = cache_manager
+        self.live_settings = live_settings or {}
+    
     def update_analysis(self, match_id, new_events):
         """Update existing analysis with new events (e.g., from live tagging)."""
         # Retrieve existing analysis
-        existing_analysis = self.cache_manager.get_cache(f"match:{match_id}")
+        existing_analysis = self.cache_manager.get_cache(f"match:{match_id}") or {}
         
-        # Merge new events with existing events
-        updated_events = self._merge_events(existing_analysis['events'], new_events)
+        # Live state is kept with the analysis, so only bins touched by the new events change
+        state = existing_analysis.get('live')
+        if state is None:
+            # First update after a pipeline run starts from the whole match so far
+            state = LiveMatchState(**self.live_settings)
+            if existing_analysis.get('events') is not None:
+                state.update(existing_analysis['events'])
+            elif existing_analysis.get('rollup') is not None:
+                logger.warning(f"{match_id}: cached analysis has no events, live rollup restarts from the new events")
+        state.update(new_events)
         
-        # Re-run affected portions of analysis
-        updated_analysis = self._recompute_analysis(existing_analysis, updated_events)
+        updated_analysis = dict(existing_analysis, live=state, rollup=state.rollup())
         
         # Update cache
         self.cache_manager.cache(f"match:{match_id}", updated_analysis)
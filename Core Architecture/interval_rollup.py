@@ -0,0 +1,141 @@
+# interval_rollup.py
+import numpy as np
+import pandas as pd
+
+from errors import AnalysisError
+from event_processor import SET_PIECE_TYPES, classify_presses
+from momentum_scorer import compiled_model
+from tag_index import TagIndex
+
+ESTONIA_MOMENTS = ['AA', 'DA']
+OPPONENT_MOMENTS = ['DD', 'AD']
+
+def team_points(events, scoring_model=None):
+    """Momentum points of every event (Momentum_Score, else its scoring model score) and its side.
+
+    Points are positive for both sides, sides are 0 for Estonia, 1 for the opponent and -1
+    for events without points. scoring_model is passed to momentum_scorer.compiled_model,
+    so the model's zone and pressing multipliers apply to the Result points.
+    Points are None when neither Momentum_Score nor Result is available.
+    """
+    if 'Momentum_Score' in events.columns:
+        # Momentum_Score is signed from Estonia's view (an opponent press won in DD is
+        # positive), so the side credited follows its sign rather than Põhimoment
+        scores = events['Momentum_Score'].to_numpy(dtype=float)
+    elif 'Result' in events.columns:
+        scores = compiled_model(scoring_model).score(events)
+    else:
+        moment = events['Põhimoment'].astype(object)
+        return None, np.select([moment.isin(ESTONIA_MOMENTS), moment.isin(OPPONENT_MOMENTS)], [0, 1], default=-1)
+    return np.abs(scores), np.select([scores > 0, scores < 0], [0, 1], default=-1)
+
+
+def rollup_metrics(events, scoring_model=None, tag_index=None):
+    """Per-row values of the standard per-interval metrics, skipping those whose columns are missing."""
+    metrics = {}
+    if 'Põhimoment' not in events.columns:
+        return metrics
+    moment = events['Põhimoment'].astype(object)
+
+    points, teams = team_points(events, scoring_model)
+    if points is not None:
+        metrics['momentum_estonia'] = points * (teams == 0)
+        metrics['momentum_opponent'] = points * (teams == 1)
+
+    if {'Pressing', 'Outcome'}.issubset(events.columns):
+        pressing_teams, successful = classify_presses(events)
+        metrics['presses_estonia'] = pressing_teams == 0
+        metrics['presses_opponent'] = pressing_teams == 1
+        metrics['press_wins_estonia'] = (pressing_teams == 0) & successful
+        metrics['press_wins_opponent'] = (pressing_teams == 1) & successful
+
+    if 'Name' in events.columns:
+        tag_index = tag_index or TagIndex.build(events['Name'])
+        set_piece = tag_index.mask(SET_PIECE_TYPES)
+        metrics['set_pieces_estonia'] = set_piece & (moment == 'AA').to_numpy()
+        metrics['set_pieces_opponent'] = set_piece & (moment == 'DD').to_numpy()
+
+    # Transitions: DA is Estonia winning the ball, AD the opponent winning it
+    metrics['transitions_estonia'] = (moment == 'DA').to_numpy()
+    metrics['transitions_opponent'] = (moment == 'AD').to_numpy()
+    return metrics
+
+
+class IntervalRollup:
+    """Per-metric event totals in fixed base bins, with coarser interval views derived by summing bins."""
+
+    def __init__(self, values, metrics, base_minutes=1):
+        """Initialize from a metrics x base bins array."""
+        self.values = np.asarray(values, dtype=float)
+        self.metrics = list(metrics)
+        self.base_minutes = base_minutes
+        self._views = {}
+
+    @classmethod
+    def build(cls, match_time_ms, metrics, base_minutes=1, num_bins=None):
+        """Aggregate per-row metric values (name -> array) into base bins with a single bincount."""
+        bins = np.asarray(match_time_ms, dtype=np.int64) // (base_minutes * 60000)
+        num_bins = max(int(bins.max()) + 1 if len(bins) else 0, num_bins or 0)
+        if not metrics:
+            return cls(np.zeros((0, num_bins)), [], base_minutes)
+
+        weights = np.vstack([np.asarray(values, dtype=float) for values in metrics.values()])
+        flat_bins = (np.arange(len(metrics))[:, None] * num_bins + bins[None, :]).ravel()
+        values = np.bincount(flat_bins, weights=weights.ravel(), minlength=len(metrics) * num_bins)
+        return cls(values.reshape(len(metrics), num_bins), metrics, base_minutes)
+
+    @classmethod
+    def from_events(cls, events, metrics=None, base_minutes=1, scoring_model=None):
+        """Build from preprocessed events (Match_Time_sec), using the standard metrics by default."""
+        if 'Match_Time_sec' not in events.columns:
+            raise AnalysisError("Interval rollups need Match_Time_sec from DataPreprocessor")
+        metrics = rollup_metrics(events, scoring_model) if metrics is None else metrics
+        match_time_ms = np.rint(events['Match_Time_sec'].to_numpy(dtype=float) * 1000).astype(np.int64)
+        return cls.build(match_time_ms, metrics, base_minutes)
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """Restore a rollup saved with to_arrays."""
+        return cls(arrays['values'], arrays['metrics'].tolist(), int(arrays['base_minutes'][0]))
+
+    def to_arrays(self):
+        """Export the rollup as plain numpy arrays for storage."""
+        return {
+            'values': self.values,
+            'metrics': np.asarray(self.metrics, dtype=str),
+            'base_minutes': np.array([self.base_minutes]),
+        }
+
+    @property
+    def num_bins(self):
+        return self.values.shape[1]
+
+    def view(self, interval_minutes):
+        """Get per-interval totals for an interval length that is a multiple of the base bins."""
+        if interval_minutes <= 0 or interval_minutes % self.base_minutes:
+            raise AnalysisError(
+                f"Interval of {interval_minutes} minutes is not a multiple of the "
+                f"{self.base_minutes}-minute base bins"
+            )
+        if interval_minutes not in self._views:
+            factor = interval_minutes // self.base_minutes
+            starts = np.arange(0, self.num_bins, factor)
+            totals = np.add.reduceat(self.values, starts, axis=1) if self.num_bins else self.values
+
+            labels = [f"{i * interval_minutes}-{(i + 1) * interval_minutes}" for i in range(len(starts))]
+            view = pd.DataFrame(totals.T, columns=self.metrics)
+            view.insert(0, 'Interval', np.arange(len(starts)))
+            view.insert(1, 'Interval_Label', pd.Categorical(labels, categories=labels, ordered=True))
+            self._views[interval_minutes] = view
+        return self._views[interval_minutes]
+
+    def merge(self, other):
+        """Sum with another rollup (e.g. to total a tournament), padding the shorter one."""
+        if other.base_minutes != self.base_minutes:
+            raise AnalysisError("Cannot merge rollups with different base bins")
+        metrics = self.metrics + [m for m in other.metrics if m not in self.metrics]
+        values = np.zeros((len(metrics), max(self.num_bins, other.num_bins)))
+        for rollup in (self, other):
+            rows = [metrics.index(m) for m in rollup.metrics]
+            values[rows, :rollup.num_bins] += rollup.values
+        return IntervalRollup(values, metrics, self.base_minutes)
\ No newline at end of file
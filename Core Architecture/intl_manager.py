@@ -1,4 +1,7 @@
 # i18n_manager.py
+from event_schema import EventSchema
+
+
 class I18nManager:
     """Manages internationalization and translations."""
     
@@ -40,6 +43,14 @@ class I18nManager:
             return term_data.get(self.current_language, term_data.get('code', code))
         return code
         
+    def get_code_table(self, taxonomy):
+        """Get the ordered codes of a taxonomy (shared with EventSchema)."""
+        return self.event_schema().code_tables.get(taxonomy, [])
+        
+    def event_schema(self):
+        """Build the categorical event schema from the configured taxonomies."""
+        return EventSchema(self.taxonomies)
+        
     def translate_data_frame(self, df, column_mappings=None):
         """Translate a pandas DataFrame using column mappings."""
         if column_mappings is None:
@@ -50,8 +61,9 @@ class I18nManager:
             if col in df_copy:
                 taxonomy = mapping_info.get('taxonomy')
                 if taxonomy:
-                    df_copy[col + '_translated'] = df_copy[col].apply(
-                        lambda x: self.get_taxonomy_term(taxonomy, x) if pd.notna(x) else ""
-                    )
+                    # Series.map on a categorical only translates the code table, not every row
+                    df_copy[col + '_translated'] = df_copy[col].map(
+                        lambda x: self.get_taxonomy_term(taxonomy, x), na_action='ignore'
+                    ).astype(object).fillna("")
                     
         return df_copy
\ No newline at end of file
@@ -0,0 +1,168 @@
+# live_momentum.py
+import numpy as np
+import pandas as pd
+
+from decayed_momentum import DecayedMomentum
+from interval_rollup import IntervalRollup, rollup_metrics
+from match_data import parse_periods
+
+# Metrics kept per base bin, missing ones (e.g. no Pressing column) stay zero
+LIVE_METRICS = [
+    'momentum_estonia', 'momentum_opponent',
+    'presses_estonia', 'presses_opponent',
+    'press_wins_estonia', 'press_wins_opponent',
+    'set_pieces_estonia', 'set_pieces_opponent',
+    'transitions_estonia', 'transitions_opponent',
+]
+MOMENTUM_ROWS = [0, 1]
+
+
+class LiveMatchState:
+    """Analysis state of one match maintained per tagged event instead of re-running the match.
+
+    Keeps per-metric base bins (as IntervalRollup), cumulative momentum per bin, team totals
+    and the decayed momentum level. An event only touches its own bin, the cumulative tail
+    from that bin on (just the last bin while tagging live) and the running totals.
+    """
+
+    def __init__(self, base_minutes=1, scoring_model=None, decay_settings=None, interval_minutes=5):
+        """Initialize an empty match with base bin length, scoring model and momentum decay settings."""
+        self.base_minutes = base_minutes
+        self.scoring_model = scoring_model
+        self.decay_settings = decay_settings or {}
+        self.interval_minutes = interval_minutes
+        self.values = np.zeros((len(LIVE_METRICS), 16))
+        self.cumulative = np.zeros((len(MOMENTUM_ROWS), 16))
+        self.totals = np.zeros(len(LIVE_METRICS))
+        self.num_bins = 0
+        self.period_ends = {}
+        self.decayed = DecayedMomentum.from_settings(self.decay_settings, interval_minutes)
+        self._decay_stale = False
+        self._log = []
+
+    def __len__(self):
+        return sum(len(events) for events in self._log)
+
+    @property
+    def events(self):
+        """All events added so far with their match times."""
+        return pd.concat(self._log, ignore_index=True) if self._log else pd.DataFrame()
+
+    def update(self, new_events):
+        """Add newly tagged events and update only what they touch.
+
+        Events are raw tags (Position, Duration, Poolaeg) or preprocessed events with
+        Match_Time_sec. Preprocessed events that keep their tag columns also record the
+        period lengths, so raw tags can follow e.g. a match seeded from the pipeline.
+        """
+        if not len(new_events):
+            return self
+        if 'Match_Time_sec' in new_events.columns:
+            if {'Position', 'Duration', 'Poolaeg'}.issubset(new_events.columns):
+                self._record_periods(new_events)
+        else:
+            if self._extends_earlier_period(new_events):
+                # Later periods shift in match time, so replay every event once
+                return self._rebuild(new_events)
+            new_events = new_events.assign(Match_Time_sec=self._match_times(new_events))
+        self._log.append(new_events)
+        self._add(new_events)
+        return self
+
+    def rollup(self):
+        """Base bins of the events so far as an IntervalRollup (any interval view is a sum of bins)."""
+        # A copy, so rollups kept in results do not change with later updates
+        return IntervalRollup(self.values[:, :self.num_bins].copy(), LIVE_METRICS, self.base_minutes)
+
+    def momentum_timeline(self):
+        """Momentum and cumulative momentum of both sides per base bin."""
+        momentum = self.values[MOMENTUM_ROWS, :self.num_bins]
+        cumulative = self.cumulative[:, :self.num_bins]
+        return pd.DataFrame({
+            'Bin': np.arange(self.num_bins),
+            'Start_sec': np.arange(self.num_bins) * self.base_minutes * 60,
+            'Estonia': momentum[0],
+            'Opponent': momentum[1],
+            'Net': momentum[0] - momentum[1],
+            'Cumulative_Estonia': cumulative[0],
+            'Cumulative_Opponent': cumulative[1],
+            'Cumulative_Net': cumulative[0] - cumulative[1],
+        })
+
+    def team_totals(self):
+        """Running totals of every metric."""
+        return dict(zip(LIVE_METRICS, self.totals))
+
+    def decayed_momentum(self, step_seconds=1):
+        """Decayed momentum curve, replayed once in time order if events arrived late."""
+        if self._decay_stale:
+            self.decayed = DecayedMomentum.from_settings(self.decay_settings, self.interval_minutes)
+            self.decayed.update_events(self.events, self.scoring_model)
+            self._decay_stale = False
+        return self.decayed.curve(step_seconds)
+
+    def _add(self, events):
+        """Add per-row metric values of events into their bins, totals and the cumulative tail."""
+        metrics = rollup_metrics(events, self.scoring_model)
+        rows = np.zeros((len(LIVE_METRICS), len(events)))
+        for position, name in enumerate(LIVE_METRICS):
+            if name in metrics:
+                rows[position] = metrics[name]
+        bins = (events['Match_Time_sec'].to_numpy(dtype=float) // (self.base_minutes * 60)).astype(np.int64)
+        self._grow(int(bins.max()) + 1)
+
+        np.add.at(self.values, (slice(None), bins), rows)
+        self.totals += rows.sum(axis=1)
+        first = int(bins.min())
+        tail = np.cumsum(self.values[MOMENTUM_ROWS, first:self.num_bins], axis=1)
+        if first:
+            tail += self.cumulative[:, first - 1:first]
+        self.cumulative[:, first:self.num_bins] = tail
+
+        times = events['Match_Time_sec'].to_numpy(dtype=float)
+        if self._decay_stale or (self.decayed.time is not None and times.min() < self.decayed.time):
+            self._decay_stale = True
+        else:
+            self.decayed.update(times, rows[MOMENTUM_ROWS].sum(axis=0), np.argmax(rows[MOMENTUM_ROWS] != 0, axis=0))
+
+    def _grow(self, num_bins):
+        """Make room for num_bins bins, doubling capacity so appends stay amortized O(1)."""
+        if num_bins > self.values.shape[1]:
+            capacity = max(num_bins, 2 * self.values.shape[1])
+            self.values = np.pad(self.values, ((0, 0), (0, capacity - self.values.shape[1])))
+            self.cumulative = np.pad(self.cumulative, ((0, 0), (0, capacity - self.cumulative.shape[1])))
+        if num_bins > self.num_bins:
+            # New bins start from the last cumulative value
+            if self.num_bins:
+                self.cumulative[:, self.num_bins:num_bins] = self.cumulative[:, self.num_bins - 1:self.num_bins]
+            self.num_bins = num_bins
+
+    def _period_lengths(self, events):
+        """Periods and clip ends of new events."""
+        return parse_periods(events['Poolaeg']), (events['Position'] + events['Duration']).to_numpy(dtype=np.int64)
+
+    def _extends_earlier_period(self, events):
+        """Whether new events lengthen a period that already has later periods after it."""
+        periods, ends = self._period_lengths(events)
+        later = max(self.period_ends, default=0)
+        return any(p < later and end > self.period_ends.get(p, 0) for p, end in zip(periods, ends))
+
+    def _record_periods(self, events):
+        """Extend the known period lengths with the clip ends of new events."""
+        periods, ends = self._period_lengths(events)
+        for period in np.unique(periods):
+            self.period_ends[int(period)] = max(self.period_ends.get(int(period), 0), int(ends[periods == period].max()))
+        return periods
+
+    def _match_times(self, events):
+        """Match time (s) of new events from period position plus the lengths of earlier periods."""
+        periods = self._record_periods(events)
+        offsets = {p: sum(length for q, length in self.period_ends.items() if q < p) for p in self.period_ends}
+        return (events['Position'].to_numpy(dtype=np.int64) + np.array([offsets[p] for p in periods])) / 1000
+
+    def _rebuild(self, new_events):
+        """Replay all raw tags from scratch after period offsets changed."""
+        raw = [events.drop(columns='Match_Time_sec') for events in self._log] + [new_events]
+        state = LiveMatchState(self.base_minutes, self.scoring_model, self.decay_settings, self.interval_minutes)
+        self.__dict__.update(state.update(pd.concat(raw, ignore_index=True)).__dict__)
+        return self
\ No newline at end of file
@@ -0,0 +1,102 @@
+# match_data.py
+import numpy as np
+import pandas as pd
+
+
+def parse_periods(values):
+    """Parse Poolaeg values ("1."/"2." text or 1.0/2.0 numbers) into integer periods."""
+    values = pd.Series(values)
+    if not pd.api.types.is_numeric_dtype(values):
+        values = pd.to_numeric(values.astype(str).str.rstrip('.'))
+    return values.to_numpy().astype(np.int64)
+
+
+class MatchData:
+    """Match events kept as one contiguous row block per period with per-period time offsets.
+
+    Blocks are the period frames as loaded, the combined frame is only built when asked
+    for, so per-period work (offsets, match time, period counts) never copies rows.
+    """
+
+    def __init__(self, blocks, periods, offsets_ms, events=None):
+        """Initialize from period-ordered row blocks, their period numbers and time offsets."""
+        self.blocks = list(blocks)
+        self.periods = [int(p) for p in periods]
+        self.offsets_ms = np.asarray(offsets_ms, dtype=np.int64)
+        self.starts = np.concatenate([[0], np.cumsum([len(block) for block in self.blocks])]).astype(np.int64)
+        self._events = events
+
+    @classmethod
+    def from_blocks(cls, blocks, periods=None, period_column='Poolaeg'):
+        """Build from one frame per period (e.g. one per half file) without combining them."""
+        blocks = list(blocks)
+        if periods is None:
+            periods = [
+                parse_periods(block[period_column].iloc[:1])[0]
+                if period_column in block.columns and len(block) else i + 1
+                for i, block in enumerate(blocks)
+            ]
+        order = np.argsort(periods, kind='stable')
+        blocks, periods = [blocks[i] for i in order], [periods[i] for i in order]
+        return cls(blocks, periods, cls._offsets([cls._length(block) for block in blocks]))
+
+    @classmethod
+    def from_events(cls, events, period_column='Poolaeg'):
+        """Build from a combined frame (e.g. a stored match), blocks being row slices of it."""
+        period_values = parse_periods(events[period_column]) if period_column in events else \
+            events['Half'].to_numpy().astype(np.int64)
+        if len(period_values) and np.any(np.diff(period_values) < 0):
+            # Only reorder when halves were appended out of order
+            order = np.argsort(period_values, kind='stable')
+            events, period_values = events.iloc[order].reset_index(drop=True), period_values[order]
+
+        starts = np.flatnonzero(np.r_[True, np.diff(period_values) != 0]) if len(period_values) else np.array([0])
+        periods = period_values[starts] if len(period_values) else np.array([1])
+        bounds = np.append(starts, len(events))
+        blocks = [events.iloc[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+        return cls(blocks, periods, cls._offsets([cls._length(block) for block in blocks]), events)
+
+    @staticmethod
+    def _length(block):
+        """A period lasts until its last clip ends."""
+        if not len(block):
+            return 0
+        return int((block['Position'].to_numpy() + block['Duration'].to_numpy()).max())
+
+    @staticmethod
+    def _offsets(lengths):
+        """Later periods start after the actual length of the earlier ones."""
+        return np.concatenate([[0], np.cumsum(lengths)[:-1]]) if lengths else np.zeros(1, dtype=np.int64)
+
+    @property
+    def events(self):
+        """Combined frame of all periods, built once on first use."""
+        if self._events is None:
+            self._events = pd.concat(self.blocks, ignore_index=True) if len(self.blocks) > 1 else \
+                self.blocks[0].reset_index(drop=True)
+        return self._events
+
+    def __len__(self):
+        return int(self.starts[-1])
+
+    def period(self, period):
+        """Get the events of one period (its block, no copy)."""
+        return self.blocks[self.periods.index(period)]
+
+    def offset_ms(self, period):
+        """Get the match time offset of a period in milliseconds."""
+        return int(self.offsets_ms[self.periods.index(period)])
+
+    def period_lengths(self):
+        """Get the number of events in each period."""
+        return np.diff(self.starts)
+
+    def period_of_rows(self):
+        """Get the period number of every row."""
+        return np.repeat(self.periods, self.period_lengths())
+
+    def match_time_ms(self):
+        """Get match time of every event (period position plus period offset)."""
+        return np.concatenate([
+            block['Position'].to_numpy(dtype=np.int64) + offset for block, offset in zip(self.blocks, self.offsets_ms)
+        ]) if self.blocks else np.zeros(0, dtype=np.int64)
\ No newline at end of file
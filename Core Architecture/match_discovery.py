@@ -0,0 +1,153 @@
+# match_discovery.py
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# e.g. "2025.04.14 U17 Eesti - Gruusia (1pa).csv"
+MATCH_FILE_PATTERN = re.compile(
+    r'^(?P<date>\d{4}\.\d{2}\.\d{2})\s+(?P<title>.+?)\s*\((?P<half>[12])pa\)\.csv$',
+    re.IGNORECASE
+)
+HALF_KEYS = {'1': 'first_half', '2': 'second_half'}
+
+
+class TournamentManifest:
+    """Persistent record of size, mtime and content hash of processed match files."""
+
+    def __init__(self, manifest_path):
+        """Initialize with manifest file path, loading existing entries."""
+        self.manifest_path = manifest_path
+        self.entries = {}
+        if os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable manifest {manifest_path}: {e}")
+
+    def get(self, file_path):
+        """Get the recorded entry for a file (None if never processed)."""
+        return self.entries.get(file_path)
+
+    def update(self, file_path, entry):
+        """Record the current state of a file."""
+        self.entries[file_path] = entry
+
+    def save(self):
+        """Write the manifest atomically."""
+        directory = os.path.dirname(self.manifest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.manifest_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, ensure_ascii=False, sort_keys=True)
+        os.replace(temp_path, self.manifest_path)
+
+
+class MatchDiscovery:
+    """Discovers match half files in a tournament folder and detects new or changed matches."""
+
+    MANIFEST_NAME = '.match_manifest.json'
+    HASH_CHUNK_SIZE = 1 << 20
+
+    def __init__(self, max_workers=8):
+        """Initialize with the number of threads used to stat and hash files."""
+        self.max_workers = max_workers
+        self._pending = {}
+
+    def discover(self, tournament_path):
+        """Walk a tournament folder and pair (1pa)/(2pa) files by date and team naming."""
+        halves = {}
+        for root, _, files in os.walk(tournament_path):
+            for name in files:
+                match = MATCH_FILE_PATTERN.match(name)
+                if not match:
+                    continue
+                relative_dir = os.path.relpath(root, tournament_path)
+                match_id = f"{match.group('date')} {match.group('title')}"
+                if relative_dir != '.':
+                    match_id = os.path.join(relative_dir, match_id)
+                halves.setdefault(match_id, {})[HALF_KEYS[match.group('half')]] = os.path.join(root, name)
+
+        match_paths = {}
+        for match_id, paths in sorted(halves.items()):
+            if len(paths) != 2:
+                logger.warning(f"Skipping {match_id}: missing half file")
+                continue
+            match_paths[match_id] = paths
+        return match_paths
+
+    def changed_matches(self, tournament_path, manifest=None):
+        """Get only matches with a half file that is new or changed since it was last recorded."""
+        manifest = manifest or self.load_manifest(tournament_path)
+        match_paths = self.discover(tournament_path)
+        file_paths = [path for paths in match_paths.values() for path in paths.values()]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            states = dict(zip(file_paths, executor.map(
+                lambda path: self._file_state(tournament_path, path, manifest), file_paths
+            )))
+
+        changed = {}
+        touched = False
+        for match_id, paths in match_paths.items():
+            recorded = [manifest.get(self._manifest_key(tournament_path, path)) for path in paths.values()]
+            current = [states[path] for path in paths.values()]
+            if any(old is None or old['hash'] != new['hash'] for old, new in zip(recorded, current)):
+                changed[match_id] = paths
+                # Kept until mark_processed so a failed run is retried next time
+                self._pending[match_id] = {path: states[path] for path in paths.values()}
+            elif recorded != current:
+                # Same content with a new mtime - record it so the file is not re-hashed again
+                for path in paths.values():
+                    manifest.update(self._manifest_key(tournament_path, path), states[path])
+                touched = True
+
+        if touched:
+            manifest.save()
+        return changed
+
+    def mark_processed(self, tournament_path, match_ids, manifest=None):
+        """Record the file states of successfully processed matches in the manifest."""
+        manifest = manifest or self.load_manifest(tournament_path)
+        for match_id in match_ids:
+            for path, state in self._pending.pop(match_id, {}).items():
+                manifest.update(self._manifest_key(tournament_path, path), state)
+        manifest.save()
+        return manifest
+
+    def content_hash(self, match_id):
+        """Combined content hash of a match found changed by changed_matches (None if unknown)."""
+        states = self._pending.get(match_id)
+        if not states:
+            return None
+        digest = hashlib.sha256()
+        for path in sorted(states):
+            digest.update(states[path]['hash'].encode('ascii'))
+        return digest.hexdigest()[:16]
+
+    def load_manifest(self, tournament_path):
+        """Load the manifest stored in a tournament folder."""
+        return TournamentManifest(os.path.join(tournament_path, self.MANIFEST_NAME))
+
+    def _manifest_key(self, tournament_path, file_path):
+        """Manifest entries use paths relative to the tournament folder so it can be moved."""
+        return os.path.relpath(file_path, tournament_path)
+
+    def _file_state(self, tournament_path, file_path, manifest):
+        """Stat a file, re-hashing it only when size or mtime differ from the manifest."""
+        stat = os.stat(file_path)
+        recorded = manifest.get(self._manifest_key(tournament_path, file_path))
+        if recorded and recorded['size'] == stat.st_size and recorded['mtime'] == stat.st_mtime_ns:
+            return recorded
+
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'hash': digest.hexdigest()}
\ No newline at end of file
@@ -0,0 +1,176 @@
+# match_frame.py
+import numpy as np
+
+from errors import AnalysisError
+from tag_index import TagIndex
+
+SHOT_RESULTS = ['SHOTGOAL', 'SHOTON', 'SHOTOFF', 'SHOTBLOCK']
+
+OUTCOME_CATEGORIES = {
+    'SHOTGOAL': 'Goal',
+    'SHOTON': 'Shot on Target',
+    'SHOTOFF': 'Shot off Target',
+    'SHOTBLOCK': 'Shot blocked',
+    'ENTRY': 'Entry',
+    'KEEPPOS': 'Maintained Possession',
+    'WINOPENSTAN': 'Maintained Possession',
+    '-': 'Lost Possession',
+}
+
+PRESSING_ZONES = {
+    'HIGHPRESS': 'Offensive',
+    'MIDPRESS': 'Pre-Offensive',
+    'LOWPRESS': 'Pre-Defensive',
+}
+
+# Derived column name -> (function of a MatchFrame, raw columns it reads)
+DERIVED_COLUMNS = {}
+
+
+def derived_column(name, inputs):
+    """Register a function computing a derived column from a MatchFrame."""
+    def register(func):
+        DERIVED_COLUMNS[name] = (func, list(inputs))
+        return func
+    return register
+
+
+class MatchFrame:
+    """Read-only match events shared by analyzers, computing each derived column once on first access."""
+
+    def __init__(self, events, tag_index=None):
+        """Initialize with preprocessed events and an optional prebuilt tag index."""
+        self._events = events
+        self._tag_index = tag_index
+        self._columns = {}
+
+    def __len__(self):
+        return len(self._events)
+
+    def __contains__(self, name):
+        if name in self._events.columns or name in self._columns:
+            return True
+        return name in DERIVED_COLUMNS and all(col in self._events.columns for col in DERIVED_COLUMNS[name][1])
+
+    def __getitem__(self, name):
+        return self.column(name)
+
+    @property
+    def columns(self):
+        """Raw column names."""
+        return list(self._events.columns)
+
+    @property
+    def index(self):
+        return self._events.index
+
+    @property
+    def tag_index(self):
+        """Token index of the Name column, built on first use."""
+        if self._tag_index is None:
+            self._tag_index = TagIndex.build(self.raw('Name'))
+        return self._tag_index
+
+    def raw(self, name):
+        """Get a raw column as a Series (shared, must not be modified)."""
+        return self._events[name]
+
+    def column(self, name):
+        """Get a raw or derived column as a read-only array, computing derived ones once."""
+        if name not in self._columns:
+            if name in self._events.columns:
+                values = self._events[name].to_numpy()
+            elif name in DERIVED_COLUMNS:
+                func, inputs = DERIVED_COLUMNS[name]
+                missing = [col for col in inputs if col not in self._events.columns]
+                if missing:
+                    raise AnalysisError(f"Cannot derive {name}, missing columns: {missing}")
+                values = np.asarray(func(self))
+            else:
+                raise KeyError(name)
+            # A read-only view leaves the shared events untouched
+            values = values.view()
+            values.flags.writeable = False
+            self._columns[name] = values
+        return self._columns[name]
+
+    def provide(self, name, values):
+        """Keep a derived column that was computed together with another one."""
+        if name not in self._columns:
+            values = np.asarray(values).view()
+            values.flags.writeable = False
+            self._columns[name] = values
+
+    def select(self, rows=None, columns=None):
+        """Copy out selected rows (mask or positions) with raw and derived columns for one analyzer."""
+        if rows is None:
+            rows = np.arange(len(self._events))
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        columns = self.columns if columns is None else columns
+
+        raw = [col for col in columns if col in self._events.columns]
+        frame = self._events.iloc[rows, [self._events.columns.get_loc(col) for col in raw]]
+        derived = {col: self.column(col)[rows] for col in columns if col not in self._events.columns}
+        return frame.assign(**derived)[list(columns)]
+
+
+def _moment_labels(frame, labels, default):
+    """Map Põhimoment codes to labels."""
+    return frame.raw('Põhimoment').astype(object).map(labels).fillna(default).to_numpy(dtype=object)
+
+
+@derived_column('Team', ['Põhimoment'])
+def _team(frame):
+    """Side in possession (AA/DA Estonia, DD/AD opponent)."""
+    return _moment_labels(frame, {'AA': 'Estonia', 'DA': 'Estonia', 'DD': 'Opponent', 'AD': 'Opponent'}, 'Unknown')
+
+
+@derived_column('Taking_Team', ['Põhimoment'])
+def _taking_team(frame):
+    """Side taking a set piece."""
+    return _moment_labels(frame, {'AA': 'Estonia', 'DD': 'Opponent'}, 'Unknown')
+
+
+@derived_column('Pressing_Team', ['Põhimoment'])
+def _pressing_team(frame):
+    """Side pressing, i.e. the defending side."""
+    return _moment_labels(frame, {'DD': 'Estonia', 'AA': 'Opponent'}, 'Transition')
+
+
+@derived_column('Resulted_In_Shot', ['Result'])
+def _resulted_in_shot(frame):
+    """Whether the event ended in a shot."""
+    return frame.raw('Result').isin(SHOT_RESULTS).to_numpy()
+
+
+@derived_column('Resulted_In_Entry', ['Result'])
+def _resulted_in_entry(frame):
+    """Whether the event ended in a penalty box entry."""
+    return (frame.raw('Result') == 'ENTRY').to_numpy()
+
+
+@derived_column('Was_Successful', ['Outcome'])
+def _was_successful(frame):
+    """Whether the event outcome was positive."""
+    return (frame.raw('Outcome') == 'POS').to_numpy()
+
+
+@derived_column('Pressing_Zone', ['Pressing'])
+def _pressing_zone(frame):
+    """Pitch zone of a press."""
+    return frame.raw('Pressing').astype(object).map(PRESSING_ZONES).to_numpy(dtype=object)
+
+
+@derived_column('Outcome_Category', ['Result'])
+def _outcome_category(frame):
+    """Readable outcome category of the result."""
+    result = frame.raw('Result').astype(object)
+    return result.map(OUTCOME_CATEGORIES).where(result.notna(), 'Lost Possession').fillna('Other').to_numpy(dtype=object)
+
+
+@derived_column('Match_Minute', ['Match_Time_sec'])
+def _match_minute(frame):
+    """Match minute rounded to tenths (for plotting)."""
+    return np.round(frame['Match_Time_sec'] / 60, 1)
\ No newline at end of file
@@ -0,0 +1,86 @@
+# match_store.py
+import hashlib
+import logging
+import os
+
+import numpy as np
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - optional dependency
+    feather = None
+
+logger = logging.getLogger(__name__)
+
+
+class MatchStore:
+    """Stores parsed matches as columnar Feather files keyed by source content hash."""
+
+    HASH_CHUNK_SIZE = 1 << 20
+
+    def __init__(self, store_settings=None):
+        """Initialize with store settings."""
+        store_settings = store_settings or {}
+        self.enabled = store_settings.get('enabled', True) and feather is not None
+        self.path = store_settings.get('path', './cache/matches')
+        if store_settings.get('enabled', True) and feather is None:
+            logger.warning("pyarrow not installed, columnar match store disabled")
+
+    def content_key(self, *source_paths):
+        """Build a store key from the contents of the source files (order matters)."""
+        digest = hashlib.sha256()
+        for source_path in source_paths:
+            with open(source_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+            # Separator so that moving bytes between files changes the key
+            digest.update(b'\x00')
+        return digest.hexdigest()
+
+    def file_path(self, key, suffix='feather'):
+        """Get the file path for a store key."""
+        return os.path.join(self.path, f"{key}.{suffix}")
+
+    def has(self, key):
+        """Check if a match with the given key is stored."""
+        return self.enabled and os.path.exists(self.file_path(key))
+
+    def read(self, key, columns=None):
+        """Read a stored match, memory-mapping the file instead of parsing text."""
+        table = feather.read_table(self.file_path(key), columns=columns, memory_map=True)
+        return table.to_pandas()
+
+    def columns(self, key):
+        """Get the column names of a stored match without reading its data."""
+        return feather.read_table(self.file_path(key), memory_map=True).schema.names
+
+    def read_arrays(self, key, suffix):
+        """Read numpy arrays stored next to a match (e.g. its tag index)."""
+        path = self.file_path(key, suffix + '.npz')
+        if not self.enabled or not os.path.exists(path):
+            return None
+        with np.load(path, allow_pickle=False) as arrays:
+            return {name: arrays[name] for name in arrays.files}
+
+    def write_arrays(self, key, suffix, arrays):
+        """Store numpy arrays next to a match."""
+        if not self.enabled:
+            return
+
+        os.makedirs(self.path, exist_ok=True)
+        target_path = self.file_path(key, suffix + '.npz')
+        temp_path = f"{target_path}.{os.getpid()}.tmp.npz"
+        np.savez(temp_path, **arrays)
+        os.replace(temp_path, target_path)
+
+    def write(self, key, data):
+        """Write a match to the store (uncompressed so reads can be memory-mapped)."""
+        if not self.enabled:
+            return
+
+        os.makedirs(self.path, exist_ok=True)
+        target_path = self.file_path(key)
+        temp_path = f"{target_path}.{os.getpid()}.tmp"
+        feather.write_feather(data.reset_index(drop=True), temp_path, compression='uncompressed')
+        # Atomic rename so concurrent readers never see a half-written file
+        os.replace(temp_path, target_path)
\ No newline at end of file
@@ -1,16 +1,104 @@
 # momentum_analyzer.py
+from decayed_momentum import DecayedMomentum
+from interval_rollup import IntervalRollup, rollup_metrics
+from momentum_bootstrap import bootstrap_events
+from momentum_shifts import shift_table, shift_triggers
+
+
 class MomentumAnalyzer:
     """Analyzes match momentum using your scoring system."""
     
+    # Raw columns read by the analyzer and fields it needs from DataPreprocessor
+    input_columns = ['Position', 'Duration', 'Poolaeg', 'Põhimoment', 'Outcome', 'Result',
+                     'Shot2', 'Shot3', 'Pressing', 'Tsoon1', 'Tsoon2', 'Tsoon3']
+    derived_fields = ['Match_Time_sec', 'Half', 'Interval', 'Interval_Label']
+    
+    def __init__(self, settings=None, scoring_model=None):
+        """Initialize with momentum settings and a compiled scoring model (configured point_values if None)."""
+        self.settings = settings or {}
+        self.scoring_model = scoring_model or self.settings.get('point_values')
+        
     def calculate_interval_momentum(self, events, interval_minutes=5):
         """Calculate momentum score for specified intervals."""
+        metrics = rollup_metrics(events, self.scoring_model)
+        momentum = {name: metrics[name] for name in ['momentum_estonia', 'momentum_opponent'] if name in metrics}
+        return IntervalRollup.from_events(events, momentum).view(interval_minutes)
+        
+    def calculate_momentum_uncertainty(self, events, interval_minutes=5):
+        """Calculate bootstrap confidence bands of interval and cumulative momentum."""
+        settings = self.settings.get('bootstrap', {})
+        return bootstrap_events(
+            events, interval_minutes, self.scoring_model,
+            num_resamples=settings.get('resamples', 2000),
+            confidence=settings.get('confidence', 0.9),
+            seed=settings.get('seed'),
+            workers=settings.get('workers', 1)
+        )
+        
+    def calculate_decayed_momentum(self, events, step_seconds=1):
+        """Calculate momentum decaying over match time (decay settings) sampled every step_seconds."""
+        decayed = DecayedMomentum.from_settings(self.settings, self.settings.get('interval_minutes', 5))
+        decayed.update_events(events, self.scoring_model)
+        return decayed.curve(step_seconds)
     
-    def identify_momentum_shifts(self, momentum_timeline):
-        """Identify significant changes in momentum."""
+    def identify_momentum_shifts(self, momentum_timeline, events=None, match_column=None, interval_minutes=5):
+        """Identify significant changes in momentum, with the events around them when events are given.
+        
+        Stacked timelines (a Match column) are matched to events through match_column.
+        """
+        settings = self.settings.get('shifts', {})
+        timeline = momentum_timeline
+        if 'Net' not in timeline.columns and 'momentum_estonia' in timeline.columns:
+            # Interval momentum from calculate_interval_momentum
+            timeline = timeline.assign(
+                Net=timeline['momentum_estonia'] - timeline['momentum_opponent'],
+                Start_sec=timeline['Interval'] * interval_minutes * 60
+            )
+        shifts = shift_table(timeline, penalty=settings.get('penalty'),
+                             min_segment_seconds=settings.get('min_segment_seconds', 300))
+        if events is None:
+            return shifts
+        return shift_triggers(shifts, events, settings.get('trigger_window_seconds', 60), match_column)
         
 # pressing_analyzer.py
+from pressing_cube import PressingCube
+from pressing_intensity import pressing_actions, pressing_overlay, rolling_pressing
+
+
 class PressingAnalyzer:
     """Analyzes pressing effectiveness and outcomes."""
     
+    input_columns = ['Position', 'Duration', 'Poolaeg', 'Põhimoment', 'Pressing', 'Outcome',
+                     'Result', 'Field Position']
+    derived_fields = ['Match_Time_sec', 'Half', 'Interval']
+    
+    def __init__(self, settings=None):
+        """Initialize with pressing settings."""
+        self.settings = settings or {}
+        
     def calculate_pressing_stats(self, events):
-        """Calculate pressing statistics by zone."""
\ No newline at end of file
+        """Calculate pressing statistics by zone."""
+        cube = PressingCube.from_events(events, self.settings.get('base_minutes', 1))
+        return {
+            'cube': cube,
+            'total_presses': cube.total('presses'),
+            'successful_presses': cube.total('successful'),
+            'zone_metrics': cube.table('zone'),
+            'team_metrics': cube.table('team'),
+            'half_metrics': cube.table('half'),
+            'zone_team_metrics': cube.table('team', 'zone'),
+            'ppda': cube.ppda(),
+        }
+        
+    def calculate_pressing_intensity(self, events, match_column=None):
+        """Presses, success rate and PPDA per team over sliding windows of Dartfish tags or a provider feed."""
+        settings = self.settings.get('intensity', {})
+        actions = pressing_actions(events, match_column, settings.get('home_team', 'ESTONIA'))
+        return rolling_pressing(actions, settings.get('window_minutes', 5) * 60,
+                                step_seconds=settings.get('step_seconds', 60), match_column=match_column)
+        
+    def overlay_pressing_intensity(self, momentum_timeline, events, match_column=None, window_minutes=None):
+        """Add pressing intensity to a momentum timeline, per interval unless window_minutes is given."""
+        settings = self.settings.get('intensity', {})
+        return pressing_overlay(momentum_timeline, events, window_minutes * 60 if window_minutes else None,
+                                match_column=match_column, home_team=settings.get('home_team', 'ESTONIA'))
\ No newline at end of file
@@ -0,0 +1,74 @@
+# momentum_bootstrap.py
+import concurrent.futures
+
+import numpy as np
+import pandas as pd
+
+from errors import AnalysisError
+from interval_rollup import team_points
+
+
+def resample_momentum(scores, intervals, num_intervals, num_resamples, seed=None):
+    """Interval momentum of bootstrap resamples of the events (resamples x intervals).
+
+    Drawing n events with replacement is the same as drawing multinomial counts per
+    event, so a whole batch of resamples is one counts x (event, interval) matrix product.
+    """
+    scores = np.asarray(scores, dtype=float)
+    rng = np.random.default_rng(seed)
+    if not len(scores):
+        return np.zeros((num_resamples, num_intervals))
+    counts = rng.multinomial(len(scores), np.full(len(scores), 1 / len(scores)), size=num_resamples)
+    weights = np.zeros((len(scores), num_intervals))
+    weights[np.arange(len(scores)), intervals] = scores
+    return counts @ weights
+
+
+def bootstrap_momentum(scores, intervals, num_intervals=None, num_resamples=2000, confidence=0.9, seed=None,
+                       workers=1, batch_size=500):
+    """Bootstrap confidence bands of interval and cumulative momentum.
+
+    Resamples run in batches of batch_size, spread over worker processes when workers > 1,
+    each batch with its own independent random stream so results do not depend on workers.
+    """
+    if not 0 < confidence < 1:
+        raise AnalysisError(f"Confidence must be between 0 and 1, got {confidence}")
+    scores = np.asarray(scores, dtype=float)
+    intervals = np.asarray(intervals, dtype=np.int64)
+    num_intervals = num_intervals or (int(intervals.max()) + 1 if len(intervals) else 0)
+
+    sizes = [min(batch_size, num_resamples - start) for start in range(0, num_resamples, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = ([scores] * len(sizes), [intervals] * len(sizes), [num_intervals] * len(sizes), sizes, seeds)
+    if workers > 1 and len(sizes) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            batches = list(executor.map(resample_momentum, *args))
+    else:
+        batches = list(map(resample_momentum, *args))
+    resamples = np.vstack(batches) if batches else np.zeros((0, num_intervals))
+
+    tail = (1 - confidence) / 2
+    momentum = np.bincount(intervals, weights=scores, minlength=num_intervals)
+    lower, upper = np.quantile(resamples, [tail, 1 - tail], axis=0)
+    cumulative_lower, cumulative_upper = np.quantile(np.cumsum(resamples, axis=1), [tail, 1 - tail], axis=0)
+    return pd.DataFrame({
+        'Interval': np.arange(num_intervals),
+        'Momentum': momentum,
+        'Momentum_Lower': lower,
+        'Momentum_Upper': upper,
+        'Cumulative_Momentum': np.cumsum(momentum),
+        'Cumulative_Lower': cumulative_lower,
+        'Cumulative_Upper': cumulative_upper,
+    })
+
+
+def bootstrap_events(events, interval_minutes=5, scoring_model=None, **options):
+    """Bootstrap bands of net momentum (Estonia minus opponent) per interval of preprocessed events."""
+    points, teams = team_points(events, scoring_model)
+    if points is None or 'Match_Time_sec' not in events.columns:
+        raise AnalysisError("Momentum bootstrap needs Match_Time_sec and Momentum_Score or Result")
+    signed = points * np.select([teams == 0, teams == 1], [1.0, -1.0], default=0.0)
+    intervals = (events['Match_Time_sec'].to_numpy(dtype=float) // (interval_minutes * 60)).astype(np.int64)
+    bands = bootstrap_momentum(signed, intervals, **options)
+    bands.insert(1, 'Interval_Label', [f"{i * interval_minutes}-{(i + 1) * interval_minutes}" for i in bands['Interval']])
+    return bands
\ No newline at end of file
@@ -0,0 +1,166 @@
+# momentum_cube.py
+import json
+import logging
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from errors import AnalysisError
+
+logger = logging.getLogger(__name__)
+
+CUBE_TEAMS = ['Estonia', 'Opponent']
+
+# e.g. "2025.04.14 U17 Eesti - Gruusia", optionally inside tournament sub folders
+MATCH_ID_PATTERN = re.compile(r'^(?P<date>\d{4}\.\d{2}\.\d{2})\s+(?:(?P<age_group>U\d+)\s+)?(?P<title>.*)$')
+
+
+class MomentumCube:
+    """Tournament momentum as one memory-mapped match x team x minute x model array.
+
+    Every processed match fills one slot, a small JSON index maps slots to match
+    metadata, so tournament questions are array slices instead of re-processing.
+    """
+
+    DATA_NAME = 'momentum.npy'
+    INDEX_NAME = '_index.json'
+
+    def __init__(self, cube_settings=None):
+        """Initialize with cube settings, opening an existing cube read-write if there is one."""
+        cube_settings = cube_settings or {}
+        self.path = cube_settings.get('path', './data/momentum_cube')
+        self.max_minutes = cube_settings.get('max_minutes', 130)
+        self.data_path = os.path.join(self.path, self.DATA_NAME)
+        self.index_path = os.path.join(self.path, self.INDEX_NAME)
+        self.models = []
+        self.matches = []
+        self.data = None
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            self.models, self.matches, self.max_minutes = index['models'], index['matches'], index['max_minutes']
+            self.data = np.load(self.data_path, mmap_mode='r+')
+
+    def __len__(self):
+        return len(self.matches)
+
+    @property
+    def index(self):
+        """Match metadata, one row per slot."""
+        return pd.DataFrame(self.matches, columns=['slot', 'match', 'tournament', 'date', 'age_group', 'teams', 'minutes'])
+
+    def add_match(self, match_id, momentum, models, tournament=None):
+        """Write one match (models x teams x minutes momentum), replacing it if already stored."""
+        momentum = np.asarray(momentum, dtype=np.float32)
+        if self.data is None:
+            self.models = list(models)
+        elif list(models) != self.models:
+            raise AnalysisError(f"Cube holds models {self.models}, got {list(models)}; build a new cube for other models")
+        minutes = min(momentum.shape[2], self.max_minutes)
+        if momentum.shape[2] > self.max_minutes:
+            logger.warning(f"{match_id}: momentum after minute {self.max_minutes} is not stored")
+
+        entry = next((m for m in self.matches if m['match'] == match_id and m['tournament'] == tournament), None)
+        if entry is None:
+            entry = dict(self._describe(match_id), slot=len(self.matches), match=match_id, tournament=tournament)
+            self._reserve(len(self.matches) + 1)
+            self.matches.append(entry)
+        entry['minutes'] = minutes
+
+        # Stored as match x team x minute x model
+        self.data[entry['slot']] = 0
+        self.data[entry['slot'], :, :minutes] = np.transpose(momentum[:, :, :minutes], (1, 2, 0))
+        self.data.flush()
+        self._save_index()
+        return entry['slot']
+
+    def select(self, tournament=None, match=None, age_group=None):
+        """Slots of matching matches (None matches anything, lists match any of their values)."""
+        slots = [
+            m['slot'] for m in self.matches
+            if _matches(m['tournament'], tournament) and _matches(m['match'], match)
+            and _matches(m['age_group'], age_group)
+        ]
+        return np.asarray(slots, dtype=np.int64)
+
+    def slice(self, slots=None, team=None, minutes=None, model=None):
+        """Get a match x [team] x minute x [model] view; team and model as a name drop their axis."""
+        slots = np.arange(len(self.matches)) if slots is None else np.asarray(slots, dtype=np.int64)
+        start, stop = minutes or (0, self.max_minutes)
+        teams = slice(None) if team is None else CUBE_TEAMS.index(team)
+        models = slice(None) if model is None else self._model_position(model)
+        return self.data[:len(self.matches)][slots][:, teams][..., start:stop, models]
+
+    def profile(self, team='Estonia', minutes=None, model=None, **predicates):
+        """Average momentum per minute of a team across the selected matches that lasted that long."""
+        model = model if model is not None else self.models[0]
+        slots = self.select(**predicates)
+        values = self.slice(slots, team, minutes, model)
+        start = (minutes or (0, self.max_minutes))[0]
+        played = np.array([m['minutes'] for m in self.matches])[slots]
+        counted = start + np.arange(values.shape[1]) < played[:, None]
+        with np.errstate(invalid='ignore'):
+            return pd.Series((values * counted).sum(axis=0) / counted.sum(axis=0),
+                             index=pd.RangeIndex(start, start + values.shape[1], name='Minute'))
+
+    def swings(self, minutes=(45, 90), model=None, **predicates):
+        """Range of cumulative net momentum within a window per match (e.g. second-half swing)."""
+        model = model if model is not None else self.models[0]
+        slots = self.select(**predicates)
+        values = self.slice(slots, None, minutes, model)
+        cumulative = np.cumsum(values[:, 0] - values[:, 1], axis=1)
+        swing = cumulative.max(axis=1) - cumulative.min(axis=1) if cumulative.shape[1] else np.zeros(len(slots))
+        index = self.index.set_index('slot').loc[slots]
+        return pd.DataFrame({'match': index['match'].to_numpy(), 'tournament': index['tournament'].to_numpy(),
+                             'swing': swing}).sort_values('swing', ascending=False, ignore_index=True)
+
+    def _model_position(self, model):
+        """Position of a model name on the model axis."""
+        if model not in self.models:
+            raise AnalysisError(f"Model '{model}' not in cube, available: {self.models}")
+        return self.models.index(model)
+
+    def _reserve(self, num_matches):
+        """Make room for num_matches slots, doubling the file so adds stay amortized O(1)."""
+        capacity = 0 if self.data is None else self.data.shape[0]
+        if num_matches <= capacity:
+            return
+        os.makedirs(self.path, exist_ok=True)
+        shape = (max(num_matches, 2 * capacity, 8), len(CUBE_TEAMS), self.max_minutes, len(self.models))
+        temp_path = f"{self.data_path}.{os.getpid()}.tmp.npy"
+        grown = np.lib.format.open_memmap(temp_path, mode='w+', dtype=np.float32, shape=shape)
+        if self.data is not None:
+            grown[:capacity] = self.data
+        grown.flush()
+        del grown
+        self.data = None
+        os.replace(temp_path, self.data_path)
+        self.data = np.load(self.data_path, mmap_mode='r+')
+
+    def _describe(self, match_id):
+        """Date, age group and teams from a match id like '2025.04.14 U17 Eesti - Gruusia'."""
+        parsed = MATCH_ID_PATTERN.match(os.path.basename(match_id))
+        if not parsed:
+            return {'date': None, 'age_group': None, 'teams': []}
+        title = parsed.group('title')
+        teams = [team.strip() for team in title.split(' - ')] if ' - ' in title else []
+        return {'date': parsed.group('date'), 'age_group': parsed.group('age_group'), 'teams': teams}
+
+    def _save_index(self):
+        """Write the metadata index atomically."""
+        temp_path = f"{self.index_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'models': self.models, 'max_minutes': self.max_minutes, 'matches': self.matches},
+                      f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.index_path)
+
+
+def _matches(value, predicate):
+    """Check an index value against None (any), a value or a collection of values."""
+    if predicate is None:
+        return True
+    if isinstance(predicate, (list, tuple, set)):
+        return value in predicate
+    return value == predicate
\ No newline at end of file
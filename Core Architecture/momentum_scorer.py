@@ -0,0 +1,240 @@
+# momentum_scorer.py
+import copy
+import logging
+
+import numpy as np
+import pandas as pd
+
+from errors import AnalysisError
+from event_schema import COLUMN_TAXONOMIES, EventSchema
+
+logger = logging.getLogger(__name__)
+
+RESULT_COLUMNS = ['Result', 'Shot2', 'Shot3']
+ZONE_COLUMNS = ['Tsoon1', 'Tsoon2', 'Tsoon3']
+
+# Estonia attacks (AA) and wins the ball (DA), the opponent does the same in DD/AD
+DEFAULT_TEAM_SIGNS = {'AA': 1.0, 'DA': 1.0, 'DD': -1.0, 'AD': -1.0}
+
+# Axes of the event class, each with one extra slot for a missing value
+CLASS_AXES = ['results', 'zones', 'pressing', 'possession']
+
+# Scoring model used when no saved model is configured
+DEFAULT_SCORING_MODEL = {
+    "metadata": {
+        "name": "default",
+        "description": "Default scoring model",
+        "version": "1.0",
+        "created": "2025-04-28"
+    },
+    "point_values": {
+        "SHOTGOAL": 20.0,
+        "SHOTON": 4.0,
+        "SHOTBLOCK": 3.0,
+        "SHOTOFF": 2.0,
+        "ENTRY": 1.0,
+    },
+    "multipliers": {
+        "zone": {
+            "S1": 0.8,
+            "S2": 1.0,
+            "S3": 1.2
+        },
+        "pressing": {
+            "HIGHPRESS": 1.5,
+            "MIDPRESS": 1.0,
+            "LOWPRESS": 0.7
+        }
+    }
+}
+
+# Compiled default models by their Result point values
+_DEFAULT_MODELS = {}
+
+
+class EventClassEncoder:
+    """Encodes events into scoring-model independent classes from categorical codes.
+
+    An event class combines the best result of Result/Shot2/Shot3 (the earliest code in
+    the results table, SHOTGOAL before SHOTON and so on), the last tagged zone of
+    Tsoon1-3, the pressing type and the Põhimoment.
+    """
+
+    def __init__(self, schema=None):
+        """Initialize with the event schema whose code tables define the classes."""
+        self.schema = schema or EventSchema()
+        # Snapshot sizes so codes appended to the schema later fall into the missing slot
+        self.sizes = [len(self.schema.code_tables[axis]) + 1 for axis in CLASS_AXES]
+
+    @property
+    def num_classes(self):
+        return int(np.prod(self.sizes))
+
+    def encode(self, events):
+        """Get the class id of every event."""
+        results = self._best_codes(events, RESULT_COLUMNS, 0)
+        zones = self._last_codes(events, ZONE_COLUMNS, 1)
+        pressing = self._column_codes(events, 'Pressing', 2)
+        possession = self._column_codes(events, 'Põhimoment', 3)
+        return np.ravel_multi_index((results, zones, pressing, possession), self.sizes)
+
+    def class_sides(self, classes):
+        """Side of each class from its Põhimoment (0 Estonia, 1 opponent, -1 untagged)."""
+        axis = CLASS_AXES.index('possession')
+        sides = {moment: 0 if sign > 0 else 1 for moment, sign in DEFAULT_TEAM_SIGNS.items()}
+        # The last slot holds missing moments
+        codes = self.schema.code_tables['possession'][:self.sizes[axis] - 1] + [None]
+        table = np.array([sides.get(code, -1) for code in codes], dtype=np.int64)
+        return table[np.unravel_index(classes, self.sizes)[axis]]
+
+    def _column_codes(self, events, column, axis):
+        """Codes of one column, with missing, unknown or newer codes in the last slot."""
+        missing = self.sizes[axis] - 1
+        if column not in events.columns:
+            return np.full(len(events), missing, dtype=np.int64)
+        values = events[column]
+        taxonomy = COLUMN_TAXONOMIES[column]
+        if isinstance(values.dtype, pd.CategoricalDtype) and values.dtype == self.schema.dtype(taxonomy):
+            codes = values.cat.codes.to_numpy().astype(np.int64)
+        else:
+            codes = self.schema.codes(column, values.astype(object)).astype(np.int64)
+        return np.where((codes < 0) | (codes >= missing), missing, codes)
+
+    def _best_codes(self, events, columns, axis):
+        """Lowest (highest priority) code over several columns."""
+        codes = [self._column_codes(events, col, axis) for col in columns]
+        return np.minimum.reduce(codes) if codes else np.full(len(events), self.sizes[axis] - 1)
+
+    def _last_codes(self, events, columns, axis):
+        """Code of the last tagged column (e.g. the zone a move ended in)."""
+        missing = self.sizes[axis] - 1
+        result = np.full(len(events), missing, dtype=np.int64)
+        for col in columns:
+            codes = self._column_codes(events, col, axis)
+            result = np.where(codes != missing, codes, result)
+        return result
+
+
+class CompiledScoringModel:
+    """Scoring model compiled into one momentum weight per event class."""
+
+    def __init__(self, model, encoder=None):
+        """Compile point values, zone and pressing multipliers and team signs of a model."""
+        self.encoder = encoder or EventClassEncoder()
+        self.name = model.get('metadata', {}).get('name', 'default')
+        multipliers = model.get('multipliers', {})
+
+        points = self._table('results', model['point_values'], 0.0)
+        zones = self._table('zones', multipliers.get('zone', {}), 1.0)
+        pressing = self._table('pressing', multipliers.get('pressing', {}), 1.0)
+        signs = self._table('possession', model.get('team_signs', DEFAULT_TEAM_SIGNS), 0.0)
+
+        # Outer product over the class axes, flattened in ravel_multi_index order
+        self.weights = np.einsum('r,z,p,t->rzpt', points, zones, pressing, signs).ravel()
+
+    def score(self, events=None, classes=None):
+        """Momentum score of every event (positive for Estonia, negative for the opponent)."""
+        if classes is None:
+            classes = self.encoder.encode(events)
+        return self.weights[classes]
+
+    def _table(self, taxonomy, values, default):
+        """Lookup array indexed by the codes of a taxonomy, default for missing codes."""
+        codes = self.encoder.schema.code_tables[taxonomy]
+        table = np.full(self.encoder.sizes[CLASS_AXES.index(taxonomy)], default, dtype=float)
+        for code, value in values.items():
+            if code in codes[:len(table) - 1]:
+                table[codes.index(code)] = value
+            else:
+                logger.warning(f"Scoring model {self.name}: '{code}' is not a {taxonomy} code, ignored")
+        return table
+
+
+def compiled_model(scoring_model=None):
+    """Get a compiled scoring model, compiling the default model once per set of point values.
+
+    scoring_model is a CompiledScoringModel (used as it is), Result point values replacing
+    those of the default model (its multipliers still apply) or None for the default model.
+    """
+    if isinstance(scoring_model, CompiledScoringModel):
+        return scoring_model
+    key = tuple(sorted((scoring_model or {}).items()))
+    if key not in _DEFAULT_MODELS:
+        model = copy.deepcopy(DEFAULT_SCORING_MODEL)
+        if scoring_model:
+            model['point_values'] = dict(scoring_model)
+        _DEFAULT_MODELS[key] = CompiledScoringModel(model)
+    return _DEFAULT_MODELS[key]
+
+
+class ScoringModelStack:
+    """Several scoring models compiled into one models x event classes weight matrix."""
+
+    def __init__(self, models, encoder=None):
+        """Compile models (name -> model dict) with one shared encoder so their class ids agree."""
+        self.encoder = encoder or EventClassEncoder()
+        self.names = list(models)
+        compiled = [CompiledScoringModel(model, self.encoder) for model in models.values()]
+        self.weights = (np.vstack([model.weights for model in compiled]) if compiled
+                        else np.zeros((0, self.encoder.num_classes)))
+
+    def class_counts(self, events, interval_minutes=5, match_column=None):
+        """Count events per observed class and interval with one bincount.
+
+        Returns (classes, counts, matches) where counts is classes x matches x intervals
+        and classes are the class ids present in the events.
+        """
+        if 'Match_Time_sec' not in events.columns:
+            raise AnalysisError("Model comparison needs Match_Time_sec from DataPreprocessor")
+        intervals = (events['Match_Time_sec'].to_numpy(dtype=float) // (interval_minutes * 60)).astype(np.int64)
+        if match_column:
+            match_codes, matches = pd.factorize(events[match_column], sort=True)
+        else:
+            match_codes, matches = np.zeros(len(events), dtype=np.int64), pd.Index([None])
+        classes, class_codes = np.unique(self.encoder.encode(events), return_inverse=True)
+
+        num_intervals = int(intervals.max()) + 1 if len(intervals) else 0
+        bins = (class_codes * len(matches) + match_codes) * num_intervals + intervals
+        counts = np.bincount(bins, minlength=len(classes) * len(matches) * num_intervals)
+        return classes, counts.reshape(len(classes), len(matches), num_intervals), matches
+
+    def score_intervals(self, events, interval_minutes=5, match_column=None):
+        """Net momentum of every model per interval with one matrix product.
+
+        Returns models x intervals, or models x matches x intervals with match_column.
+        """
+        momentum, _ = self._score_counts(*self.class_counts(events, interval_minutes, match_column))
+        return momentum if match_column else momentum[:, 0]
+
+    def score_teams(self, events, interval_minutes=1, match_column=None):
+        """Momentum of both sides (Estonia, Opponent; both positive) under every model per interval.
+
+        Returns models x teams x intervals, or models x matches x teams x intervals with match_column.
+        """
+        classes, counts, _ = self.class_counts(events, interval_minutes, match_column)
+        sides = self.encoder.class_sides(classes)
+        weights = self.weights[:, classes]
+        # Opponent classes carry negative weights under the default team signs
+        momentum = np.stack([
+            np.where(sides == 0, weights, 0.0) @ counts.reshape(len(classes), -1),
+            -np.where(sides == 1, weights, 0.0) @ counts.reshape(len(classes), -1),
+        ], axis=1).reshape((len(self.names), 2) + counts.shape[1:])
+        momentum = np.moveaxis(momentum, 1, 2)
+        return momentum if match_column else momentum[:, 0]
+
+    def comparison_frame(self, events, interval_minutes=5, match_column=None):
+        """One row per (match and) interval with a net momentum column per model."""
+        momentum, matches = self._score_counts(*self.class_counts(events, interval_minutes, match_column))
+        num_intervals = momentum.shape[2]
+        frame = pd.DataFrame(momentum.reshape(len(self.names), -1).T, columns=self.names)
+        interval = np.tile(np.arange(num_intervals), len(matches))
+        frame.insert(0, 'Interval', interval)
+        frame.insert(1, 'Interval_Label', [f"{i * interval_minutes}-{(i + 1) * interval_minutes}" for i in interval])
+        if match_column:
+            frame.insert(0, 'Match', np.repeat(np.asarray(matches), num_intervals))
+        return frame
+
+    def _score_counts(self, classes, counts, matches):
+        """Models x matches x intervals momentum from class counts."""
+        momentum = self.weights[:, classes] @ counts.reshape(len(classes), -1)
+        return momentum.reshape((len(self.names),) + counts.shape[1:]), matches
\ No newline at end of file
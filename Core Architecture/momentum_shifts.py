@@ -0,0 +1,126 @@
+# momentum_shifts.py
+import numpy as np
+import pandas as pd
+
+from errors import AnalysisError
+from time_index import TimeIndex
+
+
+def detect_shifts(values, penalty=None, min_size=2):
+    """Find changes in the mean of a series with PELT, returning the positions where new segments start.
+
+    Segments cost their squared deviation from the segment mean (from prefix sums) and each
+    change costs penalty, by default 2 * log(n) * variance of the series. The whole-series
+    variance is conservative when shifts are present, which keeps isolated spikes and
+    smooth curves from splitting everywhere. Pruned candidates keep the search close to
+    linear in the series length.
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if n < 2 * min_size:
+        return np.empty(0, dtype=np.int64)
+    if penalty is None:
+        penalty = 2 * np.log(n) * (np.var(values) or 1.0)
+    sums = np.r_[0.0, np.cumsum(values)]
+    squares = np.r_[0.0, np.cumsum(values ** 2)]
+
+    best = np.full(n + 1, np.inf)
+    best[0] = -penalty
+    previous = np.zeros(n + 1, dtype=np.int64)
+    candidates = np.array([0], dtype=np.int64)
+    for t in range(min_size, n + 1):
+        eligible = candidates[t - candidates >= min_size]
+        lengths = t - eligible
+        costs = best[eligible] + (squares[t] - squares[eligible]) - (sums[t] - sums[eligible]) ** 2 / lengths
+        position = np.argmin(costs)
+        best[t] = costs[position] + penalty
+        previous[t] = eligible[position]
+        # Drop candidates that can no longer start the optimal last segment
+        pruned = eligible[costs > best[t]]
+        candidates = np.append(np.setdiff1d(candidates, pruned, assume_unique=True), t)
+
+    changes = []
+    t = n
+    while t > 0:
+        t = previous[t]
+        changes.append(t)
+    return np.array(sorted(changes[:-1]), dtype=np.int64)
+
+
+def shift_table(timeline, value_column='Net', time_column=None, match_column='Match', penalty=None,
+                min_segment_seconds=300):
+    """Detect momentum shifts in one timeline or in every match of a stacked one in one call.
+
+    Returns one row per shift with its match time, the segment means around it and the
+    side it favours. The timeline needs a time column (Start_sec or Time_sec) per row and
+    segments are at least min_segment_seconds long whatever the timeline resolution.
+    """
+    time_column = time_column or next((col for col in ['Start_sec', 'Time_sec'] if col in timeline.columns), None)
+    if time_column is None or value_column not in timeline.columns:
+        raise AnalysisError(f"Shift detection needs a time column and '{value_column}' in the timeline")
+    if match_column not in timeline.columns:
+        match_column = None
+
+    if match_column:
+        match_codes, matches = pd.factorize(timeline[match_column], sort=True)
+    else:
+        match_codes, matches = np.zeros(len(timeline), dtype=np.int64), pd.Index([None])
+    order = np.lexsort((timeline[time_column].to_numpy(), match_codes))
+    values = timeline[value_column].to_numpy(dtype=float)[order]
+    times = timeline[time_column].to_numpy(dtype=float)[order]
+    bounds = np.searchsorted(match_codes[order], np.arange(len(matches) + 1))
+    steps = np.diff(times)
+    step = np.median(steps[steps > 0]) if (steps > 0).any() else 1.0
+    min_size = max(int(np.ceil(min_segment_seconds / step)), 1)
+
+    rows = []
+    for code, match in enumerate(matches):
+        lo, hi = bounds[code], bounds[code + 1]
+        series = values[lo:hi]
+        changes = detect_shifts(series, penalty, min_size)
+        edges = np.r_[0, changes, len(series)]
+        means = np.add.reduceat(series, edges[:-1]) / np.diff(edges) if len(series) else np.empty(0)
+        for shift, position in enumerate(changes):
+            rows.append({
+                'Match': match,
+                'Shift': shift + 1,
+                'Time_sec': times[lo + position],
+                'Mean_Before': means[shift],
+                'Mean_After': means[shift + 1],
+            })
+
+    shifts = pd.DataFrame(rows, columns=['Match', 'Shift', 'Time_sec', 'Mean_Before', 'Mean_After'])
+    shifts['Change'] = shifts['Mean_After'] - shifts['Mean_Before']
+    shifts['Favours'] = np.where(shifts['Change'] > 0, 'Estonia', 'Opponent')
+    return shifts if match_column else shifts.drop(columns='Match')
+
+
+def shift_triggers(shifts, events, window_seconds=60, match_column=None):
+    """Add the events around each shift (starting in or running into [t - window, t + window)).
+
+    Events are found through a TimeIndex over match time per match, with match_column
+    holding the values of the shift table's Match column. Adds Trigger_Rows (event index
+    labels) and Video_Position (Position of the first one, ms) for video review.
+    """
+    shifts = shifts.copy()
+    trigger_rows = [[] for _ in range(len(shifts))]
+    video_positions = np.full(len(shifts), np.nan)
+    groups = events.groupby(match_column, sort=False) if match_column else [(None, events)]
+    window_ms = window_seconds * 1000
+    for match, match_events in groups:
+        positions = np.flatnonzero(shifts['Match'].to_numpy() == match) if match_column else np.arange(len(shifts))
+        if not len(positions):
+            continue
+        starts = np.rint(match_events['Match_Time_sec'].to_numpy(dtype=float) * 1000).astype(np.int64)
+        durations = match_events['Duration'].to_numpy(dtype=np.int64) if 'Duration' in match_events.columns else 0
+        index = TimeIndex(starts, starts + durations)
+        for position in positions:
+            t = int(round(shifts['Time_sec'].iat[position] * 1000))
+            found = index.overlapping(t - window_ms, t + window_ms)
+            found = found[np.argsort(starts[found], kind='stable')]
+            trigger_rows[position] = match_events.index[found].tolist()
+            if len(found) and 'Position' in match_events.columns:
+                video_positions[position] = match_events['Position'].iat[found[0]]
+    shifts['Trigger_Rows'] = trigger_rows
+    shifts['Video_Position'] = video_positions
+    return shifts
\ No newline at end of file
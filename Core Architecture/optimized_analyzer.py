@@ -1,36 +1,128 @@
 # optimized_analyzer.py
-def calculate_momentum_timeline(events_df, interval_seconds=300):
-    """Calculate momentum timeline using vectorized operations."""
-    # Convert to numpy arrays for faster computation
-    timestamps = events_df['Position'].values
-    durations = events_df['Duration'].values
-    event_types = events_df['Result'].values
-    
-    # Pre-allocate result array
-    max_time = np.max(timestamps + durations)
-    num_intervals = int(np.ceil(max_time / interval_seconds))
-    momentum_timeline = np.zeros(num_intervals)
-    
-    # Vectorized mapping of event types to points
-    point_values = {
-        'SHOTGOAL': 20,
-        'SHOTON': 4,
-        'SHOTOFF': 2,
-        # etc.
+import numpy as np
+import pandas as pd
+
+from errors import AnalysisError
+from interval_rollup import team_points
+
+TIMELINE_TEAMS = ['Estonia', 'Opponent']
+
+# How an event spanning several intervals is counted:
+# start - all points in the interval it starts in
+# overlap - all points in every interval it starts in or runs across
+# duration - points split in proportion to the time spent in each interval
+TIMELINE_ATTRIBUTIONS = ['start', 'overlap', 'duration']
+
+
+def momentum_timeline(starts, ends, points, groups, num_groups, interval_ms, num_intervals, attribution='overlap'):
+    """Sum event points into a num_groups x num_intervals array in O(events + intervals).
+
+    Times are milliseconds from the start of each group's timeline (e.g. one match and
+    team). Each event adds a few difference-array entries with one bincount and the
+    interval totals come from cumulative sums, so no interval is scanned twice.
+    """
+    if attribution not in TIMELINE_ATTRIBUTIONS:
+        raise AnalysisError(f"Unknown attribution '{attribution}', expected one of {TIMELINE_ATTRIBUTIONS}")
+    if interval_ms <= 0:
+        raise AnalysisError("Timeline interval must be positive")
+    starts = np.asarray(starts, dtype=float)
+    ends = np.maximum(np.asarray(ends, dtype=float), starts)
+    points = np.asarray(points, dtype=float)
+    groups = np.asarray(groups, dtype=np.int64)
+    # One spare bin per group takes the differences closing at the last edge
+    width = num_intervals + 1
+    size = num_groups * width
+
+    first = np.floor(starts / interval_ms).astype(np.int64)
+    if attribution == 'start':
+        totals = np.bincount(groups * width + first, weights=points, minlength=size)
+        return totals.reshape(num_groups, width)[:, :num_intervals]
+
+    if attribution == 'overlap':
+        # +points from the first interval to the last one starting before the event ends
+        last = np.maximum(np.ceil(ends / interval_ms).astype(np.int64) - 1, first)
+        bins = np.concatenate([groups * width + first, groups * width + last + 1])
+        diffs = np.bincount(bins, weights=np.concatenate([points, -points]), minlength=size)
+        return np.cumsum(diffs.reshape(num_groups, width), axis=1)[:, :num_intervals]
+
+    # Each clip adds points at a constant rate while it runs, so the mass attributed up to
+    # an edge is edge * sum(rates started) - sum(rate * start), minus the same for the ends
+    durations = ends - starts
+    spread = durations > 0
+    rates = np.divide(points, durations, out=np.zeros_like(points), where=spread)
+    last = np.floor(ends / interval_ms).astype(np.int64)
+    bins = np.concatenate([groups * width + first, groups * width + last])
+    slopes = np.bincount(bins, weights=np.concatenate([rates, -rates]), minlength=size)
+    offsets = np.bincount(bins, weights=np.concatenate([rates * starts, -rates * ends]), minlength=size)
+
+    edges = np.arange(1, width + 1) * float(interval_ms)
+    slopes = np.cumsum(slopes.reshape(num_groups, width), axis=1)
+    offsets = np.cumsum(offsets.reshape(num_groups, width), axis=1)
+    attributed = np.hstack([np.zeros((num_groups, 1)), edges * slopes - offsets])
+    totals = np.diff(attributed, axis=1)[:, :num_intervals]
+
+    # Zero-length clips keep all their points in the interval they start in
+    instant = np.bincount(groups * width + first, weights=np.where(spread, 0.0, points), minlength=size)
+    return totals + instant.reshape(num_groups, width)[:, :num_intervals]
+
+
+def calculate_momentum_timeline(events_df, interval_seconds=300, attribution='overlap', points=None,
+                                match_column=None, scoring_model=None):
+    """Calculate per-team, per-interval and cumulative momentum for one or many matches in one pass.
+
+    Events are placed on Match_Time_sec when preprocessed and on Position otherwise,
+    with Duration (ms) as clip length. Points (positive for both sides) come from
+    Momentum_Score, or from scoring Result with scoring_model (the default scoring model if None).
+    Matches stacked in one frame are told apart by match_column and each gets its own timeline.
+    """
+    interval_ms = interval_seconds * 1000
+    if 'Match_Time_sec' in events_df.columns:
+        starts = np.rint(events_df['Match_Time_sec'].to_numpy(dtype=float) * 1000)
+    else:
+        starts = events_df['Position'].to_numpy(dtype=float)
+    durations = events_df['Duration'].to_numpy(dtype=float) if 'Duration' in events_df.columns else 0
+    ends = starts + durations
+
+    event_points, teams = team_points(events_df, scoring_model)
+    if points is None and event_points is None:
+        raise AnalysisError("Momentum timeline needs points, Momentum_Score or Result")
+    points = np.asarray(event_points if points is None else points, dtype=float)
+
+    # Rows of neither side (untagged Põhimoment or a zero Momentum_Score) are dropped
+    if match_column:
+        match_codes, matches = pd.factorize(events_df[match_column], sort=True)
+    else:
+        match_codes, matches = np.zeros(len(events_df), dtype=np.int64), pd.Index([None])
+    keep = teams >= 0
+    num_intervals = int(np.ceil(ends[keep].max() / interval_ms)) if keep.any() else 0
+    num_intervals = max(num_intervals, int(starts[keep].max() // interval_ms) + 1 if keep.any() else 0)
+
+    num_teams = len(TIMELINE_TEAMS)
+    totals = momentum_timeline(
+        starts[keep], ends[keep], points[keep], match_codes[keep] * num_teams + teams[keep],
+        len(matches) * num_teams, interval_ms, num_intervals, attribution
+    ).reshape(len(matches), num_teams, num_intervals)
+    return _timeline_frame(totals, matches if match_column else None, interval_seconds)
+
+
+def _timeline_frame(totals, matches, interval_seconds):
+    """Lay out a matches x teams x intervals array as one row per match and interval."""
+    num_matches, _, num_intervals = totals.shape
+    cumulative = np.cumsum(totals, axis=2)
+    interval = np.tile(np.arange(num_intervals), num_matches)
+    columns = {
+        'Interval': interval,
+        'Start_sec': interval * interval_seconds,
+        'End_sec': (interval + 1) * interval_seconds,
     }
-    
-    # Vectorized calculation
-    for i in range(num_intervals):
-        start_time = i * interval_seconds
-        end_time = (i + 1) * interval_seconds
-        
-        # Find events in this interval
-        mask = ((timestamps >= start_time) & (timestamps < end_time)) | \
-               ((timestamps < start_time) & (timestamps + durations > start_time))
-        
-        interval_events = events_df[mask]
-        
-        # Calculate momentum for interval
-        momentum_timeline[i] = sum(point_values.get(et, 0) for et in interval_events['Result'])
-    
-    return momentum_timeline
\ No newline at end of file
+    for position, team in enumerate(TIMELINE_TEAMS):
+        columns[team] = totals[:, position].ravel()
+    columns['Net'] = (totals[:, 0] - totals[:, 1]).ravel()
+    for position, team in enumerate(TIMELINE_TEAMS):
+        columns[f'Cumulative_{team}'] = cumulative[:, position].ravel()
+    columns['Cumulative_Net'] = (cumulative[:, 0] - cumulative[:, 1]).ravel()
+
+    timeline = pd.DataFrame(columns)
+    if matches is not None:
+        timeline.insert(0, 'Match', np.repeat(np.asarray(matches), num_intervals))
+    return timeline
\ No newline at end of file
@@ -0,0 +1,184 @@
+# overlap_resolver.py
+import heapq
+import logging
+
+import numpy as np
+import pandas as pd
+
+from errors import DataValidationError
+from match_data import parse_periods
+
+logger = logging.getLogger(__name__)
+
+RESOLUTION_MODES = ('trim', 'split')
+REPORT_COLUMNS = ['Row', 'Other_Row', 'Period', 'Overlap_Start', 'Overlap_End', 'Overlap_ms', 'Action']
+
+
+class OverlapResolver:
+    """Resolves overlapping Position/Duration clips with a sweep over sorted integer arrays."""
+
+    def __init__(self, overlap_settings=None):
+        """Initialize with overlap settings (mode, Põhimoment preference order, tolerance).
+
+        Resolution rewrites clip durations, so it only runs when enabled explicitly.
+        """
+        overlap_settings = overlap_settings or {}
+        self.enabled = overlap_settings.get('enabled', False)
+        self.mode = overlap_settings.get('mode', 'trim')
+        self.prefer = list(overlap_settings.get('prefer') or [])
+        self.min_overlap_ms = int(overlap_settings.get('min_overlap_ms', 0))
+        if self.mode not in RESOLUTION_MODES:
+            raise DataValidationError(f"Unknown overlap resolution mode: {self.mode}")
+
+    @property
+    def input_columns(self):
+        """Raw columns the resolver reads."""
+        columns = ['Position', 'Duration', 'Poolaeg']
+        return columns + ['Põhimoment'] if self.prefer else columns
+
+    def resolve(self, data):
+        """Resolve overlaps, returning a new frame and a report of every resolved overlap.
+
+        Each moment of overlapping time is given to one clip: the one with the most preferred
+        Põhimoment, and among equals the one that started last. In 'trim' mode a clip ends when
+        it first loses time to another clip, in 'split' mode it resumes as an extra row afterwards.
+        Clips that own no time are kept with zero duration so their tags are not lost.
+        """
+        if not self.enabled or len(data) < 2 or not {'Position', 'Duration'}.issubset(data.columns):
+            return data, _empty_report()
+
+        starts = data['Position'].to_numpy(dtype=np.int64)
+        ends = starts + data['Duration'].to_numpy(dtype=np.int64)
+        periods = parse_periods(data['Poolaeg']) if 'Poolaeg' in data.columns else np.ones(len(data), dtype=np.int64)
+        ranks = self._priority_ranks(data)
+
+        order, clusters = self._overlap_clusters(starts, ends, periods)
+        if not clusters:
+            return data, _empty_report()
+
+        # Rows outside overlap clusters keep their clip as a single piece
+        in_cluster = np.zeros(len(data), dtype=bool)
+        piece_rows, piece_starts, piece_ends, records = [], [], [], []
+        for cluster in clusters:
+            rows = order[cluster]
+            in_cluster[rows] = True
+            pieces, overlaps = self._sweep(rows, starts, ends, ranks)
+            for row in rows:
+                kept = pieces.get(row) or [(starts[row], starts[row])]
+                if self.mode == 'trim':
+                    kept = kept[:1]
+                piece_rows.extend([row] * len(kept))
+                piece_starts.extend(start for start, _ in kept)
+                piece_ends.extend(end for _, end in kept)
+            records.extend((loser, winner, periods[loser], start, end) for loser, winner, start, end in overlaps)
+
+        untouched = np.flatnonzero(~in_cluster)
+        piece_rows = np.concatenate([untouched, np.asarray(piece_rows, dtype=np.int64)])
+        piece_starts = np.concatenate([starts[untouched], np.asarray(piece_starts, dtype=np.int64)])
+        piece_ends = np.concatenate([ends[untouched], np.asarray(piece_ends, dtype=np.int64)])
+
+        # Keep the original row order, with split pieces of a clip following each other
+        take = np.lexsort((piece_starts, piece_rows))
+        resolved = data.iloc[piece_rows[take]].reset_index(drop=True).assign(
+            Position=piece_starts[take],
+            Duration=piece_ends[take] - piece_starts[take],
+        )
+
+        report = self._build_report(records, piece_rows, piece_ends - piece_starts, ends - starts)
+        if len(report):
+            kept_ms = np.bincount(piece_rows, weights=piece_ends - piece_starts, minlength=len(data))
+            shortened = int(np.count_nonzero(kept_ms < ends - starts))
+            removed_ms = int((ends - starts).sum() - kept_ms.sum())
+            logger.warning(
+                f"Overlap resolution ({self.mode}) shortened {shortened} of {len(data)} clips, removing "
+                f"{removed_ms / 1000:.1f}s of clip time in {len(report)} overlaps"
+            )
+        return resolved, report
+
+    def _priority_ranks(self, data):
+        """Rank rows by Põhimoment preference (higher wins, unlisted codes rank lowest)."""
+        if not self.prefer or 'Põhimoment' not in data.columns:
+            return np.zeros(len(data), dtype=np.int64)
+        codes = pd.Index(self.prefer).get_indexer(data['Põhimoment'].astype(object))
+        return np.where(codes >= 0, len(self.prefer) - codes, 0)
+
+    def _overlap_clusters(self, starts, ends, periods):
+        """Sort clips by period and start, and find runs of clips that overlap one another."""
+        order = np.lexsort((ends, starts, periods))
+        s, e, p = starts[order], ends[order], periods[order]
+
+        # Lay periods out one after another so a single running max end covers all of them
+        base = min(s.min(), e.min())
+        span = int(max(s.max(), e.max()) - base) + 1
+        period_rank = np.unique(p, return_inverse=True)[1].reshape(-1)
+        s = s - base + period_rank * span
+        e = e - base + period_rank * span
+
+        reach = np.maximum.accumulate(e)
+        new_cluster = np.r_[True, s[1:] >= reach[:-1] - self.min_overlap_ms]
+        bounds = np.flatnonzero(np.r_[new_cluster, True])
+        return order, [slice(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b - a > 1]
+
+    def _sweep(self, rows, starts, ends, ranks):
+        """Sweep the elementary segments of one cluster, giving each segment to one active clip."""
+        boundaries = np.unique(np.concatenate([starts[rows], ends[rows]]))
+        by_end = rows[np.argsort(ends[rows], kind='stable')]
+
+        heap, active = [], set()
+        next_start = next_end = 0
+        pieces, overlaps, current = {}, [], {}
+        for seg_start, seg_end in zip(boundaries[:-1].tolist(), boundaries[1:].tolist()):
+            while next_end < len(by_end) and ends[by_end[next_end]] <= seg_start:
+                active.discard(by_end[next_end])
+                next_end += 1
+            while next_start < len(rows) and starts[rows[next_start]] <= seg_start:
+                row = rows[next_start]
+                if ends[row] > seg_start:
+                    active.add(row)
+                    heapq.heappush(heap, (-ranks[row], -starts[row], -next_start, row))
+                next_start += 1
+            # Finished clips are only removed from the heap once they reach the top
+            while heap and heap[0][3] not in active:
+                heapq.heappop(heap)
+            if not heap:
+                continue
+
+            owner = heap[0][3]
+            owned = pieces.setdefault(owner, [])
+            if owned and owned[-1][1] == seg_start:
+                owned[-1] = (owned[-1][0], seg_end)
+            else:
+                owned.append((seg_start, seg_end))
+
+            for loser in active:
+                if loser == owner:
+                    continue
+                span = current.get((loser, owner))
+                if span is not None and span[1] == seg_start:
+                    span[1] = seg_end
+                else:
+                    span = current[(loser, owner)] = [seg_start, seg_end]
+                    overlaps.append((loser, owner, span))
+        return pieces, [(loser, owner, span[0], span[1]) for loser, owner, span in overlaps]
+
+    def _build_report(self, records, piece_rows, piece_lengths, lengths):
+        """Build the overlap report with the action taken on each clip that lost time."""
+        if not records:
+            return _empty_report()
+        report = pd.DataFrame(records, columns=REPORT_COLUMNS[:5])
+        report['Overlap_ms'] = report['Overlap_End'] - report['Overlap_Start']
+
+        piece_counts = np.bincount(piece_rows, minlength=len(lengths))
+        kept_ms = np.bincount(piece_rows, weights=piece_lengths, minlength=len(lengths))
+        rows = report['Row'].to_numpy()
+        report['Action'] = np.select(
+            [(kept_ms[rows] == 0) & (lengths[rows] > 0), piece_counts[rows] > 1],
+            ['covered', 'split'],
+            default='trimmed'
+        )
+        return report.sort_values(['Period', 'Overlap_Start', 'Row'], ignore_index=True)
+
+
+def _empty_report():
+    """Report with no resolved overlaps."""
+    return pd.DataFrame(columns=REPORT_COLUMNS)
\ No newline at end of file
@@ -2,11 +2,23 @@
 class SoccerAnalysisPipeline:
     """Orchestrates the complete data processing flow."""
     
-    def __init__(self, config_path=None):
-        """Initialize pipeline with optional configuration."""
+    def __init__(self, config_path=None, model_stack=None, scoring_model=None):
+        """Initialize pipeline with optional configuration, scoring models to compare and a compiled scoring model."""
         self.config = self._load_config(config_path) if config_path else self._default_config()
-        self.loader = DartfishLoader()
-        self.preprocessor = DataPreprocessor()
+        self.scoring_model = scoring_model or self.config.get('momentum_settings', {}).get('point_values')
+        self.loader = DartfishLoader(
+            self.config.get('match_store', {}),
+            schema=EventSchema(
+                self.config.get('taxonomies', {}),
+                strict=self.config.get('schema_settings', {}).get('strict', False)
+            )
+        )
+        self.preprocessor = DataPreprocessor(
+            self.config.get('momentum_settings', {}).get('interval_minutes', 5),
+            self.config.get('overlap_settings', {})
+        )
+        self.rollup_settings = self.config.get('rollup_settings', {})
+        self.model_stack = model_stack
         self.event_classifier = EventClassifier(self.config)
         self.analyzers = self._initialize_analyzers()
         self.cache_manager = CacheManager(self.config.get('cache_settings', {}))
@@ -14,29 +26,63 @@ class SoccerAnalysisPipeline:
     def _initialize_analyzers(self):
         """Initialize all analysis components."""
         return {
-            'momentum': MomentumAnalyzer(self.config.get('momentum_settings', {})),
+            'momentum': MomentumAnalyzer(self.config.get('momentum_settings', {}), self.scoring_model),
             'pressing': PressingAnalyzer(self.config.get('pressing_settings', {})),
             'possession': PossessionAnalyzer(self.config.get('possession_settings', {})),
             'player': PlayerAnalyzer(self.config.get('player_settings', {})),
         }
         
-    def process_match(self, first_half_path, second_half_path, cache_key=None):
+    def required_inputs(self, analyzer_names=None):
+        """Get the union of raw columns and derived fields the selected analyzers need."""
+        names = analyzer_names or list(self.analyzers)
+        columns, derived_fields = [], []
+        for name in names:
+            analyzer = self.analyzers[name]
+            if getattr(analyzer, 'input_columns', None) is None:
+                # Analyzer does not declare its inputs - load and derive everything
+                return None, None
+            columns.extend(col for col in analyzer.input_columns if col not in columns)
+            derived_fields.extend(f for f in analyzer.derived_fields if f not in derived_fields)
+            
+        columns.extend(col for col in self.preprocessor.required_columns(derived_fields) if col not in columns)
+        if self.preprocessor.overlap_resolver.enabled:
+            columns.extend(col for col in self.preprocessor.overlap_resolver.input_columns if col not in columns)
+        return columns, derived_fields
+        
+    def process_match(self, first_half_path, second_half_path, cache_key=None, analyzer_names=None):
         """Process a complete match through the entire pipeline."""
         # Check cache first if caching enabled
         if cache_key and self.cache_manager.has_cache(cache_key):
             return self.cache_manager.get_cache(cache_key)
             
-        # Load and preprocess data
-        raw_data = self.loader.load_match(first_half_path, second_half_path)
-        preprocessed_data = self.preprocessor.preprocess(raw_data)
+        # Load and preprocess only what the requested analyzers need
+        columns, derived_fields = self.required_inputs(analyzer_names)
+        raw_data = self.loader.load_match_data(first_half_path, second_half_path, columns=columns)
+        preprocessed_data = self.preprocessor.preprocess(raw_data, derived_fields=derived_fields)
         
-        # Classify events
-        classified_events = self.event_classifier.classify(preprocessed_data)
+        # Classify events on one read-only frame whose derived columns are shared by all analyzers
+        match_frame = MatchFrame(preprocessed_data)
+        classified_events = self.event_classifier.classify(match_frame)
         
-        # Run all analyzers
+        # Run requested analyzers
         results = {}
-        for name, analyzer in self.analyzers.items():
-            results[name] = analyzer.analyze(classified_events)
+        for name in analyzer_names or self.analyzers:
+            results[name] = self.analyzers[name].analyze(classified_events)
+            
+        # Per-interval metrics once in base bins, any interval length is then a sum of bins
+        if self.rollup_settings.get('enabled', True) and 'Match_Time_sec' in preprocessed_data.columns:
+            results['rollup'] = IntervalRollup.from_events(
+                preprocessed_data, base_minutes=self.rollup_settings.get('base_minutes', 1),
+                scoring_model=self.scoring_model
+            )
+        
+        # Preprocessed events seed the live state of later incremental updates
+        if 'Match_Time_sec' in preprocessed_data.columns:
+            results['events'] = preprocessed_data
+        
+        # Per-minute momentum of both sides under every compared model (models x teams x minutes)
+        if self.model_stack is not None and 'Match_Time_sec' in preprocessed_data.columns:
+            results['model_momentum'] = self.model_stack.score_teams(preprocessed_data, interval_minutes=1)
         
         # Cache results if caching enabled
         if cache_key:
@@ -1,23 +1,104 @@
 # preprocessor.py
+import numpy as np
+import pandas as pd
+
+from match_data import MatchData
+from overlap_resolver import OverlapResolver
+
+# Raw columns each derived field is computed from
+DERIVED_FIELD_INPUTS = {
+    'Position_sec': ['Position'],
+    'Duration_sec': ['Duration'],
+    'End_Position_sec': ['Position', 'Duration'],
+    'Half': ['Poolaeg'],
+    'Match_Time_sec': ['Position', 'Poolaeg'],
+    'Interval': ['Position', 'Poolaeg'],
+    'Interval_Label': ['Position', 'Poolaeg'],
+}
+
+
 class DataPreprocessor:
     """Handles data preprocessing before analysis."""
     
-    def preprocess(self, raw_data):
-        """Run full preprocessing pipeline."""
-        data = self._clean_data(raw_data)
-        data = self._normalize_times(data)
-        data = self._resolve_overlaps(data)
-        data = self._add_derived_fields(data)
+    def __init__(self, interval_minutes=5, overlap_settings=None):
+        """Initialize with the analysis interval length and overlap resolution settings."""
+        self.interval_minutes = interval_minutes
+        self.overlap_resolver = OverlapResolver(overlap_settings)
+        self.overlap_report = None
+        
+    @staticmethod
+    def required_columns(derived_fields=None):
+        """Get the raw columns needed to derive the given fields (all fields if None)."""
+        fields = DERIVED_FIELD_INPUTS if derived_fields is None else derived_fields
+        columns = []
+        for field in fields:
+            for col in DERIVED_FIELD_INPUTS.get(field, []):
+                if col not in columns:
+                    columns.append(col)
+        return columns
+        
+    def preprocess(self, raw_data, derived_fields=None):
+        """Run full preprocessing pipeline, deriving only the requested fields."""
+        fields = set(DERIVED_FIELD_INPUTS if derived_fields is None else derived_fields)
+        match = raw_data if isinstance(raw_data, MatchData) else None
+        data = self._clean_data(match.events if match else raw_data)
+        resolved = self._resolve_overlaps(data)
+        if resolved is not data:
+            # Clip times changed, so period offsets have to be measured again
+            data, match = resolved, None
+        data = self._normalize_times(data, fields, match)
+        data = self._add_derived_fields(data, fields)
         return data
         
     def _clean_data(self, data):
         """Clean raw data by handling missing values and encoding issues."""
+        if 'Position' in data.columns:
+            data = data.dropna(subset=['Position'])
+        return data.reset_index(drop=True)
         
-    def _normalize_times(self, data):
-        """Convert timestamps to match time (seconds from kickoff)."""
+    def _normalize_times(self, data, fields, match=None):
+        """Compute all time columns from integer milliseconds in one pass, returning a new frame."""
+        if 'Poolaeg' in data.columns and fields & {'Half', 'Match_Time_sec', 'Interval', 'Interval_Label'}:
+            # Period offsets come from the actual length of earlier periods, not a fixed 45 minutes
+            if match is None or len(match) != len(data):
+                match = MatchData.from_events(data)
+                data = match.events
+        else:
+            match = None
+            
+        columns = {}
+        position_ms = data['Position'].to_numpy(dtype=np.int64) if 'Position' in data.columns else None
+        duration_ms = data['Duration'].to_numpy(dtype=np.int64) if 'Duration' in data.columns else None
+        if position_ms is not None and 'Position_sec' in fields:
+            columns['Position_sec'] = position_ms / 1000
+        if duration_ms is not None and 'Duration_sec' in fields:
+            columns['Duration_sec'] = duration_ms / 1000
+        if position_ms is not None and duration_ms is not None and 'End_Position_sec' in fields:
+            columns['End_Position_sec'] = (position_ms + duration_ms) / 1000
+            
+        if match is not None:
+            match_time_ms = match.match_time_ms()
+            columns['Half'] = match.period_of_rows()
+            columns['Match_Time_sec'] = match_time_ms / 1000
+            columns['Interval'] = match_time_ms // (self.interval_minutes * 60000)
+        return data.assign(**columns)
         
     def _resolve_overlaps(self, data):
-        """Handle overlapping events by splitting or prioritizing."""
+        """Handle overlapping events by splitting or prioritizing, keeping a report of each overlap."""
+        data, self.overlap_report = self.overlap_resolver.resolve(data)
+        return data
         
-    def _add_derived_fields(self, data):
-        """Add calculated fields needed for analysis."""
\ No newline at end of file
+    def _add_derived_fields(self, data, fields):
+        """Add calculated fields needed for analysis."""
+        if 'Interval' in data.columns and 'Interval_Label' in fields:
+            # One label string per interval shared by all rows instead of formatting every row
+            intervals = data['Interval'].to_numpy()
+            labels = [
+                f"{i * self.interval_minutes}-{(i + 1) * self.interval_minutes}"
+                for i in range(int(intervals.max()) + 1 if len(intervals) else 0)
+            ]
+            data = data.assign(Interval_Label=pd.Categorical.from_codes(intervals, categories=labels, ordered=True))
+            
+        # Helper columns that were only needed to derive other fields
+        helpers = [col for col in ['Half', 'Match_Time_sec', 'Interval'] if col in data.columns and col not in fields]
+        return data.drop(columns=helpers)
\ No newline at end of file
@@ -0,0 +1,132 @@
+# pressing_cube.py
+import logging
+
+import numpy as np
+import pandas as pd
+
+from errors import AnalysisError
+from event_processor import PRESSING_TEAMS, classify_presses
+from event_schema import DEFAULT_CODE_TABLES
+from match_data import parse_periods
+
+logger = logging.getLogger(__name__)
+
+PRESSING_CODES = DEFAULT_CODE_TABLES['pressing']
+
+# Counts kept per cell; PPDA is passes (KEEPPOS) per successful non-KEEPPOS press
+PRESSING_MEASURES = ['presses', 'successful', 'passes', 'defensive_actions']
+CUBE_AXES = ['team', 'zone', 'half', 'interval']
+
+
+class PressingCube:
+    """Pressing counts per team x zone x half x interval, every pressing table is a sum over its axes."""
+
+    def __init__(self, counts, base_minutes=1):
+        """Initialize from a measures x teams x zones x halves x intervals count array."""
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.base_minutes = base_minutes
+
+    @classmethod
+    def from_events(cls, events, base_minutes=1):
+        """Count presses of preprocessed events in one bincount over the finest cells."""
+        if 'Match_Time_sec' not in events.columns:
+            raise AnalysisError("Pressing cube needs Match_Time_sec from DataPreprocessor")
+        teams, successful = classify_presses(events)
+        pressed = teams >= 0
+        presses, teams, successful = events[pressed], teams[pressed], successful[pressed]
+        zones = pd.Index(PRESSING_CODES).get_indexer(presses['Pressing'].astype(object))
+        if (zones < 0).any():
+            logger.warning(f"Skipping unknown pressing codes: {sorted(set(presses['Pressing'].astype(str)[zones < 0]))}")
+            known = zones >= 0
+            presses, zones, teams, successful = presses[known], zones[known], teams[known], successful[known]
+        halves = (presses['Half'].to_numpy() if 'Half' in presses.columns
+                  else parse_periods(presses['Poolaeg'])).astype(np.int64) - 1
+        intervals = (presses['Match_Time_sec'].to_numpy(dtype=float) // (base_minutes * 60)).astype(np.int64)
+
+        passes = (presses['Result'].astype(object) == 'KEEPPOS').to_numpy()
+        measures = np.vstack([np.ones(len(presses)), successful, passes, successful & ~passes])
+
+        shape = (len(PRESSING_TEAMS), len(PRESSING_CODES),
+                 int(halves.max()) + 1 if len(halves) else 2, int(intervals.max()) + 1 if len(intervals) else 0)
+        cells = np.ravel_multi_index((teams, zones, halves, intervals), shape)
+        size = int(np.prod(shape))
+        flat = (np.arange(len(PRESSING_MEASURES))[:, None] * size + cells[None, :]).ravel()
+        counts = np.bincount(flat, weights=measures.ravel(), minlength=len(PRESSING_MEASURES) * size)
+        return cls(counts.reshape((len(PRESSING_MEASURES),) + shape).round().astype(np.int64), base_minutes)
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """Restore a cube saved with to_arrays."""
+        return cls(arrays['counts'], int(arrays['base_minutes'][0]))
+
+    def to_arrays(self):
+        """Export the cube as plain numpy arrays for storage."""
+        return {'counts': self.counts, 'base_minutes': np.array([self.base_minutes])}
+
+    def merge(self, other):
+        """Sum with another cube (e.g. the next match of a tournament), padding halves and intervals."""
+        if other.base_minutes != self.base_minutes:
+            raise AnalysisError("Cannot merge pressing cubes with different base bins")
+        shape = np.maximum(self.counts.shape, other.counts.shape)
+        counts = np.zeros(shape, dtype=np.int64)
+        for cube in (self, other):
+            counts[tuple(slice(0, n) for n in cube.counts.shape)] += cube.counts
+        return PressingCube(counts, self.base_minutes)
+
+    def total(self, measure):
+        """Match (or tournament) total of one measure."""
+        return int(self.counts[PRESSING_MEASURES.index(measure)].sum())
+
+    def table(self, *axes, interval_minutes=None):
+        """Presses, successful presses and success rate per combination of the given axes.
+
+        Only combinations with at least one press are listed, as a groupby would.
+        """
+        unknown = [axis for axis in axes if axis not in CUBE_AXES]
+        if unknown:
+            raise AnalysisError(f"Unknown pressing cube axes {unknown}, expected some of {CUBE_AXES}")
+        counts = self.counts[:2]
+        if 'interval' in axes and interval_minutes:
+            counts = self._coarsen(counts, interval_minutes)
+        summed = tuple(i + 1 for i, axis in enumerate(CUBE_AXES) if axis not in axes)
+        counts = counts.sum(axis=summed)
+        # Keep the order of the requested axes
+        kept = [axis for axis in CUBE_AXES if axis in axes]
+        counts = np.moveaxis(counts, [kept.index(axis) + 1 for axis in axes], range(1, len(axes) + 1))
+
+        labels = [self._labels(axis, counts.shape[i + 1], interval_minutes) for i, axis in enumerate(axes)]
+        if len(axes) > 1:
+            index = pd.MultiIndex.from_product(labels, names=list(axes))
+        else:
+            index = pd.Index(labels[0], name=axes[0]) if axes else pd.RangeIndex(1)
+        table = pd.DataFrame({'total': counts[0].ravel(), 'successful': counts[1].ravel()}, index=index)
+        table = table[table['total'] > 0]
+        table['success_rate'] = (table['successful'] / table['total'] * 100).round(1)
+        return table
+
+    def ppda(self, team=None):
+        """Passes per defensive action (inf without defensive actions)."""
+        counts = self.counts if team is None else self.counts[:, [PRESSING_TEAMS.index(team)]]
+        passes = counts[PRESSING_MEASURES.index('passes')].sum()
+        actions = counts[PRESSING_MEASURES.index('defensive_actions')].sum()
+        return round(passes / actions, 2) if actions else float('inf')
+
+    def _coarsen(self, counts, interval_minutes):
+        """Sum base bins into intervals of interval_minutes."""
+        if interval_minutes % self.base_minutes:
+            raise AnalysisError(f"Interval of {interval_minutes} minutes is not a multiple of the base bins")
+        factor = interval_minutes // self.base_minutes
+        if not counts.shape[-1]:
+            return counts
+        return np.add.reduceat(counts, np.arange(0, counts.shape[-1], factor), axis=-1)
+
+    def _labels(self, axis, size, interval_minutes):
+        """Labels along one axis."""
+        if axis == 'team':
+            return PRESSING_TEAMS
+        if axis == 'zone':
+            return PRESSING_CODES
+        if axis == 'half':
+            return list(range(1, size + 1))
+        return list(range(size)) if not interval_minutes else \
+            [f"{i * interval_minutes}-{(i + 1) * interval_minutes}" for i in range(size)]
\ No newline at end of file
@@ -0,0 +1,178 @@
+# pressing_intensity.py
+import numpy as np
+import pandas as pd
+
+from errors import AnalysisError
+from event_processor import classify_presses
+
+INTENSITY_TEAMS = ['Estonia', 'Opponent']
+
+# Measures per pressing team: passes allowed per defensive action gives PPDA
+INTENSITY_MEASURES = ['Presses', 'Successful', 'Passes_Allowed', 'Defensive_Actions']
+
+# Provider feed events counted as defensive actions, pass events are the opponent's passes allowed.
+# Recoveries always succeed, so only tackles and interceptions count as presses with a success rate
+FEED_DEFENSIVE_EVENTS = ['tackle', 'interception', 'recovery']
+FEED_PRESS_EVENTS = ['tackle', 'interception']
+FEED_PASS_EVENT = 'pass'
+FEED_HOME_TEAM = 'ESTONIA'
+
+
+def pressing_actions(events, match_column=None, home_team=FEED_HOME_TEAM):
+    """One row per counted action with its match time, pressing team and measures.
+
+    Dartfish tags need Match_Time_sec from DataPreprocessor: presses of Estonia and the
+    opponent and their success come from classify_presses, KEEPPOS results are passes
+    allowed and other successful presses defensive actions, as in PressingCube. Provider feeds (Event,
+    Team, Football time) count tackles and interceptions as presses, those and recoveries as
+    defensive actions of their team and passes as passes allowed by the other team.
+    """
+    if 'Pressing' in events.columns and 'Match_Time_sec' in events.columns:
+        teams, successful = classify_presses(events)
+        # Transition presses belong to neither side
+        teams = np.where(teams > 1, -1, teams)
+        passes = (events['Result'].astype(object) == 'KEEPPOS').to_numpy()
+        measures = [teams >= 0, successful, passes, successful & ~passes]
+        times = events['Match_Time_sec'].to_numpy(dtype=float)
+    elif {'Event', 'Team', 'Football time'} <= set(events.columns):
+        event = events['Event'].astype(object)
+        home = events['Team'].astype(str).str.upper().str.contains(home_team.upper(), regex=False).to_numpy()
+        defensive = event.isin(FEED_DEFENSIVE_EVENTS).to_numpy()
+        presses = event.isin(FEED_PRESS_EVENTS).to_numpy()
+        passes = (event == FEED_PASS_EVENT).to_numpy()
+        outcome = events['outcome'].astype(object) if 'outcome' in events.columns else pd.Series('success', index=events.index)
+        successful = presses & (outcome == 'success').to_numpy()
+        # A pass is allowed by the team not making it
+        teams = np.where(defensive, np.where(home, 0, 1), np.where(home, 1, 0))
+        teams = np.where(defensive | passes, teams, -1)
+        measures = [presses, successful, passes, defensive]
+        times = feed_match_times(events, match_column)
+    else:
+        raise AnalysisError("Pressing intensity needs preprocessed Dartfish tags (Pressing, Match_Time_sec) "
+                            "or a provider feed (Event, Team, Football time)")
+
+    counted = teams >= 0
+    actions = pd.DataFrame({'Time_sec': times[counted], 'Team': teams[counted]})
+    for name, values in zip(INTENSITY_MEASURES, measures):
+        actions[name] = values[counted].astype(np.int64)
+    if match_column:
+        actions.insert(0, match_column, events[match_column].to_numpy()[counted])
+    return actions
+
+
+def feed_match_times(events, match_column=None):
+    """Provider feed Football time on one continuous clock per match.
+
+    The feed clock restarts every half at its nominal start (2700 s for the second half)
+    while stoppage time runs on, so each half is moved to start where the last event of
+    the half before it ended.
+    """
+    times = events['Football time'].to_numpy(dtype=float)
+    if 'Half' not in events.columns or not len(events):
+        return times
+    halves = pd.DataFrame({
+        'Match': events[match_column].to_numpy() if match_column else 0,
+        'Half': events['Half'].astype(object).to_numpy(),
+        'Time': times,
+    })
+    bounds = (halves.groupby(['Match', 'Half'])['Time'].agg(['min', 'max'])
+              .reset_index().sort_values(['Match', 'min'], ignore_index=True))
+    # A half starts at the first half's start plus the lengths of the halves before it
+    lengths = bounds['max'] - bounds['min']
+    starts = bounds.groupby('Match')['min'].transform('first') + lengths.groupby(bounds['Match']).cumsum() - lengths
+    rows = pd.MultiIndex.from_frame(bounds[['Match', 'Half']]).get_indexer(
+        pd.MultiIndex.from_frame(halves[['Match', 'Half']])
+    )
+    # Rows without a half (-1) keep their clock
+    offsets = np.append((starts - bounds['min']).to_numpy(), 0.0)
+    return times + offsets[rows]
+
+
+def rolling_pressing(actions, window_seconds=300, times=None, step_seconds=60, match_column=None):
+    """Presses, success rate and PPDA of both teams over trailing windows (t - window, t].
+
+    Window ends are every step_seconds up to the last action of each match, or the given
+    times (a frame with Time_sec and match_column for stacked matches). Actions are sorted by
+    match and time once and summed into prefix sums, so every window is two binary searches
+    and a difference whatever its length.
+    """
+    if window_seconds <= 0:
+        raise AnalysisError(f"Pressing window must be positive, got {window_seconds}s")
+    if match_column:
+        match_codes, matches = pd.factorize(actions[match_column], sort=True)
+    else:
+        match_codes, matches = np.zeros(len(actions), dtype=np.int64), pd.Index([None])
+    action_times = actions['Time_sec'].to_numpy(dtype=float)
+    order = np.lexsort((action_times, match_codes))
+    match_codes, action_times = match_codes[order], action_times[order]
+
+    # Prefix sums of every team x measure column in match, time order
+    columns = np.zeros((len(actions), len(INTENSITY_TEAMS) * len(INTENSITY_MEASURES)))
+    teams = actions['Team'].to_numpy(dtype=np.int64)[order]
+    for position, name in enumerate(INTENSITY_MEASURES):
+        columns[np.arange(len(actions)), teams * len(INTENSITY_MEASURES) + position] = actions[name].to_numpy()[order]
+    prefix = np.vstack([np.zeros((1, columns.shape[1])), np.cumsum(columns, axis=0)])
+
+    if times is None:
+        ends = np.zeros(len(matches))
+        if len(actions):
+            np.maximum.at(ends, match_codes, action_times)
+        counts = np.floor(ends / step_seconds).astype(np.int64) + 1
+        query_codes = np.repeat(np.arange(len(matches)), counts)
+        query_times = (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)) * step_seconds
+        query_matches = np.asarray(matches, dtype=object)[query_codes]
+    else:
+        query_times = np.asarray(times['Time_sec'] if isinstance(times, pd.DataFrame) else times, dtype=float)
+        query_matches = np.asarray(times[match_column]) if match_column else None
+        # Windows of matches without actions stay empty
+        query_codes = matches.get_indexer(query_matches) if match_column else np.zeros(len(query_times), dtype=np.int64)
+    query_times = query_times.astype(float)
+
+    # Offset each match on one time axis so all windows are found in one searchsorted
+    span = max(action_times.max(initial=0), query_times.max(initial=0)) + window_seconds + 1
+    keys = match_codes * span + action_times
+    lower = query_codes * span + np.maximum(query_times - window_seconds, -0.5)
+    upper = query_codes * span + query_times
+    window = prefix[np.searchsorted(keys, upper, side='right')] - prefix[np.searchsorted(keys, lower, side='right')]
+    window[query_codes < 0] = 0
+    window = window.reshape(len(query_times), len(INTENSITY_TEAMS), len(INTENSITY_MEASURES))
+    return _intensity_frame(window, query_times, window_seconds, query_matches, match_column)
+
+
+def pressing_overlay(timeline, events, window_seconds=None, time_column='End_sec', match_column=None,
+                     home_team=FEED_HOME_TEAM):
+    """Add pressing intensity of the window ending at each momentum timeline row.
+
+    By default the window is the timeline interval (End_sec - Start_sec), so every row
+    gets the pressing of its own interval; a longer window gives a trailing view.
+    """
+    if time_column not in timeline.columns:
+        raise AnalysisError(f"Momentum timeline has no '{time_column}' column")
+    if window_seconds is None:
+        if 'Start_sec' not in timeline.columns or not len(timeline):
+            raise AnalysisError("Pass window_seconds for a timeline without Start_sec")
+        window_seconds = float((timeline[time_column] - timeline['Start_sec']).median())
+    actions = pressing_actions(events, match_column, home_team)
+    query = pd.DataFrame({'Time_sec': timeline[time_column].to_numpy()})
+    if match_column:
+        query[match_column] = timeline[match_column].to_numpy()
+    intensity = rolling_pressing(actions, window_seconds, query, match_column=match_column)
+    intensity = intensity.drop(columns=[col for col in ['Time_sec', 'Window_Start_sec', match_column] if col])
+    intensity.index = timeline.index
+    return pd.concat([timeline, intensity], axis=1)
+
+
+def _intensity_frame(window, times, window_seconds, matches, match_column):
+    """Windowed counts (windows x teams x measures) as a frame with rates and PPDA per team."""
+    presses, successful, passes, actions = (window[:, :, i] for i in range(len(INTENSITY_MEASURES)))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        success_rate = np.where(presses > 0, successful / presses * 100, np.nan).round(1)
+        ppda = np.where(actions > 0, passes / actions, np.nan).round(2)
+    frame = pd.DataFrame({'Time_sec': times, 'Window_Start_sec': np.maximum(times - window_seconds, 0)})
+    for team, name in enumerate(INTENSITY_TEAMS):
+        frame[f'Presses_{name}'] = presses[:, team].astype(np.int64)
+        frame[f'Success_Rate_{name}'] = success_rate[:, team]
+        frame[f'PPDA_{name}'] = ppda[:, team]
+    if match_column:
+        frame.insert(0, match_column, matches)
+    return frame
\ No newline at end of file
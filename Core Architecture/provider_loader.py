@@ -0,0 +1,66 @@
+# provider_loader.py
+import json
+import logging
+
+import pandas as pd
+
+from errors import DataValidationError
+from match_store import MatchStore
+
+logger = logging.getLogger(__name__)
+
+CATEGORICAL_COLUMNS = ['Half', 'Event', 'Player', 'Team']
+
+
+class ProviderEventLoader:
+    """Loads provider event feeds (e.g. game-51856-events.csv) with expanded Details."""
+
+    DETAILS_COLUMN = 'Details'
+    KEY_PREFIX = 'provider-'
+
+    def __init__(self, store_settings=None):
+        """Initialize with optional columnar match store settings."""
+        self.store = MatchStore(store_settings)
+
+    def load_file(self, filepath):
+        """Load an event feed and expand its Details column, using the store when possible."""
+        key = self.KEY_PREFIX + self.store.content_key(filepath) if self.store.enabled else None
+        if key and self.store.has(key):
+            return self.store.read(key)
+
+        try:
+            raw_data = pd.read_csv(filepath, sep=';', encoding='utf-8-sig')
+        except pd.errors.ParserError as e:
+            raise DataValidationError(f"Error parsing event feed {filepath}: {e}") from e
+
+        data = self.expand_details(raw_data)
+        if key:
+            self.store.write(key, data)
+        return data
+
+    def expand_details(self, data):
+        """Turn the per-row JSON objects in Details into typed categorical columns."""
+        if self.DETAILS_COLUMN not in data.columns:
+            raise DataValidationError(f"Event feed has no '{self.DETAILS_COLUMN}' column")
+
+        # Decode the whole column as one JSON array instead of one json.loads per row
+        details = data[self.DETAILS_COLUMN].fillna('{}').astype(str)
+        try:
+            records = json.loads('[' + ','.join(details) + ']')
+        except json.JSONDecodeError as e:
+            raise DataValidationError(f"Malformed JSON in {self.DETAILS_COLUMN} column: {e}") from e
+
+        expanded = pd.DataFrame.from_records(records, index=data.index)
+        # Keep detail keys from shadowing the feed's own columns
+        expanded = expanded.rename(columns={
+            col: f"detail_{col}" for col in expanded.columns if col in data.columns
+        })
+        for col in expanded.columns:
+            if expanded[col].dtype == object or pd.api.types.is_string_dtype(expanded[col]):
+                expanded[col] = expanded[col].astype('category')
+
+        result = pd.concat([data.drop(columns=[self.DETAILS_COLUMN]), expanded], axis=1)
+        for col in CATEGORICAL_COLUMNS:
+            if col in result.columns:
+                result[col] = result[col].astype('category')
+        return result
\ No newline at end of file
@@ -1,4 +1,9 @@
 # scoring_model.py
+import copy
+
+from momentum_scorer import DEFAULT_SCORING_MODEL, CompiledScoringModel, ScoringModelStack
+
+
 class ScoringModelManager:
     """Manages scoring models with version control and validation."""
     
@@ -24,6 +29,18 @@ class ScoringModelManager:
             logger.warning(f"Scoring model {model_name} not found, using defaults")
             return self._default_model()
         
+    def compile_model(self, model_name=None, encoder=None):
+        """Compile a model (the current one by default) into per-event-class lookup weights."""
+        model = self.load_model(model_name) if model_name else self.get_current_model()
+        return CompiledScoringModel(model, encoder)
+        
+    def compile_all_models(self, encoder=None):
+        """Compile every available model (the current one if none are saved) for side-by-side scoring."""
+        names = self.list_available_models()
+        if not names:
+            return ScoringModelStack({'current': self.get_current_model()}, encoder)
+        return ScoringModelStack({name: self.load_model(name) for name in sorted(names)}, encoder)
+        
     def _validate_model(self, model):
         """Validate scoring model structure and values."""
         # Check required sections
@@ -39,34 +56,7 @@ class ScoringModelManager:
         
     def _default_model(self):
         """Provide default scoring model."""
-        return {
-            "metadata": {
-                "name": "default",
-                "description": "Default scoring model",
-                "version": "1.0",
-                "created": "2025-04-28"
-            },
-            "point_values": {
-                "SHOTGOAL": 20.0,
-                "SHOTON": 4.0,
-                "SHOTBLOCK": 3.0,
-                "SHOTOFF": 2.0,
-                "ENTRY": 1.0,
-                # ...etc
-            },
-            "multipliers": {
-                "zone": {
-                    "S1": 0.8,
-                    "S2": 1.0,
-                    "S3": 1.2
-                },
-                "pressing": {
-                    "HIGHPRESS": 1.5,
-                    "MIDPRESS": 1.0,
-                    "LOWPRESS": 0.7
-                }
-            }
-        }
+        return copy.deepcopy(DEFAULT_SCORING_MODEL)
         
     def save_model(self, model_name, model_data):
         """Save scoring model to file."""
@@ -0,0 +1,200 @@
+# season_dataset.py
+import json
+import logging
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from errors import DataValidationError
+from event_schema import COLUMN_TAXONOMIES
+from match_data import MatchData
+from tag_index import TagIndex
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - optional dependency
+    feather = None
+
+logger = logging.getLogger(__name__)
+
+PARTITION_KEYS = ['tournament', 'match', 'half']
+
+
+class SeasonDataset:
+    """Append-only season event dataset partitioned by tournament, match and half."""
+
+    CATALOG_NAME = '_catalog.json'
+
+    def __init__(self, dataset_settings=None):
+        """Initialize with dataset settings, loading the partition catalog."""
+        if feather is None:
+            raise ImportError("pyarrow is required for the season dataset")
+        dataset_settings = dataset_settings or {}
+        self.path = dataset_settings.get('path', './data/season')
+        self.catalog_path = os.path.join(self.path, self.CATALOG_NAME)
+        self.partitions = []
+        if os.path.exists(self.catalog_path):
+            with open(self.catalog_path, 'r', encoding='utf-8') as f:
+                self.partitions = json.load(f)
+
+    def append(self, tournament, match_id, events, teams=None, source_key=None):
+        """Append a match as one new file per half; existing files are never rewritten."""
+        if source_key and any(p.get('source_key') == source_key for p in self.partitions):
+            logger.info(f"{match_id} already in season dataset, skipping")
+            return []
+
+        match = events if isinstance(events, MatchData) else MatchData.from_events(events)
+        teams = teams or self._teams_from_match_id(match_id)
+        new_partitions = []
+        for period in match.periods:
+            part = match.period(period).reset_index(drop=True)
+            directory = os.path.join(
+                self.path, f"tournament={_safe(tournament)}", f"match={_safe(match_id)}", f"half={period}"
+            )
+            os.makedirs(directory, exist_ok=True)
+            file_path = os.path.join(directory, f"part-{self._next_part_number(directory):05d}.feather")
+            feather.write_feather(part, file_path, compression='uncompressed')
+
+            ends = part['Position'].to_numpy() + part['Duration'].to_numpy()
+            new_partitions.append({
+                'tournament': tournament,
+                'match': match_id,
+                'half': int(period),
+                'file': os.path.relpath(file_path, self.path),
+                'rows': len(part),
+                'min_time': int(part['Position'].min()) if len(part) else 0,
+                'max_time': int(ends.max()) if len(part) else 0,
+                'teams': teams,
+                'tag_counts': self._tag_counts(part),
+                'source_key': source_key,
+            })
+
+        self.partitions.extend(new_partitions)
+        self._save_catalog()
+        return new_partitions
+
+    def prune(self, tournament=None, match=None, half=None, tags=None, time_range=None, team=None):
+        """Select partitions that can hold matching rows using only catalog statistics."""
+        selected = []
+        for partition in self.partitions:
+            if not (_matches(partition['tournament'], tournament) and _matches(partition['match'], match)
+                    and _matches(partition['half'], half)):
+                continue
+            if team is not None and team not in partition['teams']:
+                continue
+            if tags and any(partition['tag_counts'].get(tag, 0) == 0 for tag in tags):
+                continue
+            if time_range and (partition['max_time'] <= time_range[0] or partition['min_time'] >= time_range[1]):
+                continue
+            selected.append(partition)
+        return selected
+
+    def scan(self, tournament=None, match=None, half=None, tags=None, time_range=None, team=None, columns=None):
+        """Read matching rows, opening only the partitions the predicates cannot rule out."""
+        frames = [
+            self._read_partition(partition, tags, time_range, columns)
+            for partition in self.prune(tournament, match, half, tags, time_range, team)
+        ]
+        frames = [frame for frame in frames if len(frame)]
+        if not frames:
+            return pd.DataFrame(columns=PARTITION_KEYS + (columns or []))
+        return pd.concat(frames, ignore_index=True)
+
+    def iter_matches(self, **predicates):
+        """Yield (tournament, match_id, MatchData) of filtered scans for the analyzers."""
+        events = self.scan(**predicates)
+        if events.empty:
+            return
+        for (tournament, match_id), match_events in events.groupby(['tournament', 'match'], sort=False):
+            match_events = match_events.drop(columns=['tournament', 'match'])
+            yield tournament, match_id, MatchData.from_events(match_events, period_column='half')
+
+    def _read_partition(self, partition, tags, time_range, columns):
+        """Read one partition file and apply row-level predicates."""
+        read_columns = None
+        if columns is not None:
+            # Name is needed for tag filtering even when it is not requested
+            read_columns = list(dict.fromkeys(columns + (['Name'] if tags else []) +
+                                              (['Position', 'Duration'] if time_range else [])))
+        table = feather.read_table(os.path.join(self.path, partition['file']), columns=read_columns,
+                                   memory_map=True)
+        frame = table.to_pandas()
+
+        mask = np.ones(len(frame), dtype=bool)
+        if tags:
+            mask &= self._tag_mask(frame, tags)
+        if time_range:
+            start, end = frame['Position'].to_numpy(), frame['Position'].to_numpy() + frame['Duration'].to_numpy()
+            mask &= (start < time_range[1]) & (end > time_range[0])
+        frame = frame[mask]
+        if columns is not None:
+            frame = frame[[col for col in columns if col in frame.columns]]
+
+        for i, key in enumerate(PARTITION_KEYS):
+            frame.insert(i, key, partition[key])
+        return frame
+
+    def _tag_mask(self, frame, tags):
+        """Rows carrying every tag, via the Name token index or the taxonomy columns."""
+        if 'Name' in frame.columns:
+            return TagIndex.build(frame['Name']).mask(tags, how='all')
+
+        mask = np.ones(len(frame), dtype=bool)
+        for tag in tags:
+            tag_mask = np.zeros(len(frame), dtype=bool)
+            for col in COLUMN_TAXONOMIES:
+                if col in frame.columns:
+                    tag_mask |= (frame[col] == tag).to_numpy(dtype=bool, na_value=False)
+            mask &= tag_mask
+        return mask
+
+    def _tag_counts(self, part):
+        """Count tags in a partition for predicate pushdown."""
+        if 'Name' in part.columns:
+            return TagIndex.build(part['Name']).token_counts()
+
+        counts = {}
+        for col in COLUMN_TAXONOMIES:
+            if col in part.columns:
+                for tag, count in part[col].value_counts().items():
+                    counts[str(tag)] = counts.get(str(tag), 0) + int(count)
+        return counts
+
+    def _next_part_number(self, directory):
+        """Get the next free part file number in a partition directory."""
+        numbers = [int(m.group(1)) for m in map(re.compile(r'^part-(\d+)\.feather$').match, os.listdir(directory)) if m]
+        return max(numbers, default=-1) + 1
+
+    def _teams_from_match_id(self, match_id):
+        """Read team names from a match id like '2025.04.14 U17 Eesti - Gruusia'."""
+        title = re.sub(r'^\d{4}\.\d{2}\.\d{2}\s+(U\d+\s+)?', '', os.path.basename(match_id))
+        return [team.strip() for team in title.split(' - ')] if ' - ' in title else []
+
+    def _save_catalog(self):
+        """Write the catalog atomically."""
+        os.makedirs(self.path, exist_ok=True)
+        temp_path = f"{self.catalog_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.partitions, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.catalog_path)
+
+
+def _matches(value, predicate):
+    """Check a partition value against None (any), a value, a collection or a callable."""
+    if predicate is None:
+        return True
+    if callable(predicate):
+        return bool(predicate(value))
+    if isinstance(predicate, (list, tuple, set)):
+        return value in predicate
+    return value == predicate
+
+
+def _safe(value):
+    """Make a partition value usable as a directory name."""
+    value = str(value).replace(os.sep, '_')
+    if not value:
+        raise DataValidationError("Partition values must not be empty")
+    return value
\ No newline at end of file
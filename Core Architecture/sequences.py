@@ -0,0 +1,144 @@
+# sequences.py
+import numpy as np
+import pandas as pd
+
+from event_processor import ZONE_TAGS
+from match_frame import SHOT_RESULTS, derived_column
+
+# Seconds without play after which a new sequence starts
+SEQUENCE_GAP_SECONDS = 10
+
+POSSESSION_TEAMS = {'AA': 'Estonia', 'DA': 'Estonia', 'DD': 'Opponent', 'AD': 'Opponent'}
+ZONE_COLUMNS = ['Tsoon1', 'Tsoon2', 'Tsoon3']
+
+
+def sequence_ids(match_time_sec, moments, halves=None, gap_seconds=SEQUENCE_GAP_SECONDS, end_time_sec=None):
+    """Assign (sequence ids, possession ids) in one pass over events sorted by match time.
+
+    A possession starts when the half or the team in possession (from Põhimoment) changes,
+    events with an unknown moment stay in the current possession. A sequence also starts
+    after more than gap_seconds without play, measured from the end of the earlier clips
+    when end times are given and from the previous event start otherwise. Ids start at 1
+    and are returned in row order.
+    """
+    times = np.asarray(match_time_sec, dtype=float)
+    if not len(times):
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    order = np.argsort(times, kind='stable')
+
+    teams = pd.Series(np.asarray(moments, dtype=object)[order]).map(POSSESSION_TEAMS)
+    team_codes = teams.map({'Estonia': 0, 'Opponent': 1}).fillna(-1).to_numpy(dtype=np.int64)
+    # Carry the last known team forward over untagged moments
+    last_known = np.maximum.accumulate(np.where(team_codes >= 0, np.arange(len(team_codes)), 0))
+    team_codes = team_codes[last_known]
+
+    new_possession = np.r_[True, team_codes[1:] != team_codes[:-1]]
+    if halves is not None:
+        halves = np.asarray(halves)[order]
+        new_possession |= np.r_[True, halves[1:] != halves[:-1]]
+    sorted_times = times[order]
+    if end_time_sec is None:
+        gaps = np.diff(sorted_times)
+    else:
+        reach = np.maximum.accumulate(np.asarray(end_time_sec, dtype=float)[order])
+        gaps = sorted_times[1:] - reach[:-1]
+    new_sequence = new_possession | np.r_[True, gaps > gap_seconds]
+
+    sequences = np.empty(len(times), dtype=np.int64)
+    possessions = np.empty(len(times), dtype=np.int64)
+    sequences[order] = np.cumsum(new_sequence)
+    possessions[order] = np.cumsum(new_possession)
+    return sequences, possessions
+
+
+def assign_sequences(events, gap_seconds=SEQUENCE_GAP_SECONDS):
+    """Get a new frame with Sequence_ID and Possession_ID for every event."""
+    halves = events['Half'].to_numpy() if 'Half' in events.columns else None
+    sequences, possessions = sequence_ids(
+        events['Match_Time_sec'], events['Põhimoment'], halves, gap_seconds, _end_times(events)
+    )
+    return events.assign(Sequence_ID=sequences, Possession_ID=possessions)
+
+
+def summarize_sequences(events):
+    """Summarize sequences (one row each) with groupby reductions over events with sequence ids."""
+    if 'Sequence_ID' not in events.columns:
+        events = assign_sequences(events)
+    times = events['Match_Time_sec'].to_numpy(dtype=float)
+    ends = _end_times(events)
+    ends = times if ends is None else ends
+    result = events['Result'].astype(object) if 'Result' in events.columns else pd.Series(np.nan, index=events.index)
+
+    columns = {
+        'Sequence_ID': events['Sequence_ID'].to_numpy(),
+        'Possession_ID': events['Possession_ID'].to_numpy(),
+        'Team': events['Põhimoment'].astype(object).map(POSSESSION_TEAMS).to_numpy(dtype=object),
+        'Half': events['Half'].to_numpy() if 'Half' in events.columns else np.ones(len(events), dtype=np.int64),
+        'Start_Time_Sec': times,
+        'End_Time_Sec': ends,
+        'Final_Result': result.to_numpy(dtype=object),
+        'Resulted_In_Shot': result.isin(SHOT_RESULTS).to_numpy(),
+        'Resulted_In_Goal': (result == 'SHOTGOAL').to_numpy(),
+    }
+    zone_columns = [col for col in ZONE_COLUMNS if col in events.columns]
+    for zone in ZONE_TAGS:
+        columns[zone] = np.zeros(len(events), dtype=bool)
+        for col in zone_columns:
+            columns[zone] |= (events[col] == zone).to_numpy(dtype=bool, na_value=False)
+
+    slim = pd.DataFrame(columns).iloc[np.argsort(times, kind='stable')]
+    summary = slim.groupby('Sequence_ID', sort=True).agg(
+        Possession_ID=('Possession_ID', 'first'),
+        Team=('Team', 'first'),
+        Half=('Half', 'first'),
+        Start_Time_Sec=('Start_Time_Sec', 'min'),
+        End_Time_Sec=('End_Time_Sec', 'max'),
+        Number_of_Events=('Start_Time_Sec', 'size'),
+        Final_Result=('Final_Result', 'last'),
+        Resulted_In_Shot=('Resulted_In_Shot', 'max'),
+        Resulted_In_Goal=('Resulted_In_Goal', 'max'),
+        **{zone: (zone, 'max') for zone in ZONE_TAGS}
+    ).reset_index()
+
+    summary['Team'] = summary['Team'].fillna('Unknown')
+    summary['Duration_Sec'] = summary['End_Time_Sec'] - summary['Start_Time_Sec']
+    zones = np.full(len(summary), '', dtype=object)
+    for zone in ZONE_TAGS:
+        zones = zones + np.where(summary[zone].to_numpy(), f"{zone} to ", '')
+    summary['Zones'] = pd.Series(zones, dtype=object).str[:-len(' to ')].to_numpy()
+    summary['Sequence_Type'] = np.select(
+        [summary['S1'] & summary['S2'] & summary['S3'], summary['S1'] & summary['S3'],
+         summary['S1'] & summary['S2'], summary['S2'] & summary['S3']],
+        ['Full (S1->S2->S3)', 'Skip (S1->S3)', 'Partial (S1->S2)', 'Partial (S2->S3)'],
+        default='Incomplete'
+    )
+    return summary.drop(columns=ZONE_TAGS)
+
+
+def _end_times(events):
+    """Match time at which each clip ends (None without durations)."""
+    if 'Duration' not in events.columns:
+        return None
+    return events['Match_Time_sec'].to_numpy(dtype=float) + events['Duration'].to_numpy(dtype=float) / 1000
+
+
+def _match_sequence_ids(frame):
+    """Sequence and possession ids of a MatchFrame, both kept on the frame from one pass."""
+    halves = frame['Half'] if 'Half' in frame.columns else None
+    ends = frame['Match_Time_sec'] + frame['Duration'] / 1000 if 'Duration' in frame.columns else None
+    sequences, possessions = sequence_ids(frame['Match_Time_sec'], frame['Põhimoment'], halves, end_time_sec=ends)
+    frame.provide('Sequence_ID', sequences)
+    frame.provide('Possession_ID', possessions)
+    return sequences, possessions
+
+
+@derived_column('Sequence_ID', ['Match_Time_sec', 'Põhimoment'])
+def _sequence_id(frame):
+    """Sequence of each event (new team in possession, half or a long gap)."""
+    return _match_sequence_ids(frame)[0]
+
+
+@derived_column('Possession_ID', ['Match_Time_sec', 'Põhimoment'])
+def _possession_id(frame):
+    """Possession of each event (new team in possession or half)."""
+    return _match_sequence_ids(frame)[1]
\ No newline at end of file
@@ -0,0 +1,76 @@
+# tag_index.py
+import numpy as np
+import pandas as pd
+
+
+class TagIndex:
+    """Inverted index from tokens of the packed Dartfish Name column to row ids."""
+
+    def __init__(self, tokens, offsets, row_ids, num_rows):
+        """Initialize from CSR arrays: rows of tokens[i] are row_ids[offsets[i]:offsets[i + 1]]."""
+        self.tokens = np.asarray(tokens, dtype=str)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.row_ids = np.asarray(row_ids, dtype=np.int64)
+        self.num_rows = int(num_rows)
+        self._positions = {token: i for i, token in enumerate(self.tokens)}
+
+    @classmethod
+    def build(cls, names):
+        """Tokenize a Name column once and build the index."""
+        names = pd.Series(names).reset_index(drop=True)
+        exploded = names.astype(object).fillna('').astype(str).str.split().explode().dropna()
+        if exploded.empty:
+            return cls([], [0], [], len(names))
+
+        token_codes, tokens = pd.factorize(exploded.to_numpy())
+        rows = exploded.index.to_numpy(dtype=np.int64)
+
+        # One entry per (token, row) pair, sorted by token then row
+        pairs = np.unique(token_codes.astype(np.int64) * len(names) + rows)
+        pair_tokens = pairs // len(names)
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(pair_tokens, minlength=len(tokens)))])
+        return cls(np.asarray(tokens, dtype=str), offsets, pairs % len(names), len(names))
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """Restore an index saved with to_arrays."""
+        return cls(arrays['tokens'], arrays['offsets'], arrays['row_ids'], arrays['num_rows'][0])
+
+    def to_arrays(self):
+        """Export the index as plain numpy arrays for storage."""
+        return {
+            'tokens': self.tokens,
+            'offsets': self.offsets,
+            'row_ids': self.row_ids,
+            'num_rows': np.array([self.num_rows]),
+        }
+
+    def rows(self, token):
+        """Get sorted row ids tagged with a token."""
+        position = self._positions.get(token)
+        if position is None:
+            return np.empty(0, dtype=np.int64)
+        return self.row_ids[self.offsets[position]:self.offsets[position + 1]]
+
+    def rows_any(self, tokens):
+        """Get sorted row ids tagged with at least one of the tokens."""
+        parts = [self.rows(token) for token in tokens]
+        return np.unique(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+
+    def rows_all(self, tokens):
+        """Get sorted row ids tagged with every one of the tokens."""
+        result = None
+        for token in tokens:
+            rows = self.rows(token)
+            result = rows if result is None else np.intersect1d(result, rows, assume_unique=True)
+        return result if result is not None else np.arange(self.num_rows)
+
+    def mask(self, tokens, how='any'):
+        """Get a boolean row mask for tokens (how='any' or 'all')."""
+        mask = np.zeros(self.num_rows, dtype=bool)
+        mask[self.rows_any(tokens) if how == 'any' else self.rows_all(tokens)] = True
+        return mask
+
+    def token_counts(self):
+        """Get the number of rows tagged with each token."""
+        return dict(zip(self.tokens.tolist(), np.diff(self.offsets).tolist()))
\ No newline at end of file
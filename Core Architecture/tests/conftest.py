@@ -0,0 +1,33 @@
+# conftest.py
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+CORE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_DIR = os.path.dirname(CORE_DIR)
+sys.path.insert(0, CORE_DIR)
+
+from preprocessor import DataPreprocessor  # noqa: E402
+
+SAMPLE_HALVES = [os.path.join(REPO_DIR, f"2025.04.14 U17 Eesti - Gruusia ({half}pa).csv") for half in (1, 2)]
+
+
+@pytest.fixture(scope='session')
+def sample_paths():
+    """CSV exports of both halves of the sample U17 Eesti - Gruusia match."""
+    return SAMPLE_HALVES
+
+
+@pytest.fixture(scope='session')
+def raw_events():
+    """Both halves of the sample match as exported by Dartfish."""
+    return pd.concat([pd.read_csv(path, sep=';', encoding='utf-8-sig') for path in SAMPLE_HALVES],
+                     ignore_index=True)
+
+
+@pytest.fixture(scope='session')
+def events(raw_events):
+    """The sample match preprocessed without overlap trimming."""
+    return DataPreprocessor(overlap_settings={'enabled': False}).preprocess(raw_events.copy())
\ No newline at end of file
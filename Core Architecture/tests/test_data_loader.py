@@ -0,0 +1,51 @@
+# test_data_loader.py
+import shutil
+
+import pandas as pd
+import pytest
+
+from data_loader import DartfishLoader
+from event_schema import EventSchema
+from match_data import MatchData
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture
+def store_settings(tmp_path):
+    return {'enabled': True, 'path': str(tmp_path / 'matches')}
+
+
+def test_store_round_trip_matches_csv_parse(sample_paths, store_settings):
+    reference = DartfishLoader({'enabled': False}).load_periods(sample_paths)
+    loader = DartfishLoader(store_settings)
+    first, second = loader.load_periods(sample_paths), loader.load_periods(sample_paths)
+
+    assert isinstance(second, MatchData)
+    assert second.offsets_ms.tolist() == reference.offsets_ms.tolist()
+    for match in (first, second):
+        pd.testing.assert_frame_equal(match.events, reference.events)
+        assert (match.match_time_ms() == reference.match_time_ms()).all()
+
+
+def test_stored_projection_matches_csv_projection(sample_paths, store_settings):
+    columns = ['Position', 'Duration', 'Poolaeg', 'Result']
+    reference = DartfishLoader({'enabled': False}).load_match(*sample_paths, columns=columns)
+    loader = DartfishLoader(store_settings)
+    loader.load_periods(sample_paths)
+    pd.testing.assert_frame_equal(loader.load_match(*sample_paths, columns=columns), reference)
+
+
+def test_store_keeps_codes_for_a_later_schema(sample_paths, store_settings, tmp_path):
+    paths = []
+    for half, path in enumerate(sample_paths, start=1):
+        raw = pd.read_csv(path, sep=';', encoding='utf-8-sig')
+        raw.loc[0, 'Result'] = 'WINCORNER'
+        paths.append(str(tmp_path / f"half{half}.csv"))
+        raw.to_csv(paths[-1], sep=';', index=False, encoding='utf-8-sig')
+
+    DartfishLoader(store_settings).load_periods(paths)
+    schema = EventSchema({'results': {'WINCORNER': {'code': 'WINCORNER'}}})
+    reloaded = DartfishLoader(store_settings, schema).load_periods(paths).events
+    assert (reloaded['Result'] == 'WINCORNER').sum() == 2
+    assert reloaded['Result'].dtype == schema.dtype('results')
\ No newline at end of file
@@ -0,0 +1,34 @@
+# test_event_schema.py
+import pandas as pd
+import pytest
+
+from errors import DataValidationError
+from event_schema import EventSchema
+
+
+@pytest.fixture
+def tagged():
+    return pd.DataFrame({'Result': ['SHOTON', ' WINCORNER ', None, 'ENTRY'], 'Outcome': ['POS', 'NEG', 'POS', None]})
+
+
+def test_unknown_codes_are_kept_after_the_known_codes(tagged):
+    schema = EventSchema()
+    converted = schema.apply(tagged)
+    assert converted['Result'].tolist()[:2] == ['SHOTON', 'WINCORNER']
+    assert converted['Result'].isna().tolist() == [False, False, True, False]
+    # Known codes keep their fixed integer codes
+    known = schema.dtype('results').categories
+    assert list(converted['Result'].cat.categories[:len(known)]) == list(known)
+    assert converted['Result'].cat.codes[0] == known.get_loc('SHOTON')
+    assert converted['Outcome'].dtype == schema.dtype('outcomes')
+
+
+def test_strict_schema_rejects_unknown_codes(tagged):
+    with pytest.raises(DataValidationError, match='WINCORNER'):
+        EventSchema(strict=True).apply(tagged)
+
+
+def test_apply_leaves_its_input_unchanged(tagged):
+    before = tagged.copy()
+    EventSchema().apply(tagged)
+    pd.testing.assert_frame_equal(tagged, before)
\ No newline at end of file
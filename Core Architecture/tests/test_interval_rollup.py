@@ -0,0 +1,34 @@
+# test_interval_rollup.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from interval_rollup import IntervalRollup, team_points
+from optimized_analyzer import calculate_momentum_timeline
+
+
+@pytest.fixture
+def scored_events(events):
+    """Sample events with signed Momentum_Score values unrelated to their Põhimoment."""
+    rng = np.random.default_rng(7)
+    return events.assign(Momentum_Score=rng.choice([-4.0, -1.5, 0.0, 1.0, 3.0], len(events)))
+
+
+def test_side_follows_momentum_score_sign():
+    events = pd.DataFrame({'Põhimoment': ['DD', 'AA', 'AD', 'DA'], 'Momentum_Score': [2.0, -1.0, 1.0, 0.0]})
+    points, teams = team_points(events)
+    assert points.tolist() == [2.0, 1.0, 1.0, 0.0]
+    assert teams.tolist() == [0, 1, 0, -1]
+
+
+def test_rollup_net_matches_momentum_score_sum(scored_events):
+    view = IntervalRollup.from_events(scored_events).view(5)
+    net = view['momentum_estonia'].sum() - view['momentum_opponent'].sum()
+    assert net == pytest.approx(scored_events['Momentum_Score'].sum())
+    assert (view[['momentum_estonia', 'momentum_opponent']] >= 0).all().all()
+
+
+def test_timeline_net_matches_momentum_score_sum(scored_events):
+    timeline = calculate_momentum_timeline(scored_events, attribution='start')
+    assert timeline['Cumulative_Net'].iloc[-1] == pytest.approx(scored_events['Momentum_Score'].sum())
+    assert timeline['Net'].sum() == pytest.approx(scored_events['Momentum_Score'].sum())
\ No newline at end of file
@@ -0,0 +1,67 @@
+# test_live_momentum.py
+import numpy as np
+import pytest
+
+from interval_rollup import IntervalRollup, team_points
+from live_momentum import LIVE_METRICS, LiveMatchState
+
+
+def feed(state, events, chunks, seed=0):
+    """Add events to a live state in shuffled chunks."""
+    shuffled = events.sample(frac=1, random_state=seed)
+    for chunk in np.array_split(np.arange(len(shuffled)), chunks):
+        state.update(shuffled.iloc[chunk])
+    return state
+
+
+def assert_matches_batch(state, events):
+    batch = IntervalRollup.from_events(events)
+    live = state.rollup()
+    assert live.num_bins == batch.num_bins
+    for name in LIVE_METRICS:
+        expected = batch.values[batch.metrics.index(name)] if name in batch.metrics else 0
+        np.testing.assert_allclose(live.values[LIVE_METRICS.index(name)], expected, err_msg=name)
+
+
+@pytest.mark.parametrize('chunks', [1, 7, 224])
+def test_preprocessed_chunks_match_batch_rollup(events, chunks):
+    assert_matches_batch(feed(LiveMatchState(), events, chunks), events)
+
+
+def test_raw_tags_out_of_order_get_preprocessor_times(raw_events, events):
+    # Second-half tags arrive while the first half is still growing, so offsets get rebuilt
+    state = feed(LiveMatchState(), raw_events, 12, seed=3)
+    assert len(state) == len(events)
+    np.testing.assert_allclose(np.sort(state.events['Match_Time_sec']), np.sort(events['Match_Time_sec']))
+    assert_matches_batch(state, events)
+
+
+def test_cumulative_and_totals_follow_bins(events):
+    state = feed(LiveMatchState(), events, 9)
+    timeline = state.momentum_timeline()
+    rollup = state.rollup()
+    estonia = rollup.values[LIVE_METRICS.index('momentum_estonia')]
+    opponent = rollup.values[LIVE_METRICS.index('momentum_opponent')]
+    np.testing.assert_allclose(timeline['Cumulative_Estonia'], np.cumsum(estonia))
+    np.testing.assert_allclose(timeline['Cumulative_Net'], np.cumsum(estonia - opponent))
+    np.testing.assert_allclose(list(state.team_totals().values()), rollup.values.sum(axis=1))
+
+
+@pytest.mark.parametrize('seed', [None, 5])
+def test_decayed_curve_matches_direct_sum(events, seed):
+    state = LiveMatchState()
+    if seed is None:
+        ordered = events.sort_values('Match_Time_sec', kind='stable')
+        for chunk in np.array_split(np.arange(len(ordered)), 6):
+            state.update(ordered.iloc[chunk])
+    else:
+        feed(state, events, 6, seed)
+    curve = state.decayed_momentum(step_seconds=30)
+
+    # Every earlier event's points decayed to each grid time
+    points, teams = team_points(events)
+    times = events['Match_Time_sec'].to_numpy(dtype=float)
+    elapsed = curve['Time_sec'].to_numpy()[:, None] - times[None, :]
+    weights = np.where(elapsed >= 0, np.exp(-state.decayed.rate * np.clip(elapsed, 0, None)), 0)
+    for team, column in enumerate(['Estonia', 'Opponent']):
+        np.testing.assert_allclose(curve[column], weights @ (points * (teams == team)), atol=1e-9)
\ No newline at end of file
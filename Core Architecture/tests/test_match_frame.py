@@ -0,0 +1,22 @@
+# test_match_frame.py
+import numpy as np
+
+from event_processor import classify_presses
+from match_frame import MatchFrame
+
+
+def test_pressing_success_follows_classify_presses(events):
+    frame = MatchFrame(events)
+    teams, successful = classify_presses(events)
+    assert (frame['Pressing_Success'] == successful).all()
+    # Opponent presses succeed when Estonia's attack breaks down
+    opponent = teams == 1
+    assert (frame['Pressing_Success'][opponent] == (events['Outcome'] == 'NEG').to_numpy()[opponent]).all()
+
+
+def test_derived_columns_are_read_only_and_computed_once(events):
+    frame = MatchFrame(events)
+    values = frame['Pressing_Success']
+    assert frame['Pressing_Success'] is values
+    assert not values.flags.writeable
+    assert np.array_equal(frame.select(columns=['Pressing_Success'])['Pressing_Success'], values)
\ No newline at end of file
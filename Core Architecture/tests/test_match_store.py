@@ -0,0 +1,44 @@
+# test_match_store.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from match_store import MatchStore
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture
+def store(tmp_path):
+    return MatchStore({'enabled': True, 'path': str(tmp_path / 'matches')})
+
+
+def test_content_key_follows_file_contents(store, tmp_path):
+    first, second = tmp_path / 'a.csv', tmp_path / 'b.csv'
+    first.write_bytes(b'Name;Position\nx;1\n')
+    second.write_bytes(b'Name;Position\ny;2\n')
+    key = store.content_key(first, second)
+    assert store.content_key(first, second) == key
+    assert store.content_key(second, first) != key
+
+    # Moving bytes from one file to the other changes the key
+    first.write_bytes(b'Name;Position\nx;1\ny')
+    second.write_bytes(b';2\n')
+    assert store.content_key(first, second) != key
+
+
+def test_write_read_round_trip_with_projection(store, raw_events):
+    store.write('match', raw_events)
+    assert store.has('match')
+    assert store.columns('match') == list(raw_events.columns)
+    pd.testing.assert_frame_equal(store.read('match'), raw_events)
+    pd.testing.assert_frame_equal(store.read('match', columns=['Position', 'Result']), raw_events[['Position', 'Result']])
+
+
+def test_arrays_round_trip(store):
+    arrays = {'tokens': np.array(['AA', 'POS']), 'rows': np.arange(5)}
+    assert store.read_arrays('match', 'tags') is None
+    store.write_arrays('match', 'tags', arrays)
+    restored = store.read_arrays('match', 'tags')
+    assert set(restored) == set(arrays)
+    assert all(np.array_equal(restored[name], arrays[name]) for name in arrays)
\ No newline at end of file
@@ -0,0 +1,54 @@
+# test_momentum_bootstrap.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from errors import AnalysisError
+from interval_rollup import IntervalRollup
+from momentum_bootstrap import bootstrap_events, bootstrap_momentum, resample_momentum
+
+
+def random_events(count=60, num_intervals=9, seed=2):
+    rng = np.random.default_rng(seed)
+    return rng.normal(0, 5, count), rng.integers(0, num_intervals, count)
+
+
+def test_resamples_match_explicit_loop():
+    scores, intervals = random_events()
+    resamples = resample_momentum(scores, intervals, 10, 25, seed=4)
+
+    # The same draws as explicit resampled events, totalled per interval with pandas
+    rng = np.random.default_rng(4)
+    counts = rng.multinomial(len(scores), np.full(len(scores), 1 / len(scores)), size=25)
+    for resample, drawn in zip(resamples, counts):
+        rows = np.repeat(np.arange(len(scores)), drawn)
+        frame = pd.DataFrame({'Interval': intervals[rows], 'Score': scores[rows]})
+        expected = frame.groupby('Interval')['Score'].sum().reindex(range(10), fill_value=0)
+        np.testing.assert_allclose(resample, expected)
+    assert resamples.shape == (25, 10) and (counts.sum(axis=1) == len(scores)).all()
+
+
+def test_bands_do_not_depend_on_workers():
+    scores, intervals = random_events()
+    serial = bootstrap_momentum(scores, intervals, num_resamples=300, seed=11, batch_size=100)
+    parallel = bootstrap_momentum(scores, intervals, num_resamples=300, seed=11, batch_size=100, workers=2)
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_bands_around_point_estimate():
+    scores, intervals = random_events(count=400)
+    bands = bootstrap_momentum(scores, intervals, num_resamples=500, confidence=0.9, seed=1)
+    expected = pd.Series(scores).groupby(intervals).sum()
+    np.testing.assert_allclose(bands['Momentum'], expected)
+    np.testing.assert_allclose(bands['Cumulative_Momentum'], expected.cumsum())
+    assert (bands['Momentum_Lower'] <= bands['Momentum']).all() and (bands['Momentum'] <= bands['Momentum_Upper']).all()
+    assert (bands['Cumulative_Lower'] <= bands['Cumulative_Upper']).all()
+    with pytest.raises(AnalysisError):
+        bootstrap_momentum(scores, intervals, confidence=1.5)
+
+
+def test_events_net_momentum_matches_rollup(events):
+    bands = bootstrap_events(events, interval_minutes=5, num_resamples=50, seed=0)
+    view = IntervalRollup.from_events(events).view(5)
+    np.testing.assert_allclose(bands['Momentum'], view['momentum_estonia'] - view['momentum_opponent'])
+    assert bands['Interval_Label'].tolist() == view['Interval_Label'].astype(str).tolist()
\ No newline at end of file
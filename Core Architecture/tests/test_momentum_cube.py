@@ -0,0 +1,86 @@
+# test_momentum_cube.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from errors import AnalysisError
+from momentum_cube import CUBE_TEAMS, MomentumCube
+
+MODELS = ['standard', 'attacking']
+
+
+def random_matches(count, seed=0):
+    """Match ids, tournaments and models x teams x minutes momentum of random lengths."""
+    rng = np.random.default_rng(seed)
+    return [(f"2025.05.{day:02d} U{17 if day % 2 else 19} Eesti - Team{day}", f"Cup {day % 3}",
+             rng.integers(0, 5, (len(MODELS), len(CUBE_TEAMS), rng.integers(80, 100))).astype(np.float32))
+            for day in range(1, count + 1)]
+
+
+def long_frame(matches):
+    """The stored matches in long form, as a pandas groupby would see them."""
+    rows = []
+    for match, tournament, momentum in matches:
+        for m, model in enumerate(MODELS):
+            for t, team in enumerate(CUBE_TEAMS):
+                rows.append(pd.DataFrame({'match': match, 'tournament': tournament, 'age_group': match.split()[1],
+                                          'model': model, 'team': team, 'minute': np.arange(momentum.shape[2]),
+                                          'value': momentum[m, t]}))
+    return pd.concat(rows, ignore_index=True)
+
+
+@pytest.fixture
+def cube(tmp_path):
+    """A cube holding more matches than its first reservation, reopened from disk."""
+    matches = random_matches(11)
+    writer = MomentumCube({'path': str(tmp_path), 'max_minutes': 95})
+    for match, tournament, momentum in matches:
+        writer.add_match(match, momentum, MODELS, tournament)
+    return MomentumCube({'path': str(tmp_path)}), matches
+
+
+def test_round_trip_after_reopening(cube):
+    cube, matches = cube
+    assert len(cube) == len(matches) and cube.models == MODELS
+    for slot, (match, tournament, momentum) in enumerate(matches):
+        minutes = min(momentum.shape[2], 95)
+        stored = cube.slice([slot])[0]
+        np.testing.assert_array_equal(stored[:, :minutes], np.transpose(momentum[:, :, :minutes], (1, 2, 0)))
+        assert not stored[:, minutes:].any()
+        assert cube.index.loc[slot, ['match', 'minutes']].tolist() == [match, minutes]
+
+
+def test_profile_matches_groupby_mean(cube):
+    cube, matches = cube
+    frame = long_frame(matches)
+    frame = frame[(frame['minute'] < 95) & (frame['team'] == 'Opponent') & (frame['model'] == 'attacking')
+                  & (frame['age_group'] == 'U17')]
+    expected = frame.groupby('minute')['value'].mean()
+    profile = cube.profile('Opponent', model='attacking', age_group='U17')
+    np.testing.assert_allclose(profile.iloc[:len(expected)], expected)
+    assert profile.iloc[len(expected):].isna().all()
+
+
+def test_swings_match_groupby_cumsum(cube):
+    cube, matches = cube
+    frame = long_frame(matches)
+    frame = frame[(frame['model'] == 'standard') & frame['minute'].between(45, 89) & (frame['tournament'] == 'Cup 1')]
+    net = frame.pivot_table('value', ['match', 'minute'], 'team').eval('Estonia - Opponent')
+    cumulative = net.groupby(level='match').cumsum()
+    expected = (cumulative.groupby(level='match').max() - cumulative.groupby(level='match').min())
+    swings = cube.swings((45, 90), tournament='Cup 1')
+    assert swings['swing'].is_monotonic_decreasing
+    swings = swings.set_index('match')['swing']
+    pd.testing.assert_series_equal(swings.sort_index().astype(float), expected.astype(float),
+                                   check_names=False, check_index_type=False)
+
+
+def test_readding_a_match_replaces_its_slot(cube):
+    cube, matches = cube
+    match, tournament, _ = matches[4]
+    shorter = np.ones((len(MODELS), len(CUBE_TEAMS), 50), dtype=np.float32)
+    assert cube.add_match(match, shorter, MODELS, tournament) == 4
+    assert len(cube) == len(matches)
+    assert cube.slice([4]).sum() == shorter.sum()
+    with pytest.raises(AnalysisError):
+        cube.add_match(match, shorter, ['standard'], tournament)
\ No newline at end of file
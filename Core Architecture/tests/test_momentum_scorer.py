@@ -0,0 +1,80 @@
+# test_momentum_scorer.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from event_schema import DEFAULT_CODE_TABLES
+from interval_rollup import team_points
+from momentum_scorer import DEFAULT_SCORING_MODEL, DEFAULT_TEAM_SIGNS, ScoringModelStack, compiled_model
+from scoring_model import ScoringModelManager
+
+RESULTS = DEFAULT_CODE_TABLES['results']
+
+
+def row_score(row, model=DEFAULT_SCORING_MODEL):
+    """Per-row reference score: best result points x last zone x pressing multiplier x team sign."""
+    results = [row[col] for col in ['Result', 'Shot2', 'Shot3'] if pd.notna(row[col])]
+    best = min(results, key=RESULTS.index) if results else None
+    zones = [row[col] for col in ['Tsoon1', 'Tsoon2', 'Tsoon3'] if pd.notna(row[col])]
+    multipliers = model['multipliers']
+    return (model['point_values'].get(best, 0.0)
+            * (multipliers['zone'].get(zones[-1], 1.0) if zones else 1.0)
+            * multipliers['pressing'].get(row['Pressing'], 1.0)
+            * DEFAULT_TEAM_SIGNS.get(row['Põhimoment'], 0.0))
+
+
+@pytest.fixture
+def random_events():
+    rng = np.random.default_rng(11)
+    size = 400
+
+    def codes(table, missing_share=0.4):
+        return np.where(rng.random(size) < missing_share, None, rng.choice(table, size))
+
+    return pd.DataFrame({
+        'Põhimoment': codes(DEFAULT_CODE_TABLES['possession'], 0.05),
+        'Result': codes(RESULTS, 0.2),
+        'Shot2': codes(RESULTS, 0.8),
+        'Shot3': codes(RESULTS, 0.9),
+        'Tsoon1': codes(DEFAULT_CODE_TABLES['zones']),
+        'Tsoon2': codes(DEFAULT_CODE_TABLES['zones']),
+        'Tsoon3': codes(DEFAULT_CODE_TABLES['zones']),
+        'Pressing': codes(DEFAULT_CODE_TABLES['pressing']),
+        'Match_Time_sec': np.sort(rng.uniform(0, 5400, size)),
+    })
+
+
+def test_compiled_scores_match_per_row_scores(random_events):
+    expected = random_events.apply(row_score, axis=1).to_numpy()
+    assert np.allclose(compiled_model().score(random_events), expected)
+
+
+def test_team_points_apply_the_model_multipliers():
+    events = pd.DataFrame({
+        'Põhimoment': ['AA', 'DD'], 'Result': ['SHOTON', 'SHOTGOAL'],
+        'Tsoon1': ['S3', 'S1'], 'Pressing': ['HIGHPRESS', None],
+    })
+    points, teams = team_points(events)
+    assert points == pytest.approx([4.0 * 1.2 * 1.5, 20.0 * 0.8])
+    assert teams.tolist() == [0, 1]
+
+    points, _ = team_points(events, {'SHOTON': 1.0})
+    assert points == pytest.approx([1.0 * 1.2 * 1.5, 0.0])
+
+
+def test_default_model_has_one_source():
+    model = ScoringModelManager(None)._default_model()
+    assert model == DEFAULT_SCORING_MODEL
+    model['point_values']['SHOTGOAL'] = 0.0
+    assert DEFAULT_SCORING_MODEL['point_values']['SHOTGOAL'] == 20.0
+
+
+def test_model_stack_matches_grouped_per_row_scores(random_events):
+    boosted = dict(DEFAULT_SCORING_MODEL, point_values={'SHOTGOAL': 10.0, 'ENTRY': 2.0})
+    stack = ScoringModelStack({'default': DEFAULT_SCORING_MODEL, 'boosted': boosted})
+    momentum = stack.score_intervals(random_events, interval_minutes=15)
+
+    intervals = (random_events['Match_Time_sec'] // 900).astype(int)
+    for position, model in enumerate([DEFAULT_SCORING_MODEL, boosted]):
+        expected = random_events.apply(row_score, axis=1, model=model).groupby(intervals).sum()
+        assert np.allclose(momentum[position, expected.index], expected.to_numpy())
\ No newline at end of file
@@ -0,0 +1,59 @@
+# test_momentum_shifts.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_shifts import detect_shifts, shift_table
+
+
+def optimal_partitioning(values, penalty, min_size):
+    """Exact change points by checking every last-segment start (no pruning)."""
+    n = len(values)
+
+    def cost(a, b):
+        segment = values[a:b]
+        return ((segment - segment.mean()) ** 2).sum()
+
+    best = [-penalty] + [np.inf] * n
+    previous = [0] * (n + 1)
+    for t in range(min_size, n + 1):
+        options = [(best[s] + cost(s, t) + penalty, s) for s in range(0, t - min_size + 1)
+                   if s == 0 or s >= min_size]
+        best[t], previous[t] = min(options)
+    changes, t = [], n
+    while t > 0:
+        t = previous[t]
+        changes.append(t)
+    return sorted(changes[:-1])
+
+
+@pytest.mark.parametrize('seed', range(4))
+@pytest.mark.parametrize('min_size', [1, 3])
+def test_pelt_matches_optimal_partitioning(seed, min_size):
+    rng = np.random.default_rng(seed)
+    values = np.concatenate([rng.normal(mean, 1.0, size) for mean, size in
+                             zip(rng.normal(0, 3, 4), rng.integers(5, 25, 4))])
+    penalty = 2 * np.log(len(values)) * np.var(values)
+    assert detect_shifts(values, penalty, min_size).tolist() == optimal_partitioning(values, penalty, min_size)
+
+
+def test_planted_shifts_are_found():
+    rng = np.random.default_rng(3)
+    values = np.concatenate([rng.normal(0, 0.5, 40), rng.normal(6, 0.5, 30), rng.normal(-4, 0.5, 30)])
+    assert detect_shifts(values, penalty=10.0).tolist() == [40, 70]
+
+
+def test_stacked_shift_table_matches_single_tables():
+    rng = np.random.default_rng(8)
+    timelines = {
+        match: pd.DataFrame({'Start_sec': np.arange(90) * 60,
+                             'Net': np.r_[rng.normal(0, 1, 45), rng.normal(level, 1, 45)]})
+        for match, level in [('a', 5.0), ('b', -5.0)]
+    }
+    stacked = pd.concat([timeline.assign(Match=match) for match, timeline in timelines.items()], ignore_index=True)
+    shifts = shift_table(stacked.sample(frac=1, random_state=0))
+    for match, timeline in timelines.items():
+        single = shift_table(timeline)
+        part = shifts[shifts['Match'] == match].drop(columns='Match').reset_index(drop=True)
+        pd.testing.assert_frame_equal(part, single)
+    assert shifts.groupby('Match')['Favours'].first().to_dict() == {'a': 'Estonia', 'b': 'Opponent'}
\ No newline at end of file
@@ -0,0 +1,48 @@
+# test_momentum_timeline.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from optimized_analyzer import calculate_momentum_timeline, momentum_timeline
+
+
+def loop_timeline(starts, ends, points, groups, num_groups, interval_ms, num_intervals, attribution):
+    """Per-event, per-interval reference of momentum_timeline."""
+    totals = np.zeros((num_groups, num_intervals))
+    for start, end, value, group in zip(starts, ends, points, groups):
+        for interval in range(num_intervals):
+            lo, hi = interval * interval_ms, (interval + 1) * interval_ms
+            starts_here = lo <= start < hi
+            if attribution == 'start':
+                totals[group, interval] += value * starts_here
+            elif attribution == 'overlap':
+                totals[group, interval] += value * (starts_here or (start < lo < end))
+            elif end > start:
+                totals[group, interval] += value * max(0, min(end, hi) - max(start, lo)) / (end - start)
+            else:
+                totals[group, interval] += value * starts_here
+    return totals
+
+
+@pytest.mark.parametrize('attribution', ['start', 'overlap', 'duration'])
+def test_difference_arrays_match_loop(attribution):
+    rng = np.random.default_rng(5)
+    starts = rng.integers(0, 2700000, 300).astype(float)
+    ends = starts + np.where(rng.random(300) < 0.1, 0, rng.integers(1, 900000, 300))
+    points = rng.normal(size=300)
+    groups = rng.integers(0, 4, 300)
+    num_intervals = int(np.ceil(ends.max() / 300000))
+    expected = loop_timeline(starts, ends, points, groups, 4, 300000, num_intervals, attribution)
+    result = momentum_timeline(starts, ends, points, groups, 4, 300000, num_intervals, attribution)
+    assert np.allclose(result, expected)
+
+
+def test_stacked_matches_match_separate_timelines(events):
+    scored = events.assign(Momentum_Score=np.random.default_rng(1).normal(size=len(events)))
+    stacked = pd.concat([scored.assign(Match='a'), scored.iloc[::2].assign(Match='b')], ignore_index=True)
+    timeline = calculate_momentum_timeline(stacked, match_column='Match')
+    for match, rows in [('a', scored), ('b', scored.iloc[::2])]:
+        single = calculate_momentum_timeline(rows)
+        part = timeline[timeline['Match'] == match].drop(columns='Match').reset_index(drop=True)
+        pd.testing.assert_frame_equal(part.iloc[:len(single)], single)
+        assert (part.iloc[len(single):][['Estonia', 'Opponent']] == 0).all().all()
\ No newline at end of file
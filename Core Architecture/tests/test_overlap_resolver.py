@@ -0,0 +1,71 @@
+# test_overlap_resolver.py
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from overlap_resolver import OverlapResolver
+
+
+def random_clips(seed, num_clips=60):
+    """Clips over two periods with distinct starts, so ownership never depends on ties."""
+    rng = np.random.default_rng(seed)
+    starts = rng.choice(120000, num_clips, replace=False)
+    return pd.DataFrame({
+        'Clip': np.arange(num_clips),
+        'Position': starts,
+        'Duration': rng.integers(1, 15000, num_clips),
+        'Poolaeg': rng.choice([1.0, 2.0], num_clips),
+        'Põhimoment': rng.choice(['AA', 'DD', 'AD', 'DA'], num_clips),
+    })
+
+
+def brute_force_pieces(clips, prefer):
+    """Owned (start, end) pieces of every clip, giving each millisecond segment to one clip."""
+    starts = clips['Position'].to_numpy()
+    ends = starts + clips['Duration'].to_numpy()
+    periods = clips['Poolaeg'].to_numpy()
+    moments = clips['Põhimoment'].tolist()
+    ranks = [len(prefer) - prefer.index(m) if m in prefer else 0 for m in moments]
+    pieces = {row: [] for row in range(len(clips))}
+    for period in np.unique(periods):
+        in_period = np.flatnonzero(periods == period)
+        bounds = np.unique(np.concatenate([starts[in_period], ends[in_period]]))
+        for seg_start, seg_end in zip(bounds[:-1], bounds[1:]):
+            active = [row for row in in_period if starts[row] <= seg_start and ends[row] >= seg_end]
+            if not active:
+                continue
+            owner = max(active, key=lambda row: (ranks[row], starts[row]))
+            owned = pieces[owner]
+            if owned and owned[-1][1] == seg_start:
+                owned[-1] = (owned[-1][0], seg_end)
+            else:
+                owned.append((seg_start, seg_end))
+    return {row: owned or [(starts[row], starts[row])] for row, owned in pieces.items()}
+
+
+@pytest.mark.parametrize('mode', ['trim', 'split'])
+@pytest.mark.parametrize('prefer', [[], ['AA', 'DA']])
+def test_sweep_matches_brute_force(mode, prefer):
+    clips = random_clips(3)
+    resolved, report = OverlapResolver({'enabled': True, 'mode': mode, 'prefer': prefer}).resolve(clips)
+
+    expected = brute_force_pieces(clips, prefer)
+    rows = [(row, start, end - start) for row in range(len(clips))
+            for start, end in (expected[row] if mode == 'split' else expected[row][:1])]
+    assert list(zip(resolved['Clip'], resolved['Position'], resolved['Duration'])) == rows
+    assert len(report) > 0
+
+
+def test_resolution_is_opt_in(raw_events):
+    resolved, report = OverlapResolver().resolve(raw_events)
+    assert resolved is raw_events
+    assert report.empty
+
+
+def test_enabled_resolution_logs_a_summary(raw_events, caplog):
+    with caplog.at_level(logging.WARNING, logger='overlap_resolver'):
+        resolved, report = OverlapResolver({'enabled': True}).resolve(raw_events)
+    assert (resolved['Duration'] < raw_events['Duration']).any()
+    assert 'shortened' in caplog.text
\ No newline at end of file
@@ -0,0 +1,77 @@
+# test_pressing_cube.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from errors import AnalysisError
+from pressing_cube import PressingCube
+
+
+def pandas_presses(events):
+    """Pressing rows with their team and success, the way the groupby tables worked them out."""
+    presses = events[events['Pressing'].notna()].copy()
+    presses['team'] = presses['Põhimoment'].astype(object).map({'DD': 'Estonia', 'AA': 'Opponent'}).fillna('Transition')
+    success_outcome = np.where(presses['team'] == 'Opponent', 'NEG', 'POS')
+    presses['successful'] = presses['Outcome'].astype(object) == success_outcome
+    presses['zone'] = presses['Pressing'].astype(object)
+    presses['half'] = presses['Half']
+    return presses
+
+
+def pandas_table(presses, keys):
+    table = presses.groupby(keys)['successful'].agg(total='size', successful='sum')
+    table['success_rate'] = (table['successful'] / table['total'] * 100).round(1)
+    return table
+
+
+@pytest.fixture(scope='module')
+def cube(events):
+    return PressingCube.from_events(events)
+
+
+@pytest.mark.parametrize('axes', [('team',), ('zone',), ('half',), ('team', 'zone'), ('zone', 'half', 'team')])
+def test_tables_match_groupby(cube, events, axes):
+    expected = pandas_table(pandas_presses(events), list(axes))
+    table = cube.table(*axes)
+    pd.testing.assert_frame_equal(table.sort_index(), expected.sort_index(), check_dtype=False,
+                                  check_index_type=False)
+
+
+def test_interval_table_matches_groupby(cube, events):
+    presses = pandas_presses(events)
+    minutes = (presses['Match_Time_sec'] // 600).astype(int)
+    presses['interval'] = [f"{i * 10}-{(i + 1) * 10}" for i in minutes]
+    expected = pandas_table(presses, ['interval'])
+    table = cube.table('interval', interval_minutes=10)
+    pd.testing.assert_frame_equal(table.sort_index(), expected.sort_index(), check_dtype=False)
+    with pytest.raises(AnalysisError):
+        cube.table('interval', interval_minutes=7.5)
+
+
+def test_sample_match_regression(cube):
+    # Counts checked by hand against the tagged sample match
+    teams = cube.table('team')
+    assert teams.loc['Estonia', ['successful', 'total']].tolist() == [20, 25]
+    assert teams.loc['Opponent', ['successful', 'total']].tolist() == [30, 36]
+    assert (cube.ppda('Estonia'), cube.ppda('Opponent')) == (0.54, 0.11)
+
+
+def test_ppda_matches_pandas(cube, events):
+    presses = pandas_presses(events)
+    presses['pass'] = presses['Result'].astype(object) == 'KEEPPOS'
+    for team, rows in presses.groupby('team'):
+        defensive = (rows['successful'] & ~rows['pass']).sum()
+        assert cube.ppda(team) == (round(rows['pass'].sum() / defensive, 2) if defensive else float('inf'))
+
+
+def test_merge_and_round_trip(cube, events):
+    # Second copy of the match shifted by an hour lands in later intervals
+    later = events.assign(Match_Time_sec=events['Match_Time_sec'] + 3600)
+    merged = cube.merge(PressingCube.from_events(later))
+    stacked = PressingCube.from_events(pd.concat([events, later], ignore_index=True))
+    np.testing.assert_array_equal(merged.counts, stacked.counts)
+    assert merged.total('presses') == 2 * cube.total('presses')
+
+    restored = PressingCube.from_arrays(cube.to_arrays())
+    np.testing.assert_array_equal(restored.counts, cube.counts)
+    assert restored.base_minutes == cube.base_minutes
\ No newline at end of file
@@ -0,0 +1,55 @@
+# test_pressing_intensity.py
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import REPO_DIR
+from pressing_intensity import (INTENSITY_TEAMS, feed_match_times, pressing_actions,
+                                rolling_pressing)
+from provider_loader import ProviderEventLoader
+
+
+@pytest.fixture(scope='module')
+def feed():
+    return ProviderEventLoader({'enabled': False}).load_file(os.path.join(REPO_DIR, 'game-51856-events.csv'))
+
+
+def brute_force_windows(actions, window_seconds, times):
+    """Per-window team sums with a boolean mask per window end."""
+    rows = []
+    for end in times:
+        window = actions[(actions['Time_sec'] > end - window_seconds) & (actions['Time_sec'] <= end)]
+        sums = window.groupby('Team')[['Presses', 'Successful', 'Passes_Allowed', 'Defensive_Actions']].sum()
+        row = {'Time_sec': end}
+        for team, name in enumerate(INTENSITY_TEAMS):
+            presses, successful, passes, defensive = (sums.loc[team] if team in sums.index else [0, 0, 0, 0])
+            row[f'Presses_{name}'] = presses
+            row[f'Success_Rate_{name}'] = round(successful / presses * 100, 1) if presses else np.nan
+            row[f'PPDA_{name}'] = round(passes / defensive, 2) if defensive else np.nan
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+@pytest.mark.parametrize('source', ['events', 'feed'])
+def test_rolling_windows_match_brute_force(source, events, feed):
+    actions = pressing_actions(events if source == 'events' else feed)
+    rolling = rolling_pressing(actions, window_seconds=300, step_seconds=30)
+    expected = brute_force_windows(actions, 300, rolling['Time_sec'])
+    pd.testing.assert_frame_equal(rolling[expected.columns], expected, check_dtype=False)
+
+
+def test_feed_halves_follow_each_other(feed):
+    times = feed_match_times(feed)
+    half = feed['Half'].astype(str).to_numpy()
+    assert times[half == '2nd half'].min() >= times[half == '1st half'].max()
+    first = half == '1st half'
+    assert np.allclose(times[first], feed['Football time'].to_numpy()[first])
+
+
+def test_feed_recoveries_are_not_presses(feed):
+    actions = pressing_actions(feed)
+    recoveries = int((feed['Event'] == 'recovery').sum())
+    assert actions['Defensive_Actions'].sum() - actions['Presses'].sum() == recoveries
+    assert actions['Successful'].sum() < actions['Presses'].sum()
\ No newline at end of file
@@ -0,0 +1,44 @@
+# test_tag_index.py
+import numpy as np
+
+from tag_index import TagIndex
+
+
+def token_sets(names):
+    return [set(str(name).split()) if isinstance(name, str) else set() for name in names]
+
+
+def test_rows_match_token_membership(events):
+    index = TagIndex.build(events['Name'])
+    tokens = token_sets(events['Name'])
+    assert index.num_rows == len(events)
+    for token in index.tokens:
+        expected = [row for row, row_tokens in enumerate(tokens) if token in row_tokens]
+        assert index.rows(token).tolist() == expected
+    assert index.rows('NOT_A_TAG').size == 0
+
+
+def test_any_all_and_mask_match_pandas(events):
+    index = TagIndex.build(events['Name'])
+    tokens = token_sets(events['Name'])
+    query = ['STAN_CORNER', 'S3', 'POS']
+    any_rows = [row for row, row_tokens in enumerate(tokens) if row_tokens & set(query)]
+    all_rows = [row for row, row_tokens in enumerate(tokens) if set(query[1:]) <= row_tokens]
+    assert index.rows_any(query).tolist() == any_rows
+    assert index.rows_all(query[1:]).tolist() == all_rows
+    assert np.flatnonzero(index.mask(query)).tolist() == any_rows
+    # Tokens are whole words, STAN_FK does not match STAN_FKDIRECT
+    assert not any('STAN_FK' not in row_tokens for row_tokens in (tokens[row] for row in index.rows('STAN_FK')))
+
+
+def test_arrays_round_trip(events):
+    index = TagIndex.build(events['Name'])
+    restored = TagIndex.from_arrays(index.to_arrays())
+    assert restored.token_counts() == index.token_counts()
+    assert restored.num_rows == index.num_rows
+
+
+def test_missing_names():
+    index = TagIndex.build([None, 'AA POS', float('nan')])
+    assert index.rows('AA').tolist() == [1]
+    assert TagIndex.build([None, None]).rows_any(['AA']).size == 0
\ No newline at end of file
@@ -0,0 +1,48 @@
+# test_time_index.py
+import numpy as np
+import pytest
+
+from data_loader import DartfishLoader
+from time_index import TimeIndex
+
+
+def random_intervals(seed, size=500):
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(0, 100000, size)
+    # Some zero-length clips, some long ones spanning many tree nodes
+    durations = np.where(rng.random(size) < 0.1, 0, rng.integers(1, 20000, size))
+    return starts, starts + durations
+
+
+def brute_overlapping(starts, ends, start, end):
+    return np.flatnonzero(((starts >= start) & (starts < end)) | ((starts < start) & (ends > start)))
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_stab_and_count_match_masks(seed):
+    starts, ends = random_intervals(seed)
+    index = TimeIndex(starts, ends)
+    for t in np.r_[np.random.default_rng(seed).integers(-10, 125000, 300), starts[:20], ends[:20]]:
+        expected = np.flatnonzero((starts <= t) & (ends > t))
+        assert index.stab(t).tolist() == expected.tolist()
+        assert index.count_active(t) == len(expected)
+
+
+def test_overlapping_and_windows_match_masks():
+    starts, ends = random_intervals(2)
+    index = TimeIndex(starts, ends)
+    edges = np.arange(0, 130000, 7000)
+    window_ids, row_ids = index.window_rows(edges)
+    for window, (start, end) in enumerate(zip(edges[:-1], edges[1:])):
+        expected = brute_overlapping(starts, ends, start, end)
+        assert index.overlapping(start, end).tolist() == expected.tolist()
+        assert row_ids[window_ids == window].tolist() == expected.tolist()
+
+
+def test_match_time_index(sample_paths):
+    match = DartfishLoader({'enabled': False}).load_match_data(*sample_paths)
+    index = TimeIndex.from_match(match)
+    starts = match.match_time_ms()
+    ends = starts + match.events['Duration'].to_numpy()
+    for t in np.linspace(0, ends.max(), 50).astype(np.int64):
+        assert index.stab(t).tolist() == np.flatnonzero((starts <= t) & (ends > t)).tolist()
\ No newline at end of file
@@ -0,0 +1,35 @@
+# test_xlsm_importer.py
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import REPO_DIR
+from data_loader import DartfishLoader
+
+pytest.importorskip('openpyxl')
+from xlsm_importer import XlsmImporter  # noqa: E402
+
+CURRENT_WORKBOOK = os.path.join(REPO_DIR, 'Noortekoondiste statistiline analüüs_VBA.xlsm')
+LEGACY_WORKBOOK = os.path.join(REPO_DIR, '2020.03.10 U16 Eesti - Lõuna-Soome_tarmo_test.xlsm')
+
+
+def test_workbook_matches_csv_export(sample_paths):
+    imported = XlsmImporter({'enabled': False}).import_workbook(CURRENT_WORKBOOK)
+    exported = DartfishLoader({'enabled': False}).load_match(*sample_paths)
+    columns = [col for col in exported.columns if col in imported.columns]
+    pd.testing.assert_frame_equal(imported[columns], exported[columns])
+
+
+def test_legacy_pressing_zone_fills_only_pressing():
+    imported = XlsmImporter({'enabled': False}).import_workbook(LEGACY_WORKBOOK)
+    assert imported['Pressing'].notna().sum() > 0
+    assert set(imported['Pressing'].dropna()) <= {'HIGHPRESS', 'MIDPRESS', 'LOWPRESS'}
+    assert imported['Tsoon1'].isna().all()
+
+
+def test_store_round_trip(tmp_path):
+    pytest.importorskip('pyarrow')
+    importer = XlsmImporter({'enabled': True, 'path': str(tmp_path)})
+    first, second = importer.import_workbook(CURRENT_WORKBOOK), importer.import_workbook(CURRENT_WORKBOOK)
+    pd.testing.assert_frame_equal(first, second)
\ No newline at end of file
@@ -0,0 +1,112 @@
+# time_index.py
+import numpy as np
+
+
+class TimeIndex:
+    """Index over event time intervals for stabbing, range-overlap and window queries."""
+
+    LEAF_SIZE = 16
+
+    def __init__(self, starts, ends):
+        """Initialize from per-row interval starts and ends (same units, e.g. milliseconds)."""
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.ends = np.maximum(np.asarray(ends, dtype=np.int64), self.starts)
+        self.order = np.argsort(self.starts, kind='stable')
+        self.sorted_starts = self.starts[self.order]
+        self.sorted_ends = np.sort(self.ends)
+        self._nodes = self._build_tree()
+
+    @classmethod
+    def from_events(cls, events, start_column='Position', duration_column='Duration'):
+        """Build from an events frame with start and duration columns."""
+        starts = events[start_column].to_numpy(dtype=np.int64)
+        return cls(starts, starts + events[duration_column].to_numpy(dtype=np.int64))
+
+    @classmethod
+    def from_match(cls, match):
+        """Build over match time (period offsets applied) from MatchData."""
+        starts = match.match_time_ms()
+        return cls(starts, starts + match.events['Duration'].to_numpy(dtype=np.int64))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def count_active(self, t):
+        """Count rows active at time t (start <= t < end)."""
+        return int(np.searchsorted(self.sorted_starts, t, side='right') -
+                   np.searchsorted(self.sorted_ends, t, side='right'))
+
+    def stab(self, t):
+        """Get sorted row ids active at time t (start <= t < end)."""
+        found = []
+        node = 0 if self._nodes else None
+        while node is not None:
+            center, by_start, node_starts, by_end, node_ends, left, right = self._nodes[node]
+            if center is None:
+                found.append(by_start[(node_starts <= t) & (self.ends[by_start] > t)])
+                break
+            # Every interval stored at a node contains its center
+            if t < center:
+                found.append(by_start[:np.searchsorted(node_starts, t, side='right')])
+                node = left
+            else:
+                found.append(by_end[np.searchsorted(node_ends, t, side='right'):])
+                node = right
+        return np.sort(np.concatenate(found)) if found else np.empty(0, dtype=np.int64)
+
+    def overlapping(self, start, end):
+        """Get sorted row ids starting in [start, end) or running across start."""
+        lo, hi = np.searchsorted(self.sorted_starts, [start, end], side='left')
+        spanning = self.stab(start)
+        spanning = spanning[self.starts[spanning] < start]
+        return np.sort(np.concatenate([self.order[lo:hi], spanning]))
+
+    def window_rows(self, edges):
+        """Pair windows [edges[i], edges[i + 1]) with the rows overlapping them, as in overlapping().
+
+        Returns (window_ids, row_ids) sorted by window then row, so all windows of a
+        timeline are answered in one pass instead of one scan per window.
+        """
+        edges = np.asarray(edges)
+        num_windows = len(edges) - 1
+        first = np.searchsorted(edges, self.starts, side='right') - 1
+        # Later windows are covered while their start lies before the row's end
+        last = np.searchsorted(edges, self.ends, side='left') - 1
+        lo = np.maximum(first, 0)
+        hi = np.minimum(np.where(first < 0, last, np.maximum(first, last)), num_windows - 1)
+        counts = np.where(first < num_windows, np.maximum(hi - lo + 1, 0), 0)
+
+        row_ids = np.repeat(np.arange(len(self.starts)), counts)
+        steps = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        window_ids = np.repeat(lo, counts) + steps
+        order = np.lexsort((row_ids, window_ids))
+        return window_ids[order], row_ids[order]
+
+    def _build_tree(self):
+        """Build a centered interval tree as a flat node list."""
+        nodes = []
+        if not len(self.starts):
+            return nodes
+        stack = [(np.arange(len(self.starts)), None, None)]
+        while stack:
+            ids, parent, side = stack.pop()
+            position = len(nodes)
+            if parent is not None:
+                nodes[parent][side] = position
+
+            starts, ends = self.starts[ids], self.ends[ids]
+            center = np.median(np.concatenate([starts, ends]))
+            left, right = ends <= center, starts > center
+            if len(ids) <= self.LEAF_SIZE or left.all() or right.all():
+                nodes.append([None, ids, starts, None, None, None, None])
+                continue
+
+            here = ids[~left & ~right]
+            by_start = here[np.argsort(self.starts[here], kind='stable')]
+            by_end = here[np.argsort(self.ends[here], kind='stable')]
+            nodes.append([center, by_start, self.starts[by_start], by_end, self.ends[by_end], None, None])
+            if left.any():
+                stack.append((ids[left], position, 5))
+            if right.any():
+                stack.append((ids[right], position, 6))
+        return [tuple(node) for node in nodes]
\ No newline at end of file
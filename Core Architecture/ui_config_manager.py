@@ -14,6 +14,15 @@ class UIConfigManager:
             self.observers[config_path] = []
         self.observers[config_path].append(callback)
         
+    def bind_interval_rollups(self, rollups, callback, config_path="analysis.intervals.minutes"):
+        """Re-slice precomputed interval rollups whenever the interval slider changes."""
+        def on_interval_change(minutes):
+            # Views are sums of base bins, so no event-level data is touched
+            callback({key: rollup.view(minutes) for key, rollup in rollups.items()})
+            
+        self.register_observer(config_path, on_interval_change)
+        return on_interval_change
+        
     def update_config(self, config_path, value):
         """Update configuration and notify observers."""
         # Update config
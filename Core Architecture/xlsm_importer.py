@@ -0,0 +1,180 @@
+# xlsm_importer.py
+import concurrent.futures
+import logging
+import os
+
+import pandas as pd
+
+from data_loader import DartfishLoader
+from errors import DataValidationError
+
+try:
+    import openpyxl
+except ImportError:  # pragma: no cover - optional dependency
+    openpyxl = None
+
+logger = logging.getLogger(__name__)
+
+# Columns produced by load_dartfish_data, in CSV export order
+OUTPUT_COLUMNS = ['Name', 'Position', 'Duration', 'Poolaeg', 'Põhimoment', 'Tsoon1', 'Tsoon2',
+                  'Tsoon3', 'Opening', 'Pressing', 'Outcome', 'Result', 'Shot2', 'Shot3',
+                  'Standard last/4', 'Field Position']
+
+# Header names used by older workbook templates.
+# The old 'Standard' column tags how play restarted (throw-in, free kick, goal kick short or
+# long), which the current template tags as Opening; set pieces were in 'Standard last/3'.
+LEGACY_COLUMN_ALIASES = {
+    'Standard last/3': 'Standard last/4',
+    'Standard': 'Opening',
+    # Defensive pressing zone, not an attacking progression zone (Tsoon1-3)
+    'Pressing zone': 'Pressing',
+}
+
+# Tag codes used by older workbook templates
+LEGACY_VALUE_ALIASES = {
+    'Result': {
+        'KEEPOS': 'KEEPPOS',
+        'WINSTAN': 'WINSTANDARD',
+        'WINSTANTI': 'WINSTANDARD',
+        'ATON': 'SHOTON',
+        'ATOF': 'SHOTOFF',
+        'ATBK': 'SHOTBLOCK',
+        'ATONGOAL': 'SHOTGOAL',
+    },
+    'Standard last/4': {
+        'STANCO': 'STAN_CORNER',
+        'STANFK': 'STAN_FK',
+        'STANFK DIRECT': 'STAN_FKDIRECT',
+        'STANTI': 'STAN_THROWIN',
+    },
+    'Opening': {
+        'STANTI': 'THROWIN_OPEN',
+        'STANFK': 'FK_OPEN',
+        'STANGS': 'GK_OPENSHORT',
+        'STANGK': 'GK_OPENLONG',
+    },
+    # Old pressing zones are pitch thirds, S3 the attacking one; pressing the build-up is a high press
+    'Pressing': {
+        'S3': 'HIGHPRESS',
+        'S2': 'MIDPRESS',
+        'S1': 'LOWPRESS',
+        'BUILDUP': 'HIGHPRESS',
+    },
+}
+
+TAGGING_SHEET_COLUMNS = {'Poolaeg', 'Name', 'Position', 'Põhimoment'}
+
+
+class XlsmImporter:
+    """Streams tagging sheets of legacy macro workbooks into the Dartfish schema."""
+
+    def __init__(self, store_settings=None, schema=None, max_blank_rows=50):
+        """Initialize with optional match store settings and event schema."""
+        if openpyxl is None:
+            raise ImportError("openpyxl is required to import .xlsm workbooks")
+        self.store_settings = store_settings
+        self.loader = DartfishLoader(store_settings, schema)
+        self.max_blank_rows = max_blank_rows
+
+    def import_workbook(self, workbook_path):
+        """Import the tagging sheet of a workbook, using the match store when possible."""
+        store = self.loader.store
+        key = store.content_key(workbook_path) if store.enabled else None
+        if key and store.has(key):
+            return self.loader.validate_data(store.read(key))
+
+        # Stored before the event schema is applied, like DartfishLoader matches
+        data = self.loader.check_columns(self._read_tagging_sheet(workbook_path))
+        if key:
+            store.write(key, data)
+        return self.loader.schema.apply(data)
+
+    def import_folder(self, folder_path, max_workers=None):
+        """Convert every workbook in a folder into the match store in parallel."""
+        workbook_paths = sorted(
+            os.path.join(folder_path, name) for name in os.listdir(folder_path)
+            if name.lower().endswith('.xlsm') and not name.startswith('~$')
+        )
+
+        results = {}
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_import_to_store, path, self.store_settings, self.max_blank_rows): path
+                for path in workbook_paths
+            }
+            for future in concurrent.futures.as_completed(futures):
+                path = futures[future]
+                try:
+                    results[path] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to import {path}: {e}")
+                    results[path] = None
+        return results
+
+    def iter_rows(self, workbook_path):
+        """Yield tagging rows as dicts without loading the whole workbook."""
+        workbook = openpyxl.load_workbook(workbook_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            sheet, header = self._find_tagging_sheet(workbook)
+            columns = [
+                (i, LEGACY_COLUMN_ALIASES.get(name, name)) for i, name in enumerate(header)
+                if LEGACY_COLUMN_ALIASES.get(name, name) in OUTPUT_COLUMNS
+            ]
+
+            blank_rows = 0
+            for values in sheet.iter_rows(min_row=2, values_only=True):
+                if not any(values[i] is not None for i, _ in columns if i < len(values)):
+                    # Macro sheets keep formatted but empty rows far past the tagged data
+                    blank_rows += 1
+                    if blank_rows >= self.max_blank_rows:
+                        break
+                    continue
+
+                blank_rows = 0
+                row = {}
+                for i, column in columns:
+                    value = values[i] if i < len(values) else None
+                    if isinstance(value, str):
+                        value = value.strip() if column != 'Name' else value
+                        value = LEGACY_VALUE_ALIASES.get(column, {}).get(value, value)
+                    row[column] = value
+                yield row
+        finally:
+            workbook.close()
+
+    def _find_tagging_sheet(self, workbook):
+        """Find the sheet whose header row holds the Dartfish tag columns."""
+        for sheet in workbook.worksheets:
+            header = next(sheet.iter_rows(max_row=1, values_only=True), ())
+            header = [str(name).strip() if name is not None else None for name in header]
+            if TAGGING_SHEET_COLUMNS.issubset(header):
+                return sheet, header
+        raise DataValidationError("Workbook has no tagging sheet with Dartfish columns")
+
+    def _read_tagging_sheet(self, workbook_path):
+        """Collect streamed rows column-wise into a frame matching the CSV export."""
+        columns = {name: [] for name in OUTPUT_COLUMNS}
+        for row in self.iter_rows(workbook_path):
+            for name in OUTPUT_COLUMNS:
+                columns[name].append(row.get(name))
+
+        data = pd.DataFrame(columns)
+        times = data[['Position', 'Duration']].apply(pd.to_numeric, errors='coerce')
+        invalid = times.isna().any(axis=1)
+        if invalid.any():
+            # A clip without a time cannot be placed in the match, so it is left out rather than put at 0 ms
+            logger.warning(f"{workbook_path}: skipping {int(invalid.sum())} rows without a numeric Position and Duration")
+            data, times = data[~invalid].reset_index(drop=True), times[~invalid].reset_index(drop=True)
+        for col in ['Position', 'Duration']:
+            data[col] = times[col].astype('int64')
+        # Workbooks store the half as "1." text, CSV exports parse it as a number
+        data['Poolaeg'] = pd.to_numeric(data['Poolaeg'].astype(str).str.rstrip('.'), errors='coerce').astype(float)
+        return data
+
+
+def _import_to_store(workbook_path, store_settings, max_blank_rows):
+    """Worker for bulk imports - returns the store key instead of shipping frames back."""
+    importer = XlsmImporter(store_settings, max_blank_rows=max_blank_rows)
+    importer.import_workbook(workbook_path)
+    store = importer.loader.store
+    return store.content_key(workbook_path) if store.enabled else None
\ No newline at end of file